@@ -0,0 +1,55 @@
+from collections.abc import Iterator
+from pathlib import Path
+import importlib.util
+import os
+
+import pytest
+
+from corpus import write_corpus
+from docreview.core.template_loader import DocumentTemplate, get_registry
+from docreview.utils.openai_stub import StubOpenAIServer
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    # The suite needs the bench extra; without it there is nothing to collect.
+    collect_ignore_glob = ["test_bench_*.py"]
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "src" / "docreview" / "templates"
+
+
+@pytest.fixture(scope="session")
+def template_dir() -> Path:
+    return TEMPLATE_DIR
+
+
+@pytest.fixture(scope="session")
+def templates() -> dict[str, DocumentTemplate]:
+    return get_registry(TEMPLATE_DIR).templates()
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Corpus files keyed by name, e.g. ``paystub-medium-000.pdf``."""
+    return {path.name: path for path in write_corpus(tmp_path_factory.mktemp("corpus"))}
+
+
+@pytest.fixture(scope="session")
+def openai_stub() -> Iterator[StubOpenAIServer]:
+    """Local stand-in for the OpenAI API; no network, no latency."""
+    saved = {key: os.environ.get(key) for key in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+    with StubOpenAIServer() as stub:
+        os.environ["OPENAI_BASE_URL"] = stub.base_url
+        os.environ["OPENAI_API_KEY"] = "bench-key"
+        try:
+            yield stub
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+@pytest.fixture()
+def no_openai(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("DOCREVIEW_METRICS", raising=False)
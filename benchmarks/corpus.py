@@ -0,0 +1,192 @@
+"""Deterministic synthetic document corpus for benchmarks.
+
+Every document is generated from a string seed, so the same arguments produce
+byte-identical text and PDF files on any machine and Python version. Filler
+vocabulary is chosen to avoid classification keywords and field synonyms, so
+each document classifies as its own type and fills every required field.
+``large`` PDFs run past the extract page limit and exercise the rejection path.
+
+    python benchmarks/corpus.py --output corpus --per-type 4
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import typer
+
+DOC_TYPES = ("paystub", "t4", "bank_statement", "government_id")
+SIZES = {"small": 40, "medium": 800, "large": 16000}
+FORMATS = ("txt", "pdf")
+PDF_LINES_PER_PAGE = 60
+
+_FIRST = ("Jane", "Omar", "Priya", "Lucas", "Mei", "Andre", "Fatima", "Noah", "Elena", "Kofi")
+_LAST = ("Doe", "Haddad", "Sharma", "Tremblay", "Chen", "Okafor", "Rossi", "Nguyen", "Silva", "Bauer")
+_COMPANIES = ("ACME Corp", "Northwind Ltd", "Maple Logistics", "Cedar Health", "Harbor Foods")
+_FILLER = ("ledger", "transfer", "deposit", "fee", "memo", "batch", "summit", "river", "cedar", "harbor")
+
+
+def _person(rng: random.Random) -> str:
+    return f"{rng.choice(_FIRST)} {rng.choice(_LAST)}"
+
+
+def _amount(rng: random.Random, low: float, high: float) -> str:
+    return f"{rng.uniform(low, high):.2f}"
+
+
+def _date(rng: random.Random, year: int = 2026) -> str:
+    return f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def _reference(rng: random.Random) -> str:
+    return f"REF-{rng.randint(100000, 999999)}"
+
+
+def _paystub(rng: random.Random, filler_lines: int) -> list[str]:
+    lines = [
+        "Paystub",
+        f"employee_name: {_person(rng)}",
+        f"employer_name: {rng.choice(_COMPANIES)}",
+        f"Pay Period: {_date(rng)} to {_date(rng)}",
+        f"Gross Pay: {_amount(rng, 2500, 6000)}",
+        f"net_pay: {_amount(rng, 1800, 4500)}",
+    ]
+    for _ in range(filler_lines):
+        lines.append(f"Earnings {rng.choice(_FILLER)} {rng.randint(1, 80)}.00 hours @ {_amount(rng, 18, 60)}")
+    return lines
+
+
+def _t4(rng: random.Random, filler_lines: int) -> list[str]:
+    lines = [
+        "T4 Statement of Remuneration Paid",
+        "Employer Name and Employee Name as reported; Box14 Employment Income",
+        f"employee_name: {_person(rng)}",
+        f"employer_name: {rng.choice(_COMPANIES)}",
+        f"employment_income: {_amount(rng, 30000, 120000)}",
+    ]
+    for _ in range(filler_lines):
+        lines.append(f"Box {rng.randint(16, 99)} {rng.choice(_FILLER)} {_amount(rng, 10, 5000)}")
+    return lines
+
+
+def _bank_statement(rng: random.Random, filler_lines: int) -> list[str]:
+    lines = [
+        "Bank Statement",
+        f"account_holder_name: {_person(rng)}",
+        f"account_number: {rng.randint(10**9, 10**10 - 1)}",
+        f"statement_period: {_date(rng)} to {_date(rng)}",
+        f"Opening Balance: {_amount(rng, 0, 20000)}",
+    ]
+    for _ in range(filler_lines):
+        lines.append(f"{_date(rng)} {rng.choice(_FILLER).upper()} {_reference(rng)} {_amount(rng, 1, 3000)}")
+    return lines
+
+
+def _government_id(rng: random.Random, filler_lines: int) -> list[str]:
+    lines = [
+        "Government ID - Driver Licence",
+        "Full Name, ID Number and Expiry Date as issued",
+        f"full_name: {_person(rng)}",
+        f"id_number: D{rng.randint(1000000, 9999999)}",
+        f"expiry_date: {_date(rng, 2030)}",
+        f"Issued: {_date(rng, 2022)}",
+    ]
+    for _ in range(filler_lines):
+        lines.append(f"Endorsement {rng.choice(_FILLER)} {_reference(rng)}")
+    return lines
+
+
+_GENERATORS: dict[str, Callable[[random.Random, int], list[str]]] = {
+    "paystub": _paystub,
+    "t4": _t4,
+    "bank_statement": _bank_statement,
+    "government_id": _government_id,
+}
+
+
+def generate_text(doc_type: str, size: str = "small", seed: int = 0) -> str:
+    """Text for one synthetic document; ``size`` picks the number of filler lines."""
+    rng = random.Random(f"{doc_type}:{size}:{seed}")
+    return "\n".join(_GENERATORS[doc_type](rng, SIZES[size])) + "\n"
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def text_to_pdf(text: str, lines_per_page: int = PDF_LINES_PER_PAGE) -> bytes:
+    """Minimal uncompressed PDF with a Helvetica text layer, one line per row."""
+    lines = text.splitlines() or [""]
+    pages = [lines[i : i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    page_count = len(pages)
+    font_number = 3 + 2 * page_count
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            "<< /Type /Pages /Kids ["
+            + " ".join(f"{3 + 2 * i} 0 R" for i in range(page_count))
+            + f"] /Count {page_count} >>"
+        ).encode(),
+    ]
+    for index, page_lines in enumerate(pages):
+        content_number = 4 + 2 * index
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {content_number} 0 R "
+            f"/Resources << /Font << /F1 {font_number} 0 R >> >> >>".encode()
+        )
+        shown = " ".join(f"({_pdf_escape(line)}) Tj T*" for line in page_lines)
+        stream = f"BT /F1 9 Tf 11 TL 36 760 Td {shown} ET"
+        data = stream.encode("latin-1", errors="replace")
+        objects.append(b"<< /Length " + str(len(data)).encode() + b" >>\nstream\n" + data + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def write_corpus(
+    directory: Path,
+    *,
+    per_type: int = 1,
+    sizes: tuple[str, ...] = tuple(SIZES),
+    formats: tuple[str, ...] = FORMATS,
+    seed: int = 0,
+) -> list[Path]:
+    """Write ``<doc_type>-<size>-<n>.<ext>`` files and return their paths in order."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for doc_type in DOC_TYPES:
+        for size in sizes:
+            for number in range(per_type):
+                text = generate_text(doc_type, size, seed + number)
+                for extension in formats:
+                    path = directory / f"{doc_type}-{size}-{number:03d}.{extension}"
+                    path.write_bytes(text.encode("utf-8") if extension == "txt" else text_to_pdf(text))
+                    paths.append(path)
+    return paths
+
+
+def main(
+    output: Path = typer.Option(..., help="Directory to write the corpus into."),
+    per_type: int = typer.Option(1, min=1, help="Documents per type and size."),
+    size: list[str] = typer.Option(list(SIZES), help="small, medium or large; repeatable."),
+    format: list[str] = typer.Option(list(FORMATS), help="txt or pdf; repeatable."),
+    seed: int = typer.Option(0),
+) -> None:
+    """Write a deterministic synthetic corpus."""
+    paths = write_corpus(output, per_type=per_type, sizes=tuple(size), formats=tuple(format), seed=seed)
+    typer.echo(f"wrote {len(paths)} documents to {output}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,78 @@
+"""End-to-end benchmarks: single documents, PDFs, LLM fill against the stub, batches."""
+
+from pathlib import Path
+
+import pytest
+
+from corpus import DOC_TYPES, SIZES, generate_text, text_to_pdf, write_corpus
+from docreview.batch import BatchOptions, run_batch
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.openai_stub import StubOpenAIServer
+
+CREATED_AT = "1970-01-01T00:00:00Z"
+
+
+def test_corpus_is_deterministic(tmp_path: Path) -> None:
+    first = [path.read_bytes() for path in write_corpus(tmp_path / "a", sizes=("small",))]
+    second = [path.read_bytes() for path in write_corpus(tmp_path / "b", sizes=("small",))]
+    assert first == second
+    assert generate_text("t4", seed=1) != generate_text("t4", seed=2)
+    assert text_to_pdf("x").startswith(b"%PDF-1.4")
+
+
+@pytest.mark.parametrize("extension", ["txt", "pdf"])
+@pytest.mark.parametrize("size", list(SIZES))
+@pytest.mark.parametrize("doc_type", DOC_TYPES)
+def test_run_pipeline_regex(
+    benchmark, corpus, template_dir, no_openai, doc_type: str, size: str, extension: str
+) -> None:
+    path = corpus[f"{doc_type}-{size}-000.{extension}"]
+    benchmark.group = f"pipeline-{extension}-{size}"
+    benchmark.extra_info["bytes"] = path.stat().st_size
+    package = benchmark(run_pipeline, path, template_dir, CREATED_AT, fill_mode="regex")
+    assert package.render.ok
+
+
+@pytest.mark.parametrize("size", ["small", "medium"])
+def test_run_pipeline_llm_stub(benchmark, corpus, template_dir, openai_stub, size: str) -> None:
+    path = corpus[f"paystub-{size}-000.txt"]
+    benchmark.group = "pipeline-llm-stub"
+    benchmark.extra_info["bytes"] = path.stat().st_size
+    package = benchmark(run_pipeline, path, template_dir, CREATED_AT, fill_mode="llm")
+    assert any(proposals[-1].source == "openai_field_fill" for proposals in package.normalize.fields.values())
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_run_batch_throughput(benchmark, corpus, template_dir, no_openai, tmp_path: Path, workers: int) -> None:
+    inputs = [path for name, path in sorted(corpus.items()) if "-large-" not in name]
+    options = BatchOptions(template_dir=str(template_dir), created_at=CREATED_AT, fill_mode="regex")
+    benchmark.group = "batch"
+    benchmark.extra_info["documents"] = len(inputs)
+    summary = benchmark.pedantic(
+        run_batch,
+        args=(inputs, tmp_path, options),
+        kwargs={"workers": workers, "chunksize": 4},
+        rounds=3,
+        iterations=1,
+    )
+    assert summary.failed == 0
+
+
+@pytest.mark.parametrize("fill_batch", [1, 8])
+def test_run_batch_llm_packed(
+    benchmark, corpus, template_dir, monkeypatch, tmp_path: Path, fill_batch: int
+) -> None:
+    """Field fill round trips against a stub with 50 ms latency, unpacked vs packed."""
+    inputs = [path for name, path in sorted(corpus.items()) if "-large-" not in name and name.endswith(".txt")]
+    options = BatchOptions(
+        template_dir=str(template_dir), created_at=CREATED_AT, fill_mode="llm", fill_batch=fill_batch
+    )
+    benchmark.group = "batch-llm-latency"
+    benchmark.extra_info["documents"] = len(inputs)
+    with StubOpenAIServer(latency=0.05) as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "bench-key")
+        monkeypatch.delenv("DOCREVIEW_METRICS", raising=False)
+        summary = benchmark.pedantic(run_batch, args=(inputs, tmp_path, options), kwargs={"workers": 1}, rounds=3)
+        benchmark.extra_info["requests_per_round"] = len(stub.requests) // 3
+    assert summary.failed == 0
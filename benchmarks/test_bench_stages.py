@@ -0,0 +1,88 @@
+"""Per-stage benchmarks over the synthetic corpus.
+
+``benchmark.extra_info["bytes"]`` records the input size so saved runs can be
+turned into MB/s when comparing commits.
+"""
+
+import pytest
+
+from corpus import DOC_TYPES, SIZES, generate_text
+from docreview.core.patch import FieldUpdate, PatchPayload, apply_patch
+from docreview.core.template_loader import get_template
+from docreview.stages.classify import classify
+from docreview.stages.normalize import normalize_regex
+from docreview.stages.pipeline import run_pipeline
+from docreview.stages.render import render
+from docreview.stages.validate import validate
+from docreview.utils.serialization import JSON_STYLES, encode_model_json
+
+CREATED_AT = "1970-01-01T00:00:00Z"
+CASES = [(doc_type, size) for doc_type in DOC_TYPES for size in SIZES]
+IDS = [f"{doc_type}-{size}" for doc_type, size in CASES]
+
+
+@pytest.mark.parametrize(("doc_type", "size"), CASES, ids=IDS)
+def test_classify(benchmark, templates, doc_type: str, size: str) -> None:
+    text = generate_text(doc_type, size)
+    benchmark.group = f"classify-{size}"
+    benchmark.extra_info["bytes"] = len(text.encode("utf-8"))
+    section, _ = benchmark(classify, text, CREATED_AT, templates)
+    assert section.document_type == doc_type
+
+
+@pytest.mark.parametrize(("doc_type", "size"), CASES, ids=IDS)
+def test_normalize_regex(benchmark, templates, doc_type: str, size: str) -> None:
+    text = generate_text(doc_type, size)
+    template = get_template(templates, doc_type)
+    benchmark.group = f"normalize_regex-{size}"
+    benchmark.extra_info["bytes"] = len(text.encode("utf-8"))
+    section = benchmark(normalize_regex, text, template=template, created_at=CREATED_AT)
+    assert all(section.fields.get(field.name) for field in template.fields if field.required)
+
+
+@pytest.mark.parametrize("lines", [32_000, 64_000])
+def test_normalize_regex_many_matching_lines(benchmark, templates, lines: int) -> None:
+    # Every line matches a field name, but other fields stay unfilled, so the whole text is scanned.
+    text = "Paystub\n" + "employee_name: Jane Doe\r\n" * lines
+    template = get_template(templates, "paystub")
+    benchmark.group = "normalize_regex-matching-lines"
+    benchmark.extra_info["bytes"] = len(text.encode("utf-8"))
+    section = benchmark(normalize_regex, text, template=template, created_at=CREATED_AT)
+    assert [proposal.value for proposal in section.fields["employee_name"]] == ["Jane Doe"]
+
+
+@pytest.mark.parametrize("doc_type", DOC_TYPES)
+def test_validate(benchmark, templates, doc_type: str) -> None:
+    template = get_template(templates, doc_type)
+    normalize_section = normalize_regex(generate_text(doc_type), template=template, created_at=CREATED_AT)
+    benchmark.group = "validate"
+    section, _ = benchmark(validate, normalize_section=normalize_section, template=template, created_at=CREATED_AT)
+    assert section.ok
+
+
+@pytest.mark.parametrize("style", JSON_STYLES)
+@pytest.mark.parametrize("size", list(SIZES))
+def test_serialize(benchmark, corpus, template_dir, no_openai, style: str, size: str) -> None:
+    package = run_pipeline(corpus[f"paystub-{size}-000.txt"], template_dir, CREATED_AT, fill_mode="regex")
+    benchmark.group = f"serialize-{size}"
+    data = benchmark(encode_model_json, package, style)
+    benchmark.extra_info["bytes"] = len(data)
+
+
+@pytest.mark.parametrize("size", list(SIZES))
+def test_render(benchmark, corpus, template_dir, no_openai, size: str) -> None:
+    package = run_pipeline(corpus[f"bank_statement-{size}-000.txt"], template_dir, CREATED_AT, fill_mode="regex")
+    benchmark.group = "render"
+    section = benchmark(render, package)
+    assert section.ok
+
+
+@pytest.mark.parametrize("size", list(SIZES))
+def test_apply_patch(benchmark, corpus, template_dir, no_openai, size: str) -> None:
+    package = run_pipeline(corpus[f"paystub-{size}-000.txt"], template_dir, CREATED_AT, fill_mode="regex")
+    patch = PatchPayload(
+        field_updates=[FieldUpdate(field_name="net_pay", value=index, confidence=0.9) for index in range(50)]
+    )
+    benchmark.group = "apply_patch"
+    patched = benchmark(apply_patch, package, patch, CREATED_AT)
+    assert len(patched.normalize.fields["net_pay"]) >= 50
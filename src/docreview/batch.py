@@ -0,0 +1,260 @@
+"""Batch execution of the single-document pipeline across a worker pool."""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from docreview.core.template_loader import get_registry
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.artifact_cache import DEFAULT_CACHE_MAX_BYTES, ArtifactCache
+from docreview.utils.blob_store import BlobStore
+from docreview.utils.dedup import DedupStore
+from docreview.utils.jsonl_sink import JsonlSink
+from docreview.utils.openai_field_fill import DEFAULT_PACK_CHARS, FieldFillBatcher
+from docreview.utils.serialization import dump_model_json, dump_model_json_line, versioned_output_path
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_BLOCKED = 3
+
+_WORKER_CACHE: ArtifactCache | None = None
+_WORKER_DEDUP: DedupStore | None = None
+_WORKER_FIELD_FILL: FieldFillBatcher | None = None
+
+
+class BatchOptions(BaseModel):
+    template_dir: str
+    created_at: str
+    fill_mode: str | None = None
+    ocr_model: str | None = None
+    ocr_mode: str | None = None
+    field_model: str | None = None
+    cache_dir: str | None = None
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    output_format: str = "json"
+    json_style: str = "canonical"
+    metrics: str | None = None
+    dedup_db: str | None = None
+    fill_batch: int = Field(default=1, ge=1)
+    fill_batch_chars: int = Field(default=DEFAULT_PACK_CHARS, ge=1)
+    blob_dir: str | None = None
+    external_text: bool = False
+
+
+class BatchItemResult(BaseModel):
+    input_path: str
+    output_path: str | None = None
+    output_offset: int | None = None
+    exit_code: int
+    document_id: str | None = None
+    document_type: str | None = None
+    blocking_handoffs: int = 0
+    elapsed_seconds: float = Field(ge=0.0)
+    error: str | None = None
+
+
+class BatchSummary(BaseModel):
+    total: int
+    succeeded: int
+    blocked: int
+    failed: int
+    workers: int
+    elapsed_seconds: float
+    documents_per_second: float
+    items: list[BatchItemResult] = Field(default_factory=list)
+
+    @property
+    def exit_code(self) -> int:
+        if self.failed:
+            return EXIT_FAILED
+        if self.blocked:
+            return EXIT_BLOCKED
+        return EXIT_OK
+
+
+def collect_inputs(source: str) -> list[Path]:
+    """Resolve a directory, glob pattern or JSONL manifest into input paths."""
+    path = Path(source)
+    if path.is_dir():
+        return sorted(
+            (p for p in path.iterdir() if p.is_file() and not p.name.startswith(".")),
+            key=lambda p: p.name,
+        )
+    if path.is_file() and path.suffix.lower() == ".jsonl":
+        return list(_read_manifest(path))
+    if path.is_file():
+        return [path]
+    return [Path(match) for match in sorted(glob.glob(source, recursive=True)) if Path(match).is_file()]
+
+
+def _read_manifest(manifest: Path) -> Iterator[Path]:
+    for line in manifest.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        raw = entry if isinstance(entry, str) else entry["input"]
+        candidate = Path(raw)
+        yield candidate if candidate.is_absolute() else manifest.parent / candidate
+
+
+def _init_worker(options: BatchOptions) -> None:
+    global _WORKER_CACHE, _WORKER_DEDUP, _WORKER_FIELD_FILL
+    # Warm the process-wide template registry once per worker.
+    get_registry(Path(options.template_dir)).templates()
+    _WORKER_CACHE = (
+        ArtifactCache(Path(options.cache_dir), max_bytes=options.cache_max_bytes)
+        if options.cache_dir is not None
+        else None
+    )
+    _WORKER_DEDUP = DedupStore(Path(options.dedup_db)) if options.dedup_db is not None else None
+    _WORKER_FIELD_FILL = (
+        FieldFillBatcher(max_documents=options.fill_batch, max_chars=options.fill_batch_chars)
+        if options.fill_batch > 1 and _fills_with_llm(options)
+        else None
+    )
+
+
+def _fills_with_llm(options: BatchOptions) -> bool:
+    fill_mode = (options.fill_mode or os.environ.get("DOCREVIEW_FILL_MODE", "auto")).lower()
+    return fill_mode != "regex" and bool(os.environ.get("OPENAI_API_KEY"))
+
+
+def _process_one(input_path: Path, options: BatchOptions) -> tuple[BatchItemResult, str | None]:
+    started = time.perf_counter()
+    try:
+        package = run_pipeline(
+            input_path=input_path,
+            template_dir=Path(options.template_dir),
+            created_at=options.created_at,
+            fill_mode=options.fill_mode,
+            ocr_model=options.ocr_model,
+            ocr_mode=options.ocr_mode,
+            field_model=options.field_model,
+            cache=_WORKER_CACHE,
+            dedup=_WORKER_DEDUP,
+            field_fill=_WORKER_FIELD_FILL,
+            blobs=BlobStore(Path(options.blob_dir)) if options.blob_dir is not None else None,
+            external_text=options.external_text,
+            metrics=options.metrics,
+        )
+    except Exception as exc:
+        return (
+            BatchItemResult(
+                input_path=str(input_path),
+                exit_code=EXIT_FAILED,
+                elapsed_seconds=time.perf_counter() - started,
+                error=f"{type(exc).__name__}: {exc}",
+            ),
+            None,
+        )
+    blocking = sum(1 for h in package.handoffs if h.blocking and not h.resolved)
+    result = BatchItemResult(
+        input_path=str(input_path),
+        exit_code=EXIT_BLOCKED if blocking else EXIT_OK,
+        document_id=package.metadata.document_id,
+        document_type=package.classify.document_type,
+        blocking_handoffs=blocking,
+        elapsed_seconds=time.perf_counter() - started,
+    )
+    if options.output_format == "jsonl":
+        return result, dump_model_json_line(package)
+    return result, dump_model_json(package, options.json_style)
+
+
+def _process_star(args: tuple[Path, BatchOptions]) -> tuple[BatchItemResult, str | None]:
+    return _process_one(*args)
+
+
+def _process_announced(args: tuple[Path, BatchOptions]) -> tuple[BatchItemResult, str | None]:
+    try:
+        return _process_one(*args)
+    finally:
+        if _WORKER_FIELD_FILL is not None:
+            _WORKER_FIELD_FILL.done()
+
+
+def run_batch(
+    inputs: list[Path],
+    output_dir: Path,
+    options: BatchOptions,
+    *,
+    workers: int | None = None,
+    chunksize: int = 8,
+    sink: JsonlSink | None = None,
+) -> BatchSummary:
+    """Run the pipeline for every input, writing one artifact per document.
+
+    Artifacts are written by the parent process so versioned output names never
+    race between workers. ``workers=1`` runs in-process without a pool. With a
+    ``sink`` (and ``options.output_format == "jsonl"``) artifacts are appended
+    to it instead of being written as individual files.
+
+    When LLM field fill runs (an API key is set and the fill mode is not
+    ``regex``), ``options.fill_batch > 1`` runs ``workers * fill_batch``
+    documents on threads in this process instead, so field fill for documents
+    of the same type can be packed into shared requests.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if sink is not None and options.output_format != "jsonl":
+        options = options.model_copy(update={"output_format": "jsonl"})
+    worker_count = max(1, workers or os.cpu_count() or 1)
+    started = time.perf_counter()
+    jobs = [(path, options) for path in inputs]
+
+    if options.fill_batch > 1 and _fills_with_llm(options):
+        _init_worker(options)
+        thread_count = worker_count * options.fill_batch
+        if _WORKER_FIELD_FILL is not None:
+            _WORKER_FIELD_FILL.expect(len(jobs), concurrency=thread_count)
+        with ThreadPoolExecutor(max_workers=thread_count) as threads:
+            items = _write_outcomes(threads.map(_process_announced, jobs), output_dir, sink)
+    elif worker_count == 1:
+        _init_worker(options)
+        outcomes: Iterator[tuple[BatchItemResult, str | None]] = map(_process_star, jobs)
+        items = _write_outcomes(outcomes, output_dir, sink)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_init_worker,
+            initargs=(options,),
+        ) as pool:
+            items = _write_outcomes(pool.map(_process_star, jobs, chunksize=chunksize), output_dir, sink)
+
+    elapsed = time.perf_counter() - started
+    return BatchSummary(
+        total=len(items),
+        succeeded=sum(1 for item in items if item.exit_code == EXIT_OK),
+        blocked=sum(1 for item in items if item.exit_code == EXIT_BLOCKED),
+        failed=sum(1 for item in items if item.exit_code == EXIT_FAILED),
+        workers=worker_count,
+        elapsed_seconds=elapsed,
+        documents_per_second=len(items) / elapsed if elapsed > 0 else 0.0,
+        items=items,
+    )
+
+
+def _write_outcomes(
+    outcomes: Iterator[tuple[BatchItemResult, str | None]],
+    output_dir: Path,
+    sink: JsonlSink | None = None,
+) -> list[BatchItemResult]:
+    items: list[BatchItemResult] = []
+    for result, artifact in outcomes:
+        if artifact is not None and sink is not None:
+            entry = sink.write(artifact, document_id=result.document_id, input_path=result.input_path)
+            result.output_path = str(sink.directory / entry.file)
+            result.output_offset = entry.offset
+        elif artifact is not None:
+            output_path = versioned_output_path(output_dir, Path(result.input_path).stem)
+            output_path.write_text(artifact, encoding="utf-8")
+            result.output_path = str(output_path)
+        items.append(result)
+    return items
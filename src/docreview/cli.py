@@ -4,50 +4,162 @@ import json
 import os
 import platform
 import shutil
-from datetime import UTC, datetime
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
 from pathlib import Path
 
 import typer
+from pydantic import ValidationError
 
-from docreview.core.patch import PatchPayload, apply_patch
+from docreview.batch import BatchOptions, collect_inputs, run_batch
+from docreview.core.patch import ArtifactPatch, PatchPayload, apply_patch, apply_patches
 from docreview.core.schemas import DocumentReviewPackage
-from docreview.stages.pipeline import run_pipeline
-from docreview.utils.serialization import dump_model_json
+from docreview.server import DEFAULT_PORT, ReviewServer
+from docreview.stages.extract import OCR_MODES
+from docreview.stages.pipeline import RERUN_STAGES, rerun_pipeline, run_pipeline
+from docreview.utils.artifact_cache import DEFAULT_CACHE_DIRNAME, ArtifactCache
+from docreview.utils.artifact_index import ArtifactIndex
+from docreview.utils.artifact_reader import ArtifactError, LazyArtifact, validate_artifact
+from docreview.utils.blob_store import DEFAULT_BLOB_DIRNAME, BlobStore, copy_blob_refs, externalize_text
+from docreview.utils.dedup import DEFAULT_DEDUP_DBNAME, DedupStore
+from docreview.utils.jsonl_sink import COMPRESSIONS, JsonlSink
+from docreview.utils.metrics import METRICS_MODES, export_otel_spans, prometheus_text
+from docreview.utils.openai_stub import StubOpenAIServer
+from docreview.utils.patch_log import DEFAULT_SNAPSHOT_EVERY, PatchLog, read_artifact
+from docreview.utils.pdf_extract import PdfiumBackend, get_pdf_backend
+from docreview.utils.profiling import DEFAULT_SAMPLE_INTERVAL, DEFAULT_TOP, StageProfiler
+from docreview.utils.serialization import JSON_STYLES, dump_model_json, encode_model_json, versioned_output_path
 
 app = typer.Typer(no_args_is_help=True)
 
 
-def _versioned_output_path(output_dir: Path, stem: str) -> Path:
-    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
-    candidate = output_dir / f"{stem}_{timestamp}.json"
-    counter = 1
-    while candidate.exists():
-        candidate = output_dir / f"{stem}_{timestamp}_v{counter}.json"
-        counter += 1
-    return candidate
+def _resolve_template_dir(templates: Path | None) -> Path:
+    template_dir = templates if templates is not None else Path(__file__).resolve().parent / "templates"
+    if not template_dir.exists() or not template_dir.is_dir():
+        typer.echo(f"Template directory not found: {template_dir}")
+        raise typer.Exit(code=2)
+    return template_dir
+
+
+def _resolve_fill_mode(fill_mode: str) -> str:
+    normalized_fill_mode = fill_mode.lower()
+    if normalized_fill_mode not in {"auto", "llm", "regex"}:
+        typer.echo("fill_mode must be one of: auto, llm, regex")
+        raise typer.Exit(code=2)
+    return normalized_fill_mode
+
+
+def _resolve_ocr_mode(ocr_mode: str) -> str:
+    normalized_ocr_mode = ocr_mode.lower()
+    if normalized_ocr_mode not in OCR_MODES:
+        typer.echo(f"ocr_mode must be one of: {', '.join(OCR_MODES)}")
+        raise typer.Exit(code=2)
+    return normalized_ocr_mode
+
+
+def _resolve_json_style(json_style: str) -> str:
+    normalized_json_style = json_style.lower()
+    if normalized_json_style not in JSON_STYLES:
+        typer.echo(f"json_style must be one of: {', '.join(JSON_STYLES)}")
+        raise typer.Exit(code=2)
+    return normalized_json_style
+
+
+def _resolve_dedup_db(output: Path | None, dedup: bool, dedup_db: Path | None) -> Path | None:
+    if not dedup:
+        return None
+    if dedup_db is not None:
+        return dedup_db
+    env_db = os.environ.get("DOCREVIEW_DEDUP_DB")
+    if env_db:
+        return Path(env_db)
+    if output is None:
+        typer.echo("--dedup needs --dedup-db or DOCREVIEW_DEDUP_DB")
+        raise typer.Exit(code=2)
+    return output / DEFAULT_DEDUP_DBNAME
+
+
+def _resolve_blob_dir(output: Path | None, blob_dir: Path | None) -> Path | None:
+    if blob_dir is not None:
+        return blob_dir
+    env_dir = os.environ.get("DOCREVIEW_BLOB_DIR")
+    if env_dir:
+        return Path(env_dir)
+    return output / DEFAULT_BLOB_DIRNAME if output is not None else None
+
+
+def _resolve_metrics(metrics: str | None) -> str | None:
+    if metrics is None:
+        return None
+    normalized_metrics = metrics.lower()
+    if normalized_metrics not in METRICS_MODES:
+        typer.echo(f"metrics must be one of: {', '.join(METRICS_MODES)}")
+        raise typer.Exit(code=2)
+    return normalized_metrics
+
+
+def _resolve_cache_dir(output: Path, cache_dir: Path | None, cache: bool | None) -> Path | None:
+    # Opt-in: --cache, --cache-dir or DOCREVIEW_CACHE_DIR turn the stage cache on; --no-cache always wins.
+    if cache is False:
+        return None
+    if cache_dir is not None:
+        return cache_dir
+    env_dir = os.environ.get("DOCREVIEW_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    return output / DEFAULT_CACHE_DIRNAME if cache else None
 
 
 @app.command()
 def run(
-    input: Path = typer.Option(...),
+    input: Path | None = typer.Option(None),
     output: Path = typer.Option(...),
     templates: Path | None = typer.Option(None),
     fill_mode: str = typer.Option("auto"),
     ocr_model: str = typer.Option("gpt-4o"),
     field_model: str | None = typer.Option(None),
+    ocr_mode: str = typer.Option("auto", help="auto, document or page (per-page concurrent OCR)."),
+    cache_dir: Path | None = typer.Option(None, help="Stage cache folder; turns the cache on."),
+    cache: bool | None = typer.Option(None, "--cache/--no-cache", help="Stage cache in <output>/.docreview-cache."),
+    cache_max_mb: int = typer.Option(512, min=1),
+    json_style: str = typer.Option("canonical", help="canonical, pretty or compact (fast, schema key order)."),
+    from_artifact: Path | None = typer.Option(None, help="Existing artifact to rerun instead of an input document."),
+    from_stage: str | None = typer.Option(
+        None, help="With --from-artifact: classify (default), normalize, validate or render."
+    ),
+    metrics: str | None = typer.Option(None, help="off, timing or memory; defaults to DOCREVIEW_METRICS or off."),
+    dedup: bool = typer.Option(False, "--dedup", help="Reuse upstream outputs of near-duplicate documents."),
+    dedup_db: Path | None = typer.Option(None, help="Fingerprint store; default DOCREVIEW_DEDUP_DB or in the output."),
+    blob_dir: Path | None = typer.Option(None, help="Blob store for large text; default DOCREVIEW_BLOB_DIR or output."),
+    external_text: bool = typer.Option(False, "--external-text", help="Keep extracted text and OCR images as blobs."),
 ) -> None:
     """Run full pipeline and write one JSON artifact."""
-    if not input.exists():
-        raise typer.Exit(code=2)
-    output.mkdir(parents=True, exist_ok=True)
-    template_dir = templates if templates is not None else Path(__file__).resolve().parent / "templates"
-    if not template_dir.exists() or not template_dir.is_dir():
-        typer.echo(f"Template directory not found: {template_dir}")
+    if from_artifact is not None:
+        _rerun_from_artifact(
+            from_artifact,
+            output,
+            templates,
+            fill_mode,
+            field_model,
+            json_style,
+            from_stage or "classify",
+            _resolve_blob_dir(from_artifact.parent, blob_dir),
+        )
+        return
+    if from_stage is not None:
+        typer.echo("--from-stage needs --from-artifact")
         raise typer.Exit(code=2)
-    normalized_fill_mode = fill_mode.lower()
-    if normalized_fill_mode not in {"auto", "llm", "regex"}:
-        typer.echo("fill_mode must be one of: auto, llm, regex")
+    if input is None or not input.exists():
         raise typer.Exit(code=2)
+    output.mkdir(parents=True, exist_ok=True)
+    template_dir = _resolve_template_dir(templates)
+    normalized_fill_mode = _resolve_fill_mode(fill_mode)
+    normalized_json_style = _resolve_json_style(json_style)
+    resolved_metrics = _resolve_metrics(metrics)
+    resolved_cache_dir = _resolve_cache_dir(output, cache_dir, cache)
+    resolved_dedup_db = _resolve_dedup_db(output, dedup, dedup_db)
+    resolved_blob_dir = _resolve_blob_dir(output, blob_dir)
     created_at = "1970-01-01T00:00:00Z"
     package = run_pipeline(
         input_path=input,
@@ -56,47 +168,438 @@ def run(
         fill_mode=normalized_fill_mode,
         ocr_model=ocr_model,
         field_model=field_model,
+        ocr_mode=_resolve_ocr_mode(ocr_mode),
+        cache=(
+            ArtifactCache(resolved_cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+            if resolved_cache_dir is not None
+            else None
+        ),
+        metrics=resolved_metrics,
+        dedup=DedupStore(resolved_dedup_db) if resolved_dedup_db is not None else None,
+        blobs=BlobStore(resolved_blob_dir) if resolved_blob_dir is not None else None,
+        external_text=external_text,
     )
-    output_path = _versioned_output_path(output, input.stem)
-    output_path.write_text(dump_model_json(package), encoding="utf-8")
+    output_path = versioned_output_path(output, input.stem)
+    output_path.write_text(dump_model_json(package, normalized_json_style), encoding="utf-8")
     typer.echo(str(output_path))
     if any(h.blocking and not h.resolved for h in package.handoffs):
         raise typer.Exit(code=3)
 
 
+def _rerun_from_artifact(
+    artifact_path: Path,
+    output: Path,
+    templates: Path | None,
+    fill_mode: str,
+    field_model: str | None,
+    json_style: str,
+    from_stage: str,
+    blob_dir: Path | None,
+) -> None:
+    if not artifact_path.exists():
+        raise typer.Exit(code=2)
+    stage = from_stage.lower()
+    if stage not in {s.value for s in RERUN_STAGES}:
+        typer.echo(f"from_stage must be one of: {', '.join(s.value for s in RERUN_STAGES)}")
+        raise typer.Exit(code=2)
+    output.mkdir(parents=True, exist_ok=True)
+    try:
+        package = rerun_pipeline(
+            _load_patched(PatchLog(artifact_path)),
+            stage,
+            _resolve_template_dir(templates),
+            "1970-01-01T00:00:00Z",
+            fill_mode=_resolve_fill_mode(fill_mode),
+            field_model=field_model,
+            blobs=BlobStore(blob_dir) if blob_dir is not None else None,
+        )
+    except ValueError as exc:
+        typer.echo(f"Cannot rerun {artifact_path}: {exc} (--blob-dir)")
+        raise typer.Exit(code=2) from exc
+    output_path = versioned_output_path(output, Path(package.metadata.file_name).stem)
+    output_path.write_text(dump_model_json(package, _resolve_json_style(json_style)), encoding="utf-8")
+    typer.echo(str(output_path))
+    if any(h.blocking and not h.resolved for h in package.handoffs):
+        raise typer.Exit(code=3)
+
+
+@app.command("run-batch")
+def run_batch_cmd(
+    input: str = typer.Option(..., help="Directory, glob pattern or JSONL manifest."),
+    output: Path = typer.Option(...),
+    templates: Path | None = typer.Option(None),
+    fill_mode: str = typer.Option("auto"),
+    ocr_model: str = typer.Option("gpt-4o"),
+    field_model: str | None = typer.Option(None),
+    ocr_mode: str = typer.Option("auto", help="auto, document or page (per-page concurrent OCR)."),
+    workers: int | None = typer.Option(None, min=1),
+    chunksize: int = typer.Option(8, min=1),
+    cache_dir: Path | None = typer.Option(None, help="Stage cache folder; turns the cache on."),
+    cache: bool | None = typer.Option(None, "--cache/--no-cache", help="Stage cache in <output>/.docreview-cache."),
+    cache_max_mb: int = typer.Option(512, min=1),
+    sink: str = typer.Option("files", help="files (one JSON per document) or jsonl (rotating shards + index)."),
+    jsonl_compression: str = typer.Option("none", help="none, gzip or zstd (one member per record)."),
+    jsonl_max_mb: int = typer.Option(256, min=1, help="Rotate JSONL shards at this size."),
+    json_style: str = typer.Option("canonical", help="canonical, pretty or compact (fast, schema key order)."),
+    metrics: str | None = typer.Option(None, help="off, timing or memory; defaults to DOCREVIEW_METRICS or off."),
+    dedup: bool = typer.Option(False, "--dedup", help="Reuse upstream outputs of near-duplicate documents."),
+    dedup_db: Path | None = typer.Option(None, help="Fingerprint store; default DOCREVIEW_DEDUP_DB or in the output."),
+    blob_dir: Path | None = typer.Option(None, help="Blob store for large text; default DOCREVIEW_BLOB_DIR or output."),
+    external_text: bool = typer.Option(False, "--external-text", help="Keep extracted text and OCR images as blobs."),
+    fill_batch: int = typer.Option(1, min=1, help="Pack LLM field fill for up to N same-type documents per request."),
+) -> None:
+    """Run the pipeline over many documents and write a batch summary."""
+    inputs = collect_inputs(input)
+    if not inputs:
+        typer.echo(f"No input documents found for: {input}")
+        raise typer.Exit(code=2)
+    normalized_sink = sink.lower()
+    if normalized_sink not in {"files", "jsonl"}:
+        typer.echo("sink must be one of: files, jsonl")
+        raise typer.Exit(code=2)
+    if jsonl_compression.lower() not in COMPRESSIONS:
+        typer.echo(f"jsonl_compression must be one of: {', '.join(COMPRESSIONS)}")
+        raise typer.Exit(code=2)
+    resolved_cache_dir = _resolve_cache_dir(output, cache_dir, cache)
+    resolved_dedup_db = _resolve_dedup_db(output, dedup, dedup_db)
+    resolved_blob_dir = _resolve_blob_dir(output, blob_dir)
+    options = BatchOptions(
+        template_dir=str(_resolve_template_dir(templates)),
+        created_at="1970-01-01T00:00:00Z",
+        fill_mode=_resolve_fill_mode(fill_mode),
+        ocr_model=ocr_model,
+        ocr_mode=_resolve_ocr_mode(ocr_mode),
+        field_model=field_model,
+        cache_dir=str(resolved_cache_dir) if resolved_cache_dir is not None else None,
+        cache_max_bytes=cache_max_mb * 1024 * 1024,
+        output_format="jsonl" if normalized_sink == "jsonl" else "json",
+        json_style=_resolve_json_style(json_style),
+        metrics=_resolve_metrics(metrics),
+        dedup_db=str(resolved_dedup_db) if resolved_dedup_db is not None else None,
+        fill_batch=fill_batch,
+        blob_dir=str(resolved_blob_dir) if resolved_blob_dir is not None else None,
+        external_text=external_text,
+    )
+    if normalized_sink == "jsonl":
+        output.mkdir(parents=True, exist_ok=True)
+        try:
+            jsonl_sink = JsonlSink(
+                output, compression=jsonl_compression.lower(), max_bytes=jsonl_max_mb * 1024 * 1024
+            )
+        except RuntimeError as exc:
+            typer.echo(str(exc))
+            raise typer.Exit(code=2) from exc
+        with jsonl_sink:
+            summary = run_batch(inputs, output, options, workers=workers, chunksize=chunksize, sink=jsonl_sink)
+    else:
+        summary = run_batch(inputs, output, options, workers=workers, chunksize=chunksize)
+    summary_path = versioned_output_path(output, "batch_summary")
+    summary_path.write_text(dump_model_json(summary), encoding="utf-8")
+    typer.echo(
+        f"processed={summary.total} ok={summary.succeeded} blocked={summary.blocked} "
+        f"failed={summary.failed} elapsed={summary.elapsed_seconds:.2f}s "
+        f"rate={summary.documents_per_second:.1f}/s"
+    )
+    typer.echo(str(summary_path))
+    if summary.exit_code:
+        raise typer.Exit(code=summary.exit_code)
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1"),
+    port: int = typer.Option(DEFAULT_PORT),
+    templates: Path | None = typer.Option(None),
+    fill_mode: str = typer.Option("auto"),
+    ocr_model: str = typer.Option("gpt-4o"),
+    field_model: str | None = typer.Option(None),
+    ocr_mode: str = typer.Option("auto", help="auto, document or page (per-page concurrent OCR)."),
+    concurrency: int = typer.Option(4, min=1, help="Documents processed at once."),
+    queue_size: int = typer.Option(32, min=0, help="Requests allowed to wait; more get HTTP 503."),
+    allow_paths: bool = typer.Option(
+        False, "--allow-paths/--uploads-only", help="Also accept {\"path\": ...} requests naming local files."
+    ),
+    cache_dir: Path | None = typer.Option(None),
+    cache_max_mb: int = typer.Option(512, min=1),
+    json_style: str = typer.Option("canonical", help="canonical, pretty or compact (fast, schema key order)."),
+    metrics: str | None = typer.Option(None, help="off, timing or memory; defaults to DOCREVIEW_METRICS or off."),
+    dedup: bool = typer.Option(False, "--dedup", help="Reuse upstream outputs of near-duplicate documents."),
+    dedup_db: Path | None = typer.Option(None, help="Fingerprint store; default DOCREVIEW_DEDUP_DB or in the output."),
+    blob_dir: Path | None = typer.Option(None, help="Blob store for large text; default DOCREVIEW_BLOB_DIR or output."),
+    external_text: bool = typer.Option(False, "--external-text", help="Keep extracted text and OCR images as blobs."),
+) -> None:
+    """Serve the pipeline over local HTTP with templates and clients kept warm."""
+    env_cache_dir = os.environ.get("DOCREVIEW_CACHE_DIR")
+    resolved_cache_dir = cache_dir or (Path(env_cache_dir) if env_cache_dir else None)
+    resolved_dedup_db = _resolve_dedup_db(None, dedup or dedup_db is not None, dedup_db)
+    resolved_blob_dir = _resolve_blob_dir(None, blob_dir)
+    if external_text and resolved_blob_dir is None:
+        typer.echo("--external-text needs --blob-dir or DOCREVIEW_BLOB_DIR")
+        raise typer.Exit(code=2)
+    options = BatchOptions(
+        template_dir=str(_resolve_template_dir(templates)),
+        created_at="1970-01-01T00:00:00Z",
+        fill_mode=_resolve_fill_mode(fill_mode),
+        ocr_model=ocr_model,
+        ocr_mode=_resolve_ocr_mode(ocr_mode),
+        field_model=field_model,
+        cache_dir=str(resolved_cache_dir) if resolved_cache_dir is not None else None,
+        cache_max_bytes=cache_max_mb * 1024 * 1024,
+        json_style=_resolve_json_style(json_style),
+        metrics=_resolve_metrics(metrics),
+        dedup_db=str(resolved_dedup_db) if resolved_dedup_db is not None else None,
+        blob_dir=str(resolved_blob_dir) if resolved_blob_dir is not None else None,
+        external_text=external_text,
+    )
+    server = ReviewServer(
+        options,
+        host=host,
+        port=port,
+        concurrency=concurrency,
+        queue_size=queue_size,
+        allow_paths=allow_paths,
+    )
+    server.warm()
+    typer.echo(f"listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+def _artifact_paths(input: Path) -> list[Path]:
+    if input.is_dir():
+        return sorted(
+            (p for p in input.glob("*.json") if not p.name.startswith("batch_summary_")),
+            key=lambda p: p.name,
+        )
+    return [input]
+
+
 @app.command("summarize")
 def summarize_cmd(
-    input: Path = typer.Option(...),
+    input: Path = typer.Option(..., help="Artifact JSON or a directory of artifacts."),
     format: str = typer.Option("markdown"),
 ) -> None:
     """Print markdown summary from a pipeline JSON artifact."""
-    package = DocumentReviewPackage.model_validate_json(input.read_text(encoding="utf-8"))
-    if format.lower() == "json":
-        payload = {
-            "document_type": package.classify.document_type,
-            "confidence": package.classify.confidence,
-            "validation_ok": package.validate_section.ok,
-            "missing_required_fields": package.validate_section.missing_required_fields,
-            "open_handoffs": len([h for h in package.handoffs if not h.resolved]),
-            "total_handoffs": len(package.handoffs),
-            "handoffs": [handoff.model_dump(mode="json") for handoff in package.handoffs],
-        }
-        typer.echo(json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=True))
-        return
-    typer.echo(package.render.markdown_summary)
+    as_json = format.lower() == "json"
+    paths = _artifact_paths(input)
+    failed = False
+    for index, path in enumerate(paths):
+        try:
+            artifact = read_artifact(path)
+            if as_json:
+                handoffs = artifact.handoffs
+                payload: dict[str, object] = {
+                    "document_type": artifact.classify.document_type,
+                    "confidence": artifact.classify.confidence,
+                    "validation_ok": artifact.validate_section.ok,
+                    "missing_required_fields": artifact.validate_section.missing_required_fields,
+                    "open_handoffs": len([h for h in handoffs if not h.resolved]),
+                    "total_handoffs": len(handoffs),
+                    "handoffs": [handoff.model_dump(mode="json") for handoff in handoffs],
+                }
+                if input.is_dir():
+                    payload["path"] = str(path)
+                    typer.echo(json.dumps(payload, sort_keys=True, ensure_ascii=True))
+                else:
+                    typer.echo(json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=True))
+            else:
+                if index:
+                    typer.echo("\n---\n")
+                typer.echo(artifact.render.markdown_summary)
+        except (ArtifactError, ValidationError) as exc:
+            failed = True
+            typer.echo(f"INVALID: {path}: {exc}", err=True)
+    if failed:
+        raise typer.Exit(code=1)
 
 
 @app.command("validate-json")
-def validate_json_cmd(input: Path = typer.Option(...)) -> None:
-    """Validate artifact JSON against DocumentReviewPackage schema."""
-    try:
-        DocumentReviewPackage.model_validate_json(input.read_text(encoding="utf-8"))
-    except Exception as exc:  # pragma: no cover - explicit CLI UX path
-        typer.echo(f"INVALID: {exc}")
+def validate_json_cmd(
+    input: Path = typer.Option(...),
+    blob_dir: Path | None = typer.Option(None, help="Check blob references here; default the store next to input."),
+    verify_blobs: bool = typer.Option(False, "--verify-blobs", help="Re-hash referenced blobs."),
+) -> None:
+    """Validate artifact JSON against DocumentReviewPackage schema, with its patch log applied."""
+    if blob_dir is not None and not blob_dir.is_dir():
+        typer.echo(f"Blob directory not found: {blob_dir}")
+        raise typer.Exit(code=2)
+    blobs = BlobStore(_resolve_blob_dir(input.parent, blob_dir) or input.parent / DEFAULT_BLOB_DIRNAME)
+    errors = validate_artifact(input.read_bytes(), blobs, verify_blobs=verify_blobs)
+    log = PatchLog(input)
+    if not errors and log.exists():
+        try:
+            errors = validate_artifact(encode_model_json(log.materialize()), blobs, verify_blobs=verify_blobs)
+        except ArtifactError as exc:
+            errors = [str(exc)]
+    if errors:
+        typer.echo(f"INVALID: {'; '.join(errors)}")
         raise typer.Exit(code=1)
     typer.echo("VALID")
 
 
+@app.command("metrics")
+def metrics_cmd(
+    input: Path = typer.Option(..., help="Artifact JSON or a directory of artifacts."),
+    format: str = typer.Option("prometheus", help="prometheus (text exposition) or otel (emit spans)."),
+) -> None:
+    """Export the metrics sections of artifacts run with --metrics."""
+    output_format = format.lower()
+    if output_format not in {"prometheus", "otel"}:
+        typer.echo("format must be one of: prometheus, otel")
+        raise typer.Exit(code=2)
+    sections = []
+    for path in _artifact_paths(input):
+        artifact = LazyArtifact.from_path(path)
+        try:
+            section = artifact.metrics
+            if section is not None and output_format == "otel":
+                export_otel_spans(section, document_id=artifact.metadata.document_id)
+        except (ArtifactError, ValidationError) as exc:
+            typer.echo(f"INVALID: {path}: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        except RuntimeError as exc:
+            typer.echo(str(exc))
+            raise typer.Exit(code=2) from exc
+        if section is not None:
+            sections.append(section)
+    if output_format == "prometheus":
+        typer.echo(prometheus_text(sections), nl=False)
+    else:
+        typer.echo(f"exported={len(sections)}")
+
+
+@app.command("profile")
+def profile_cmd(
+    input: Path = typer.Option(...),
+    output: Path = typer.Option(Path("docreview-profile"), help="Folder for the report, pstats and collapsed stacks."),
+    templates: Path | None = typer.Option(None),
+    fill_mode: str = typer.Option("auto"),
+    ocr_model: str = typer.Option("gpt-4o"),
+    field_model: str | None = typer.Option(None),
+    ocr_mode: str = typer.Option("auto", help="auto, document or page (per-page concurrent OCR)."),
+    top: int = typer.Option(DEFAULT_TOP, min=1, help="Functions and allocation sites listed per table."),
+    interval: float = typer.Option(DEFAULT_SAMPLE_INTERVAL, min=0.0001, help="Stack sampling interval in seconds."),
+    memory: bool = typer.Option(True, "--memory/--no-memory", help="Trace allocations with tracemalloc."),
+    stub_openai: bool = typer.Option(False, "--stub-openai", help="Answer OpenAI calls from a local stub (offline)."),
+    stub_latency: float = typer.Option(0.0, min=0.0, help="With --stub-openai: seconds to delay each response."),
+) -> None:
+    """Profile one document and report time and allocations per stage."""
+    if not input.exists():
+        raise typer.Exit(code=2)
+    profiler = StageProfiler(memory=memory, interval=interval, top=top)
+    with _openai_stub(stub_openai, stub_latency):
+        run_pipeline(
+            input_path=input,
+            template_dir=_resolve_template_dir(templates),
+            created_at="1970-01-01T00:00:00Z",
+            fill_mode=_resolve_fill_mode(fill_mode),
+            ocr_model=ocr_model,
+            field_model=field_model,
+            ocr_mode=_resolve_ocr_mode(ocr_mode),
+            profiler=profiler,
+        )
+    paths = profiler.write(output, input.stem)
+    typer.echo(profiler.report(), nl=False)
+    typer.echo("\n".join(str(path) for path in paths))
+
+
+@contextmanager
+def _openai_stub(enabled: bool, latency: float) -> Iterator[None]:
+    if not enabled:
+        yield
+        return
+    saved = {key: os.environ.get(key) for key in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+    with StubOpenAIServer(latency=latency) as stub:
+        os.environ["OPENAI_BASE_URL"] = stub.base_url
+        os.environ["OPENAI_API_KEY"] = "stub-key"
+        try:
+            yield
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+DEFAULT_INDEX_DB = Path("docreview-index.sqlite")
+
+
+@app.command("index")
+def index_cmd(
+    input: list[Path] = typer.Option(..., help="Artifact folder; repeat for several folders."),
+    db: Path = typer.Option(DEFAULT_INDEX_DB, help="SQLite index file."),
+) -> None:
+    """Index artifact folders; only new or changed artifacts are re-read."""
+    for folder in input:
+        if not folder.is_dir():
+            typer.echo(f"Artifact folder not found: {folder}")
+            raise typer.Exit(code=2)
+    with ArtifactIndex(db) as index:
+        stats = index.update(input)
+    typer.echo(
+        f"scanned={stats.scanned} updated={stats.updated} unchanged={stats.unchanged} "
+        f"removed={stats.removed} failed={stats.failed}"
+    )
+
+
+class QueryFormat(str, Enum):
+    TEXT = "text"
+    JSON = "json"
+    PATHS = "paths"
+
+
+@app.command("query")
+def query_cmd(
+    db: Path = typer.Option(DEFAULT_INDEX_DB, help="SQLite index file."),
+    doc_type: str | None = typer.Option(None),
+    blocking: bool = typer.Option(False, "--blocking", help="Only artifacts with open blocking handoffs."),
+    invalid: bool = typer.Option(False, "--invalid", help="Only artifacts that failed validation."),
+    reason: str | None = typer.Option(None, help="Open handoff reason, e.g. page_limit_exceeded."),
+    missing: str | None = typer.Option(None, help="Field that is missing or has no value."),
+    field: str | None = typer.Option(None, help="Field value match as name=value."),
+    all_versions: bool = typer.Option(False, "--all-versions", help="Search every version, not just the latest."),
+    limit: int | None = typer.Option(None, min=1),
+    format: QueryFormat = typer.Option(QueryFormat.TEXT, case_sensitive=False),
+) -> None:
+    """Filter the latest indexed version of each document."""
+    if not db.exists():
+        typer.echo(f"Index not found: {db} (run `docreview index` first)")
+        raise typer.Exit(code=2)
+    field_equals = None
+    if field is not None:
+        name, separator, value = field.partition("=")
+        if not separator:
+            typer.echo("field must be given as name=value")
+            raise typer.Exit(code=2)
+        field_equals = (name, value)
+    with ArtifactIndex(db) as index:
+        rows = index.query(
+            document_type=doc_type,
+            blocking=blocking,
+            invalid=invalid,
+            reason=reason,
+            missing_field=missing,
+            field_equals=field_equals,
+            all_versions=all_versions,
+            limit=limit,
+        )
+    for row in rows:
+        if format == QueryFormat.JSON:
+            typer.echo(row.model_dump_json())
+        elif format == QueryFormat.PATHS:
+            typer.echo(row.path)
+        else:
+            typer.echo(
+                f"{row.document_id}\t{row.document_type}\tvalid={row.validation_ok}\t"
+                f"blocking={row.open_blocking_handoffs}\t{row.path}"
+            )
+
+
 @app.command()
 def doctor(format: str = typer.Option("text")) -> None:
     """Report local dependency and environment readiness."""
@@ -126,6 +629,8 @@ def doctor(format: str = typer.Option("text")) -> None:
     payload["openai_api_key_present"] = has_openai_key
     payload["pdftotext_available"] = shutil.which("pdftotext") is not None
     payload["pdftoppm_available"] = shutil.which("pdftoppm") is not None
+    payload["pypdfium2_installed"] = PdfiumBackend.available()
+    payload["pdf_backend"] = get_pdf_backend().name
 
     if format.lower() == "json":
         typer.echo(json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=True))
@@ -143,6 +648,7 @@ def doctor(format: str = typer.Option("text")) -> None:
                 else "missing"
             )
         )
+        lines.append(f"pdf_backend={payload['pdf_backend']}")
         lines.append(
             "ocr="
             + ("openai_vision_ready" if has_openai_key else "stub_mode (OPENAI_API_KEY missing)")
@@ -157,19 +663,99 @@ def doctor(format: str = typer.Option("text")) -> None:
 def patch_cmd(
     input: Path = typer.Option(...),
     patch: Path = typer.Option(...),
-    output: Path = typer.Option(...),
+    output: Path | None = typer.Option(None, help="Folder for the patched version; not used with --log."),
+    log: bool = typer.Option(False, "--log", help="Append to the artifact's patch log instead of writing a copy."),
+    snapshot_every: int = typer.Option(DEFAULT_SNAPSHOT_EVERY, min=1, help="Snapshot the patch log every N entries."),
+    blob_dir: Path | None = typer.Option(None, help="Blob store; default DOCREVIEW_BLOB_DIR or next to each artifact."),
+    external_text: bool = typer.Option(False, "--external-text", help="Move inline extracted text into blobs."),
 ) -> None:
     """Apply append-only updates and handoff resolutions to an artifact."""
     if not input.exists() or not patch.exists():
         raise typer.Exit(code=2)
-    output.mkdir(parents=True, exist_ok=True)
     created_at = "1970-01-01T00:00:00Z"
-    package = DocumentReviewPackage.model_validate_json(input.read_text(encoding="utf-8"))
     payload = PatchPayload.model_validate_json(patch.read_text(encoding="utf-8"))
+    patch_log = PatchLog(input, snapshot_every=snapshot_every)
+    if log:
+        patch_log.append(payload, created_at)
+        typer.echo(str(patch_log.path))
+        return
+    if output is None:
+        typer.echo("--output is required without --log")
+        raise typer.Exit(code=2)
+    output.mkdir(parents=True, exist_ok=True)
+    package = _load_patched(patch_log)
     updated = apply_patch(package=package, patch=payload, created_at=created_at)
-    output_path = _versioned_output_path(output, input.stem)
-    output_path.write_text(dump_model_json(updated), encoding="utf-8")
-    typer.echo(str(output_path))
+    typer.echo(str(_write_patched(updated, output, input, blob_dir, external_text)))
+
+
+@app.command("patch-batch")
+def patch_batch_cmd(
+    patches: Path = typer.Option(..., help="JSONL of {\"artifact\": path, \"patch\": {...}} lines."),
+    output: Path | None = typer.Option(None, help="Folder for the patched versions; not used with --log."),
+    log: bool = typer.Option(False, "--log", help="Append to each artifact's patch log instead of writing copies."),
+    snapshot_every: int = typer.Option(DEFAULT_SNAPSHOT_EVERY, min=1, help="Snapshot patch logs every N entries."),
+    blob_dir: Path | None = typer.Option(None, help="Blob store; default DOCREVIEW_BLOB_DIR or next to each artifact."),
+    external_text: bool = typer.Option(False, "--external-text", help="Move inline extracted text into blobs."),
+) -> None:
+    """Apply a stream of patches; each artifact is read and written once."""
+    if not patches.exists():
+        raise typer.Exit(code=2)
+    grouped: dict[Path, list[PatchPayload]] = {}
+    with patches.open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = ArtifactPatch.model_validate_json(line)
+            except ValidationError as exc:
+                typer.echo(f"{patches}:{line_number}: {exc}")
+                raise typer.Exit(code=2) from exc
+            # Resolved so that spellings of one file (a/x.json, ./a/x.json) share a group.
+            artifact = (patches.parent / item.artifact).resolve()
+            grouped.setdefault(artifact, []).append(item.patch)
+    missing = [str(path) for path in grouped if not path.exists()]
+    if missing:
+        typer.echo(f"Artifacts not found: {', '.join(missing)}")
+        raise typer.Exit(code=2)
+    created_at = "1970-01-01T00:00:00Z"
+    if log:
+        for artifact, payloads in grouped.items():
+            patch_log = PatchLog(artifact, snapshot_every=snapshot_every)
+            for payload in payloads:
+                patch_log.append(payload, created_at)
+            typer.echo(str(patch_log.path))
+        return
+    if output is None:
+        typer.echo("--output is required without --log")
+        raise typer.Exit(code=2)
+    output.mkdir(parents=True, exist_ok=True)
+    for artifact, payloads in grouped.items():
+        updated = apply_patches(_load_patched(PatchLog(artifact)), payloads, created_at)
+        typer.echo(str(_write_patched(updated, output, artifact, blob_dir, external_text)))
+
+
+def _load_patched(patch_log: PatchLog) -> DocumentReviewPackage:
+    if patch_log.exists():
+        return patch_log.materialize()
+    return DocumentReviewPackage.model_validate_json(patch_log.artifact.read_bytes())
+
+
+def _write_patched(
+    package: DocumentReviewPackage, output: Path, artifact: Path, blob_dir: Path | None, external_text: bool
+) -> Path:
+    # Referenced blobs follow the artifact into the output folder's store when the two stores differ.
+    source = BlobStore(_resolve_blob_dir(artifact.parent, blob_dir) or artifact.parent / DEFAULT_BLOB_DIRNAME)
+    blobs = BlobStore(_resolve_blob_dir(output, blob_dir) or output / DEFAULT_BLOB_DIRNAME)
+    try:
+        copy_blob_refs(package.extract, source, blobs)
+    except ValueError as exc:
+        typer.echo(f"Cannot patch {artifact}: {exc} (--blob-dir)")
+        raise typer.Exit(code=2) from exc
+    if external_text:
+        package = package.model_copy(update={"extract": externalize_text(package.extract, blobs)})
+    output_path = versioned_output_path(output, artifact.stem)
+    output_path.write_text(dump_model_json(package), encoding="utf-8")
+    return output_path
 
 
 if __name__ == "__main__":
@@ -27,6 +27,7 @@ class HandoffReason(str, Enum):
     INVALID_INPUT = "invalid_input"
     UNREADABLE_INPUT = "unreadable_input"
     PAGE_LIMIT_EXCEEDED = "page_limit_exceeded"
+    NEAR_DUPLICATE = "near_duplicate"
 
 
 class HandoffAction(str, Enum):
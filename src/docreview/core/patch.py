@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from pydantic import BaseModel, Field
 
 from docreview.core.enums import PipelineStage
@@ -7,7 +9,7 @@ from docreview.core.schemas import (
     Audit,
     DocumentReviewPackage,
     FieldProposal,
-    append_field_proposal,
+    extend_field_proposals,
 )
 
 
@@ -30,48 +32,77 @@ class PatchPayload(BaseModel):
     handoff_resolutions: list[HandoffResolution] = Field(default_factory=list)
 
 
+class ArtifactPatch(BaseModel):
+    """One line of a patch stream: a patch and the artifact it applies to."""
+
+    artifact: str
+    patch: PatchPayload
+
+
 def apply_patch(
     package: DocumentReviewPackage,
     patch: PatchPayload,
     created_at: str,
 ) -> DocumentReviewPackage:
-    updated = package.model_copy(deep=True)
-    fields = updated.normalize.fields
-
-    for field_update in patch.field_updates:
-        proposal = FieldProposal(
-            source=field_update.source,
-            value=field_update.value,
-            confidence=field_update.confidence,
-            stage=PipelineStage.NORMALIZE,
-            created_at=created_at,
-            notes=field_update.notes,
-        )
-        fields = append_field_proposal(fields, field_update.field_name, proposal)
-        updated.audit.append(
-            Audit(
+    return apply_patches(package, [patch], created_at)
+
+
+def apply_patches(
+    package: DocumentReviewPackage,
+    patches: Iterable[PatchPayload],
+    created_at: str,
+) -> DocumentReviewPackage:
+    """Apply ``patches`` in order and return the updated package.
+
+    ``package`` is left unchanged. Sections the patches do not touch (extract
+    text included) are shared with it rather than copied, so treat both
+    packages as read-only.
+    """
+    proposals: list[tuple[str, FieldProposal]] = []
+    handoffs = list(package.handoffs)
+    audit = list(package.audit)
+
+    for patch in patches:
+        for field_update in patch.field_updates:
+            proposal = FieldProposal(
+                source=field_update.source,
+                value=field_update.value,
+                confidence=field_update.confidence,
                 stage=PipelineStage.NORMALIZE,
-                event="patched_field",
-                detail=f"Appended proposal for '{field_update.field_name}'.",
                 created_at=created_at,
+                notes=field_update.notes,
             )
-        )
-    updated.normalize.fields = fields
-
-    for resolution in patch.handoff_resolutions:
-        if 0 <= resolution.index < len(updated.handoffs):
-            handoff = updated.handoffs[resolution.index]
-            handoff.resolved = True
-            handoff.resolved_at = created_at
-            handoff.resolution = resolution.resolution
-            handoff.resolved_by = resolution.resolved_by
-            updated.audit.append(
+            proposals.append((field_update.field_name, proposal))
+            audit.append(
                 Audit(
-                    stage=PipelineStage.VALIDATE,
-                    event="resolved_handoff",
-                    detail=f"Resolved handoff index {resolution.index}.",
+                    stage=PipelineStage.NORMALIZE,
+                    event="patched_field",
+                    detail=f"Appended proposal for '{field_update.field_name}'.",
                     created_at=created_at,
                 )
             )
 
-    return updated
+        for resolution in patch.handoff_resolutions:
+            if 0 <= resolution.index < len(handoffs):
+                handoffs[resolution.index] = handoffs[resolution.index].model_copy(
+                    update={
+                        "resolved": True,
+                        "resolved_at": created_at,
+                        "resolution": resolution.resolution,
+                        "resolved_by": resolution.resolved_by,
+                    }
+                )
+                audit.append(
+                    Audit(
+                        stage=PipelineStage.VALIDATE,
+                        event="resolved_handoff",
+                        detail=f"Resolved handoff index {resolution.index}.",
+                        created_at=created_at,
+                    )
+                )
+
+    update: dict[str, object] = {"handoffs": handoffs, "audit": audit}
+    if proposals:
+        fields = extend_field_proposals(package.normalize.fields, proposals)
+        update["normalize"] = package.normalize.model_copy(update={"fields": fields})
+    return package.model_copy(update=update)
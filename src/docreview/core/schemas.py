@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import Annotated
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from docreview.core.enums import (
@@ -9,6 +12,9 @@ from docreview.core.enums import (
     PipelineStage,
 )
 
+# Content address of a payload kept outside the artifact, see ``docreview.utils.blob_store``.
+BLOB_REF_PATTERN = r"^sha256:[0-9a-f]{64}$"
+
 
 class FieldProposal(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -61,6 +67,14 @@ class IngestSection(BaseModel):
     mime_type: str
 
 
+class PageExtract(BaseModel):
+    page_number: int = Field(ge=1)
+    ok: bool
+    model: str | None = None
+    elapsed_ms: float = Field(ge=0.0)
+    error: str | None = None
+
+
 class ExtractSection(BaseModel):
     stage: PipelineStage = PipelineStage.EXTRACT
     ok: bool
@@ -69,6 +83,16 @@ class ExtractSection(BaseModel):
     method: str = "stub"
     model: str | None = None
     page_count: int | None = None
+    # Per-page results of page-by-page OCR; left out for other methods.
+    pages: list[PageExtract] = Field(default_factory=list, exclude_if=lambda v: not v)
+    # Set when the full text lives in a blob store and ``text`` is only a preview.
+    # Unset blob fields are left out, so inline extracts serialize as before they existed.
+    text_ref: str | None = Field(default=None, pattern=BLOB_REF_PATTERN, exclude_if=lambda v: v is None)
+    text_bytes: int | None = Field(default=None, ge=0, exclude_if=lambda v: v is None)
+    # Blob references of the page images sent to OCR, in page order.
+    image_refs: list[Annotated[str, Field(pattern=BLOB_REF_PATTERN)]] = Field(
+        default_factory=list, exclude_if=lambda v: not v
+    )
 
 
 class ClassifySection(BaseModel):
@@ -97,6 +121,31 @@ class RenderSection(BaseModel):
     markdown_summary: str
 
 
+class StageMetrics(BaseModel):
+    stage: PipelineStage
+    started_at_unix_ns: int
+    wall_seconds: float = Field(ge=0.0)
+    cpu_seconds: float = Field(ge=0.0)
+    peak_memory_bytes: int | None = None
+    subprocess_calls: int = 0
+    subprocess_seconds: float = 0.0
+    api_calls: int = 0
+    api_seconds: float = 0.0
+    api_input_tokens: int = 0
+    api_output_tokens: int = 0
+
+
+class MetricsSection(BaseModel):
+    """Opt-in resource usage per stage; never part of a deterministic artifact."""
+
+    mode: str
+    started_at_unix_ns: int
+    wall_seconds: float = Field(ge=0.0)
+    cpu_seconds: float = Field(ge=0.0)
+    cache_hit: bool = False
+    stages: list[StageMetrics] = Field(default_factory=list)
+
+
 class DocumentReviewPackage(BaseModel):
     model_config = ConfigDict(populate_by_name=True, ser_json_inf_nan="null")
 
@@ -110,6 +159,8 @@ class DocumentReviewPackage(BaseModel):
     render: RenderSection
     handoffs: list[Handoff] = Field(default_factory=list)
     audit: list[Audit] = Field(default_factory=list)
+    # Artifacts without metrics serialize exactly as before the section existed.
+    metrics: MetricsSection | None = Field(default=None, exclude_if=lambda v: v is None)
 
 
 def append_field_proposal(
@@ -122,3 +173,21 @@ def append_field_proposal(
     next_fields.setdefault(field_name, [])
     next_fields[field_name].append(proposal)
     return next_fields
+
+
+def extend_field_proposals(
+    fields: dict[str, list[FieldProposal]], proposals: Iterable[tuple[str, FieldProposal]]
+) -> dict[str, list[FieldProposal]]:
+    """Return a new fields mapping with every ``(field_name, proposal)`` appended in order.
+
+    Only the histories that receive proposals are copied; the others are shared
+    with ``fields``.
+    """
+    next_fields = dict(fields)
+    copied: set[str] = set()
+    for field_name, proposal in proposals:
+        if field_name not in copied:
+            next_fields[field_name] = list(next_fields.get(field_name, ()))
+            copied.add(field_name)
+        next_fields[field_name].append(proposal)
+    return next_fields
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, Field
 
+T = TypeVar("T")
+
+
 class TemplateField(BaseModel):
     name: str
     type: str
@@ -33,6 +41,10 @@ def load_template(path: Path) -> DocumentTemplate:
     return DocumentTemplate.model_validate(data)
 
 
+def _template_from_bytes(raw: bytes) -> DocumentTemplate:
+    return DocumentTemplate.model_validate(json.loads(raw.decode("utf-8")))
+
+
 def load_templates(template_dir: Path) -> dict[str, DocumentTemplate]:
     templates: dict[str, DocumentTemplate] = {}
     for path in sorted(template_dir.glob("*.json"), key=lambda p: p.name):
@@ -46,3 +58,102 @@ def get_template(
     templates: dict[str, DocumentTemplate], doc_type: str
 ) -> DocumentTemplate:
     return templates.get(doc_type.lower(), templates["unknown"])
+
+
+_DERIVED_CACHE: OrderedDict[tuple[str, int], tuple[DocumentTemplate, Any]] = OrderedDict()
+_DERIVED_CACHE_SIZE = 256
+_DERIVED_LOCK = threading.Lock()
+
+
+def template_derived(
+    template: DocumentTemplate, name: str, factory: Callable[[DocumentTemplate], T]
+) -> T:
+    """Compute ``factory(template)`` once per template object and memoize it."""
+    # Entries keep the template alive, so its id cannot be reused while cached.
+    key = (name, id(template))
+    with _DERIVED_LOCK:
+        cached = _DERIVED_CACHE.get(key)
+        if cached is not None and cached[0] is template:
+            _DERIVED_CACHE.move_to_end(key)
+            return cached[1]
+    value = factory(template)
+    with _DERIVED_LOCK:
+        _DERIVED_CACHE[key] = (template, value)
+        if len(_DERIVED_CACHE) > _DERIVED_CACHE_SIZE:
+            _DERIVED_CACHE.popitem(last=False)
+    return value
+
+
+class _TemplateFile(BaseModel):
+    mtime_ns: int
+    size: int
+    sha256: str
+    template: DocumentTemplate
+
+
+class TemplateRegistry:
+    """Templates of one directory, loaded once and refreshed incrementally.
+
+    Every :meth:`templates` call stats the template files; a file is re-read
+    only when its mtime or size changed, and re-validated only when its
+    content hash changed as well. Unchanged templates keep their identity, so
+    artifacts memoized through :func:`template_derived` stay valid.
+    """
+
+    def __init__(self, template_dir: Path) -> None:
+        self.template_dir = template_dir
+        self._files: dict[str, _TemplateFile] = {}
+        self._templates: dict[str, DocumentTemplate] | None = None
+        self._unknown = unknown_template()
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def templates(self) -> dict[str, DocumentTemplate]:
+        with self._lock:
+            if self._refresh() or self._templates is None:
+                templates: dict[str, DocumentTemplate] = {}
+                for name in sorted(self._files):
+                    template = self._files[name].template
+                    templates[template.doc_type.lower()] = template
+                templates["unknown"] = self._unknown
+                self._templates = templates
+            return self._templates
+
+    def _refresh(self) -> bool:
+        changed = False
+        seen: set[str] = set()
+        for path in self.template_dir.glob("*.json"):
+            seen.add(path.name)
+            stat = path.stat()
+            current = self._files.get(path.name)
+            if current is not None and (current.mtime_ns, current.size) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if current is not None and current.sha256 == digest:
+                template = current.template
+            else:
+                template = _template_from_bytes(raw)
+                self.loads += 1
+                changed = True
+            self._files[path.name] = _TemplateFile(
+                mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=digest, template=template
+            )
+        for name in set(self._files) - seen:
+            del self._files[name]
+            changed = True
+        return changed
+
+
+_REGISTRIES: dict[Path, TemplateRegistry] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_registry(template_dir: Path) -> TemplateRegistry:
+    """Process-wide registry for ``template_dir``."""
+    key = template_dir.resolve()
+    with _REGISTRIES_LOCK:
+        registry = _REGISTRIES.get(key)
+        if registry is None:
+            registry = _REGISTRIES[key] = TemplateRegistry(key)
+        return registry
@@ -0,0 +1,287 @@
+"""Long-running HTTP daemon that runs the pipeline with warm in-process state."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, BinaryIO
+from urllib.parse import parse_qs, urlsplit
+
+from docreview.batch import BatchOptions
+from docreview.core.schemas import DocumentReviewPackage
+from docreview.core.template_loader import get_registry
+from docreview.stages.classify import keyword_matcher
+from docreview.stages.ingest import max_input_bytes
+from docreview.stages.normalize import field_extractor
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.artifact_cache import ArtifactCache
+from docreview.utils.blob_store import BlobStore
+from docreview.utils.dedup import DedupStore
+from docreview.utils.metrics import MetricsAggregate
+from docreview.utils.serialization import encode_model_json
+
+DEFAULT_PORT = 8765
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class _ReviewHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class ServerBusy(RuntimeError):
+    """Raised when the job queue is full."""
+
+
+class ReviewServer:
+    """Threaded local API around :func:`run_pipeline`.
+
+    ``POST /v1/review`` accepts the raw document bytes with a ``?filename=``
+    query parameter (the extension selects the extract path), or with
+    ``allow_paths`` a JSON body ``{"path": "..."}`` naming a local file. It answers with the package JSON
+    in ``options.json_style``, the same bytes ``docreview run`` writes. An
+    upload is recorded with its ``filename`` as ``metadata.source_path``,
+    since the temporary copy it is read from is deleted afterwards.
+    ``GET /healthz`` reports load. With ``options.metrics`` set to ``timing``
+    or ``memory``, ``GET /metrics`` serves per-stage totals as Prometheus text.
+
+    At most ``concurrency`` documents run at once and ``queue_size`` more may
+    wait; further requests are answered with HTTP 503 straight away, before
+    an upload is written to disk.
+    """
+
+    def __init__(
+        self,
+        options: BatchOptions,
+        *,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        concurrency: int = 4,
+        queue_size: int = 32,
+        allow_paths: bool = False,
+    ) -> None:
+        self.options = options
+        self.template_dir = Path(options.template_dir)
+        self.allow_paths = allow_paths
+        self.cache = (
+            ArtifactCache(Path(options.cache_dir), max_bytes=options.cache_max_bytes)
+            if options.cache_dir is not None
+            else None
+        )
+        self.dedup = DedupStore(Path(options.dedup_db)) if options.dedup_db is not None else None
+        self.blobs = BlobStore(Path(options.blob_dir)) if options.blob_dir is not None else None
+        self._running = threading.Semaphore(concurrency)
+        self._admitted = threading.BoundedSemaphore(concurrency + queue_size)
+        self._stats_lock = threading.Lock()
+        self.stats = {"active": 0, "queued": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self.metrics = MetricsAggregate()
+        self._server = _ReviewHTTPServer((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def warm(self) -> None:
+        """Load templates and compile matchers before the first request."""
+        templates = get_registry(self.template_dir).templates()
+        keyword_matcher(templates)
+        for template in templates.values():
+            field_extractor(template)
+
+    def _count(self, key: str, delta: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += delta
+
+    @contextmanager
+    def admitted(self) -> Iterator[None]:
+        """Hold a place in the job queue; raises :class:`ServerBusy` when it is full."""
+        if not self._admitted.acquire(blocking=False):
+            self._count("rejected")
+            raise ServerBusy("job queue is full")
+        try:
+            yield
+        finally:
+            self._admitted.release()
+
+    def review(self, input_path: Path) -> DocumentReviewPackage:
+        """Run one document, waiting for a free slot; raises :class:`ServerBusy`."""
+        with self.admitted():
+            return self._run(input_path)
+
+    def _run(self, input_path: Path, source_path: str | None = None) -> DocumentReviewPackage:
+        self._count("queued")
+        with self._running:
+            self._count("queued", -1)
+            self._count("active")
+            try:
+                package = run_pipeline(
+                    input_path=input_path,
+                    template_dir=self.template_dir,
+                    created_at=self.options.created_at,
+                    fill_mode=self.options.fill_mode,
+                    ocr_model=self.options.ocr_model,
+                    ocr_mode=self.options.ocr_mode,
+                    field_model=self.options.field_model,
+                    cache=self.cache,
+                    metrics=self.options.metrics,
+                    dedup=self.dedup,
+                    blobs=self.blobs,
+                    external_text=self.options.external_text,
+                    source_path=source_path,
+                )
+            except Exception:
+                self._count("failed")
+                raise
+            finally:
+                self._count("active", -1)
+        self._count("completed")
+        if package.metrics is not None:
+            self.metrics.add(package.metrics)
+        return package
+
+    def health(self) -> dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return {"status": "ok", "templates": len(get_registry(self.template_dir).templates()), **stats}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+            def _send(
+                self,
+                status: int,
+                body: bytes,
+                headers: dict[str, str] | None = None,
+                content_type: str = "application/json",
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _error(self, status: int, message: str, headers: dict[str, str] | None = None) -> None:
+                self._send(status, json.dumps({"error": message}).encode("utf-8"), headers)
+
+            def do_GET(self) -> None:
+                path = urlsplit(self.path).path.rstrip("/")
+                if path == "/healthz":
+                    self._send(200, json.dumps(server.health(), sort_keys=True).encode("utf-8"))
+                elif path == "/metrics":
+                    self._send(
+                        200,
+                        server.metrics.prometheus().encode("utf-8"),
+                        content_type="text/plain; version=0.0.4; charset=utf-8",
+                    )
+                else:
+                    self._error(404, "not found")
+
+            def do_POST(self) -> None:
+                url = urlsplit(self.path)
+                if url.path.rstrip("/") != "/v1/review":
+                    self._error(404, "not found")
+                    return
+                length = int(self.headers.get("Content-Length", "0"))
+                if length > max_input_bytes():
+                    self._error(413, f"document exceeds size limit ({length} bytes)")
+                    return
+                content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+                try:
+                    if content_type == "application/json":
+                        package = self._review_path(length)
+                    else:
+                        filename = parse_qs(url.query).get("filename", ["upload.bin"])[0]
+                        package = self._review_upload(length, filename)
+                except ServerBusy as exc:
+                    self._error(503, str(exc), {"Retry-After": "1"})
+                    return
+                except _RequestError as exc:
+                    self._error(exc.status, str(exc))
+                    return
+                except Exception as exc:
+                    self._error(500, f"{type(exc).__name__}: {exc}")
+                    return
+                blocking = sum(1 for h in package.handoffs if h.blocking and not h.resolved)
+                self._send(
+                    200,
+                    encode_model_json(package, server.options.json_style),
+                    {"X-Docreview-Blocking-Handoffs": str(blocking)},
+                )
+
+            def _review_path(self, length: int) -> DocumentReviewPackage:
+                if not server.allow_paths:
+                    raise _RequestError(403, "path requests are disabled; upload the document instead")
+                try:
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                    input_path = Path(request["path"])
+                except (ValueError, KeyError, TypeError) as exc:
+                    raise _RequestError(400, 'expected a JSON body like {"path": "..."}') from exc
+                if not input_path.is_file():
+                    raise _RequestError(404, f"input not found: {input_path}")
+                return server.review(input_path)
+
+            def _review_upload(self, length: int, filename: str) -> DocumentReviewPackage:
+                try:
+                    with server.admitted(), tempfile.TemporaryDirectory(prefix="docreview-serve-") as temp_dir:
+                        name = Path(filename).name or "upload.bin"
+                        input_path = Path(temp_dir) / name
+                        with input_path.open("wb") as handle:
+                            self._read_body(length, handle)
+                        return server._run(input_path, source_path=name)
+                except ServerBusy:
+                    # Admission fails before anything is read; drain the body so the client sees the 503.
+                    self._read_body(length, None)
+                    raise
+
+            def _read_body(self, length: int, handle: BinaryIO | None) -> None:
+                remaining = length
+                while remaining > 0:
+                    chunk = self.rfile.read(min(UPLOAD_CHUNK_BYTES, remaining))
+                    if not chunk:
+                        raise _RequestError(400, "request body ended early")
+                    if handle is not None:
+                        handle.write(chunk)
+                    remaining -= len(chunk)
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> ReviewServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        if self.dedup is not None:
+            self.dedup.close()
+
+    def __enter__(self) -> ReviewServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+class _RequestError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
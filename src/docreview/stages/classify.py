@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
 from docreview.core.enums import DocumentType, HandoffAction, HandoffReason, PipelineStage
 from docreview.core.schemas import ClassifySection, Handoff
 from docreview.core.template_loader import DocumentTemplate
@@ -30,18 +34,108 @@ def _build_keyword_map(templates: dict[str, DocumentTemplate]) -> dict[str, set[
     return keyword_map
 
 
+class KeywordMatcher:
+    """Keyword scoring compiled once per template set.
+
+    Each distinct keyword is searched at most once, longest first; a hit also
+    marks every keyword contained in it, so those never need their own scan.
+    """
+
+    def __init__(self, keyword_map: dict[str, set[str]]) -> None:
+        self.keyword_map = {doc_type: frozenset(keywords) for doc_type, keywords in keyword_map.items()}
+        unique = {keyword for keywords in self.keyword_map.values() for keyword in keywords}
+        self._keywords = sorted(unique, key=lambda keyword: (-len(keyword), keyword))
+        self._implied = {
+            keyword: tuple(other for other in self._keywords if other != keyword and other in keyword)
+            for keyword in self._keywords
+        }
+
+    def hits(self, lower_text: str, found: set[str] | None = None) -> set[str]:
+        """Keywords present in ``lower_text``, added to ``found`` (which is skipped) when given."""
+        found = set() if found is None else found
+        for keyword in self._keywords:
+            if keyword in found:
+                continue
+            if keyword in lower_text:
+                found.add(keyword)
+                found.update(self._implied[keyword])
+        return found
+
+    def stream_hits(self, chunks: Iterable[str]) -> set[str]:
+        """Keywords present in the concatenation of ``chunks``, scanning each chunk once.
+
+        The tail of each chunk is carried into the next so keywords spanning a
+        boundary are found, and scanning stops once every keyword has been seen.
+        """
+        found: set[str] = set()
+        overlap = len(self._keywords[0]) - 1 if self._keywords else 0
+        tail = ""
+        for chunk in chunks:
+            window = tail + chunk.lower()
+            self.hits(window, found)
+            if len(found) == len(self._keywords):
+                break
+            tail = window[-overlap:] if overlap else ""
+        return found
+
+    def scores_from_hits(self, found: set[str]) -> dict[str, float]:
+        return {
+            doc_type: len(keywords & found) / max(len(keywords), 1)
+            for doc_type, keywords in self.keyword_map.items()
+        }
+
+    def scores(self, text: str) -> dict[str, float]:
+        return self.scores_from_hits(self.hits(text.lower()))
+
+
+_MATCHER_CACHE: OrderedDict[tuple[tuple[str, int], ...], tuple[list[DocumentTemplate], KeywordMatcher]] = OrderedDict()
+_MATCHER_CACHE_SIZE = 16
+_MATCHER_LOCK = threading.Lock()
+
+
+def build_keyword_matcher(templates: dict[str, DocumentTemplate]) -> KeywordMatcher:
+    return KeywordMatcher(_build_keyword_map(templates))
+
+
+def keyword_matcher(templates: dict[str, DocumentTemplate]) -> KeywordMatcher:
+    """Return the memoized matcher for this template set."""
+    # Cached entries hold the templates themselves, so their ids stay unique.
+    key = tuple((doc_type, id(template)) for doc_type, template in templates.items())
+    with _MATCHER_LOCK:
+        cached = _MATCHER_CACHE.get(key)
+        if cached is not None:
+            _MATCHER_CACHE.move_to_end(key)
+            return cached[1]
+    matcher = build_keyword_matcher(templates)
+    with _MATCHER_LOCK:
+        _MATCHER_CACHE[key] = (list(templates.values()), matcher)
+        if len(_MATCHER_CACHE) > _MATCHER_CACHE_SIZE:
+            _MATCHER_CACHE.popitem(last=False)
+    return matcher
+
+
 def classify(
     text: str,
     created_at: str,
     templates: dict[str, DocumentTemplate],
+    matcher: KeywordMatcher | None = None,
 ) -> tuple[ClassifySection, list[Handoff]]:
-    lower_text = text.lower()
-    keyword_map = _build_keyword_map(templates)
-    scores: dict[str, float] = {}
-    for doc_type, keywords in keyword_map.items():
-        hits = sum(1 for keyword in keywords if keyword in lower_text)
-        scores[doc_type] = hits / max(len(keywords), 1)
+    scores = (matcher or keyword_matcher(templates)).scores(text)
+    return _classification(scores, created_at)
+
+
+def classify_stream(
+    chunks: Iterable[str],
+    created_at: str,
+    templates: dict[str, DocumentTemplate],
+    matcher: KeywordMatcher | None = None,
+) -> tuple[ClassifySection, list[Handoff]]:
+    """:func:`classify` over text delivered in chunks, such as streamed text inputs."""
+    matcher = matcher or keyword_matcher(templates)
+    return _classification(matcher.scores_from_hits(matcher.stream_hits(chunks)), created_at)
+
 
+def _classification(scores: dict[str, float], created_at: str) -> tuple[ClassifySection, list[Handoff]]:
     best_doc_type = max(scores, key=scores.get) if scores else DocumentType.UNKNOWN.value
     best_score = scores.get(best_doc_type, 0.0)
     handoffs: list[Handoff] = []
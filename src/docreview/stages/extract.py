@@ -1,20 +1,129 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from docreview.core.enums import HandoffAction, HandoffReason, PipelineStage
 from docreview.core.schemas import ExtractSection, Handoff
-from docreview.utils.openai_extract import openai_vision_extract
+from docreview.utils.blob_store import BlobStore
+from docreview.utils.dedup import IMAGE_EXTENSIONS
+from docreview.utils.openai_extract import openai_vision_extract, openai_vision_extract_pages
 from docreview.utils.pdf_extract import extract_text_layer, pdf_to_images
+from docreview.utils.pdf_structure import Buffer, estimate_page_count
+from docreview.utils.text_stream import PREVIEW_CHARS, TEXT_EXTENSIONS, iter_text_chunks
 
 PAGE_LIMIT = 25
+OCR_MODES = ("auto", "document", "page")
+
+
+def _page_ocr(
+    images: list[bytes],
+    created_at: str,
+    api_key: str,
+    ocr_model: str,
+    image_refs: list[str],
+) -> tuple[ExtractSection | None, list[Handoff]]:
+    results = openai_vision_extract_pages(images, api_key=api_key, model=ocr_model)
+    pages = [page for page, _ in results]
+    if not any(page.ok for page in pages):
+        return None, []
+
+    chunks = [
+        f"--- page {page.page_number} ---\n" + (text if page.ok else f"[OCR_FAILED: page {page.page_number}]")
+        for page, text in results
+    ]
+    handoffs: list[Handoff] = []
+    failed = [str(page.page_number) for page in pages if not page.ok]
+    if failed:
+        handoffs.append(
+            Handoff(
+                stage=PipelineStage.EXTRACT,
+                reason=HandoffReason.OCR_REQUIRED,
+                action=HandoffAction.MANUAL_REVIEW,
+                message=f"OCR failed for page(s) {', '.join(failed)}; text for those pages is missing.",
+                created_at=created_at,
+            )
+        )
+    section = ExtractSection(
+        ok=True,
+        text="\n\n".join(chunks),
+        used_ocr_stub=False,
+        method="openai_vision_pages",
+        model=ocr_model,
+        page_count=len(images),
+        pages=pages,
+        image_refs=image_refs,
+    )
+    return section, handoffs
+
+
+def extract_text_stream(data: Buffer, blobs: BlobStore | None = None) -> ExtractSection:
+    """Extract a large text input chunk by chunk without holding it as one string.
+
+    ``text`` keeps the first :data:`PREVIEW_CHARS` characters. The full text is
+    written to ``blobs`` when given and referenced by ``text_ref``;
+    ``text_bytes`` is its UTF-8 size either way.
+    """
+    preview: list[str] = []
+    preview_chars = 0
+
+    def encoded() -> Iterator[bytes]:
+        nonlocal preview_chars
+        chunks = iter_text_chunks(data)
+        try:
+            for chunk in chunks:
+                if preview_chars < PREVIEW_CHARS:
+                    piece = chunk[: PREVIEW_CHARS - preview_chars]
+                    preview.append(piece)
+                    preview_chars += len(piece)
+                yield chunk.encode("utf-8")
+        finally:
+            chunks.close()
+
+    if blobs is not None:
+        text_ref, text_bytes = blobs.put_chunks(encoded())
+    else:
+        text_ref, text_bytes = None, sum(len(chunk) for chunk in encoded())
+    return ExtractSection(
+        ok=True,
+        text="".join(preview),
+        used_ocr_stub=False,
+        method="text_stream",
+        text_ref=text_ref,
+        text_bytes=text_bytes,
+    )
+
+
+def ocr_failed(section: ExtractSection, extension: str, api_key: str | None) -> bool:
+    """Whether OCR was attempted with ``api_key`` but left text missing.
+
+    That covers failed pages in a page-by-page result and the stub fallback for
+    scans and images. Such output reflects a transient failure, so it must not
+    be cached or offered for reuse.
+    """
+    if not api_key:
+        return False
+    if section.method == "openai_vision_pages":
+        return any(not page.ok for page in section.pages)
+    # Rejected inputs (empty, over the page limit) are ok=False and deterministic.
+    return section.ok and section.method == "stub" and extension.lower() in IMAGE_EXTENSIONS | {".pdf"}
 
 
 def extract(
-    data: bytes,
+    data: Buffer,
     extension: str,
     created_at: str,
     api_key: str | None = None,
     ocr_model: str = "gpt-4o",
+    ocr_mode: str = "auto",
+    blobs: BlobStore | None = None,
+    images: list[bytes] | None = None,
 ) -> tuple[ExtractSection, list[Handoff]]:
+    """Extract text from one document.
+
+    With ``blobs``, every image sent to OCR is stored there and listed in
+    ``image_refs`` so reviewers can see exactly what the model read.
+    ``images`` are the PDF's pages when the caller has already rendered them.
+    """
     handoffs: list[Handoff] = []
     ext = extension.lower()
     if len(data) == 0:
@@ -38,11 +147,11 @@ def extract(
             handoffs,
         )
 
-    if ext in {".txt", ".md", ".json", ".csv"}:
+    if ext in TEXT_EXTENSIONS:
         return (
             ExtractSection(
                 ok=True,
-                text=data.decode("utf-8", errors="replace"),
+                text=str(data, "utf-8", errors="replace"),
                 used_ocr_stub=False,
                 method="text_layer",
             ),
@@ -50,7 +159,7 @@ def extract(
         )
 
     if ext == ".pdf":
-        page_count = data.count(b"/Type /Page") or None
+        page_count = estimate_page_count(data)
         if page_count is not None and page_count > PAGE_LIMIT:
             handoffs.append(
                 Handoff(
@@ -87,8 +196,15 @@ def extract(
             )
 
         if api_key:
-            images = pdf_to_images(data)
-            if images:
+            if not images:
+                images = pdf_to_images(data)
+            image_refs = [blobs.put(image) for image in images] if blobs is not None else []
+            if images and (ocr_mode == "page" or (ocr_mode == "auto" and len(images) > 1)):
+                page_section, page_handoffs = _page_ocr(images, created_at, api_key, ocr_model, image_refs)
+                if page_section is not None:
+                    handoffs.extend(page_handoffs)
+                    return page_section, handoffs
+            elif images:
                 text = openai_vision_extract(images, api_key=api_key, model=ocr_model)
                 if text:
                     return (
@@ -99,6 +215,7 @@ def extract(
                             method="openai_vision",
                             model=ocr_model,
                             page_count=len(images),
+                            image_refs=image_refs,
                         ),
                         handoffs,
                     )
@@ -123,7 +240,7 @@ def extract(
             handoffs,
         )
 
-    if ext in {".png", ".jpg", ".jpeg", ".tiff", ".webp"} and api_key:
+    if ext in IMAGE_EXTENSIONS and api_key:
         text = openai_vision_extract([data], api_key=api_key, model=ocr_model)
         if text:
             return (
@@ -134,6 +251,7 @@ def extract(
                     method="openai_vision",
                     model=ocr_model,
                     page_count=1,
+                    image_refs=[blobs.put(bytes(data))] if blobs is not None else [],
                 ),
                 handoffs,
             )
@@ -153,7 +271,7 @@ def extract(
             text="[OCR_STUB: not available]",
             used_ocr_stub=True,
             method="stub",
-            page_count=1 if ext in {".png", ".jpg", ".jpeg", ".tiff", ".webp"} else None,
+            page_count=1 if ext in IMAGE_EXTENSIONS else None,
         ),
         handoffs,
     )
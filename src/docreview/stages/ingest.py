@@ -2,9 +2,27 @@ from __future__ import annotations
 
 import hashlib
 import mimetypes
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-from docreview.core.schemas import IngestSection
+from docreview.core.enums import HandoffAction, HandoffReason, PipelineStage
+from docreview.core.schemas import Handoff, IngestSection
+from docreview.stages.extract import PAGE_LIMIT
+from docreview.utils.pdf_structure import Buffer, estimate_page_count
+
+DEFAULT_MAX_INPUT_BYTES = 512 * 1024 * 1024
+HEADER_BYTES = 1024
+
+MAGIC_PREFIXES: dict[str, tuple[bytes, ...]] = {
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".tiff": (b"II*\x00", b"MM\x00*"),
+    ".webp": (b"RIFF",),
+}
 
 
 def ingest(input_path: Path) -> tuple[IngestSection, bytes]:
@@ -21,3 +39,113 @@ def ingest(input_path: Path) -> tuple[IngestSection, bytes]:
         ),
         data,
     )
+
+
+def max_input_bytes() -> int:
+    return int(os.environ.get("DOCREVIEW_MAX_INPUT_BYTES", str(DEFAULT_MAX_INPUT_BYTES)))
+
+
+def _rejection(reason: HandoffReason, action: HandoffAction, message: str, created_at: str) -> Handoff:
+    return Handoff(
+        stage=PipelineStage.INGEST,
+        reason=reason,
+        action=action,
+        message=message,
+        created_at=created_at,
+        blocking=True,
+    )
+
+
+def _format_ok(extension: str, header: bytes) -> bool:
+    if extension == ".pdf":
+        return b"%PDF-" in header
+    prefixes = MAGIC_PREFIXES.get(extension)
+    if prefixes is None:
+        return True
+    if extension == ".webp":
+        return header.startswith(b"RIFF") and header[8:12] == b"WEBP"
+    return header.startswith(prefixes)
+
+
+@contextmanager
+def open_document(input_path: Path) -> Iterator[Buffer]:
+    """Memory-map a document for downstream stages; empty files yield ``b""``."""
+    with input_path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def ingest_document(
+    input_path: Path,
+    created_at: str,
+    *,
+    max_bytes: int | None = None,
+    page_limit: int = PAGE_LIMIT,
+) -> tuple[IngestSection, list[Handoff], int | None]:
+    """Hash a document in chunks and run pre-flight checks without loading it.
+
+    Returns the ingest section, any blocking rejection handoffs, and the PDF
+    page count when one was determined.
+    """
+    limit = max_input_bytes() if max_bytes is None else max_bytes
+    with input_path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        header = handle.read(HEADER_BYTES)
+        handle.seek(0)
+        digest = hashlib.file_digest(handle, "sha256").hexdigest()
+    mime_type, _ = mimetypes.guess_type(str(input_path))
+    extension = input_path.suffix.lower()
+
+    handoffs: list[Handoff] = []
+    page_count: int | None = None
+    if size == 0:
+        handoffs.append(
+            _rejection(
+                HandoffReason.UNREADABLE_INPUT,
+                HandoffAction.FIX_INPUT,
+                "Input file is empty or unreadable.",
+                created_at,
+            )
+        )
+    elif size > limit:
+        handoffs.append(
+            _rejection(
+                HandoffReason.UNREADABLE_INPUT,
+                HandoffAction.FIX_INPUT,
+                f"Input file exceeds size limit ({size} > {limit} bytes).",
+                created_at,
+            )
+        )
+    elif not _format_ok(extension, header):
+        handoffs.append(
+            _rejection(
+                HandoffReason.UNREADABLE_INPUT,
+                HandoffAction.FIX_INPUT,
+                f"Input content does not match its '{extension}' extension.",
+                created_at,
+            )
+        )
+    elif extension == ".pdf":
+        with open_document(input_path) as data:
+            page_count = estimate_page_count(data)
+        if page_count is not None and page_count > page_limit:
+            handoffs.append(
+                _rejection(
+                    HandoffReason.PAGE_LIMIT_EXCEEDED,
+                    HandoffAction.MANUAL_REVIEW,
+                    f"PDF exceeds page limit ({page_count} > {page_limit}).",
+                    created_at,
+                )
+            )
+
+    section = IngestSection(
+        ok=not handoffs,
+        source_path=str(input_path),
+        file_hash=digest,
+        file_size_bytes=size,
+        mime_type=mime_type or "application/octet-stream",
+    )
+    return section, handoffs, page_count
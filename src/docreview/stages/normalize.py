@@ -1,11 +1,102 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 
 from docreview.core.enums import PipelineStage
-from docreview.core.schemas import FieldProposal, NormalizeSection, append_field_proposal
-from docreview.core.template_loader import DocumentTemplate
-from docreview.utils.openai_field_fill import openai_field_fill
+from docreview.core.schemas import FieldProposal, NormalizeSection, extend_field_proposals
+from docreview.core.template_loader import DocumentTemplate, template_derived
+from docreview.utils.openai_field_fill import FieldFillBatcher, openai_field_fill
+
+
+# Proposal sources written by the pipeline itself, as opposed to reviewer patches.
+PIPELINE_SOURCES = frozenset({"extract_text", "openai_field_fill"})
+
+# Line boundaries recognised by ``str.splitlines``.
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_BREAK = re.compile(f"[{re.escape(_LINE_BREAKS)}]")
+
+
+def _line_bounds(text: str, line_start: int, position: int) -> tuple[int, int]:
+    """Bounds of the line holding ``position``, searching back no further than ``line_start``.
+
+    ``line_start`` is the start of a line at or before ``position``, so each
+    character is looked at a bounded number of times over a whole scan.
+    """
+    start = max(line_start, max(text.rfind(char, line_start, position) for char in _LINE_BREAKS) + 1)
+    found = _LINE_BREAK.search(text, position)
+    return start, found.start() if found is not None else len(text)
+
+
+class FieldExtractor:
+    """Regex field extraction for one template, compiled once.
+
+    A single combined pattern over every field name and synonym finds the
+    candidate lines in one pass over the text; the per-candidate patterns are
+    only evaluated on those lines, for fields that are still unfilled. For each
+    field the first matching line wins, and within a line the field name is
+    preferred over its synonyms in declaration order.
+    """
+
+    def __init__(self, template: DocumentTemplate) -> None:
+        self.fields: list[tuple[str, list[tuple[re.Pattern[str], float]]]] = []
+        candidates: set[str] = set()
+        for field in template.fields:
+            patterns = []
+            for candidate in [field.name] + field.synonyms:
+                candidates.add(candidate.lower())
+                patterns.append(
+                    (
+                        re.compile(rf"\b{re.escape(candidate)}\b\s*[:=-]\s*(.+)$", re.IGNORECASE),
+                        0.9 if candidate == field.name else 0.75,
+                    )
+                )
+            self.fields.append((field.name, patterns))
+        alternation = "|".join(re.escape(c) for c in sorted(candidates, key=len, reverse=True))
+        self._line_filter = re.compile(rf"\b(?:{alternation})\b(?=\s*[:=-])", re.IGNORECASE) if candidates else None
+
+    def extract(self, text: str) -> list[tuple[str, str, float]]:
+        """Return ``(field_name, value, confidence)`` in template field order."""
+        return self.extract_stream([text])
+
+    def extract_stream(self, chunks: Iterable[str]) -> list[tuple[str, str, float]]:
+        """:meth:`extract` over chunks that each end on a line break.
+
+        Stops pulling chunks as soon as every field has a value.
+        """
+        found: dict[int, tuple[str, float]] = {}
+        remaining = list(range(len(self.fields)))
+        if self._line_filter is not None:
+            for chunk in chunks:
+                remaining = self._scan(chunk, found, remaining)
+                if not remaining:
+                    break
+        return [(self.fields[i][0], *found[i]) for i in sorted(found)]
+
+    def _scan(self, text: str, found: dict[int, tuple[str, float]], remaining: list[int]) -> list[int]:
+        position = 0
+        while remaining and self._line_filter is not None:
+            hit = self._line_filter.search(text, position)
+            if hit is None:
+                break
+            start, end = _line_bounds(text, position, hit.start())
+            line = text[start:end]
+            unfilled = []
+            for index in remaining:
+                for pattern, confidence in self.fields[index][1]:
+                    match = pattern.search(line)
+                    if match:
+                        found[index] = (match.group(1).strip(), confidence)
+                        break
+                else:
+                    unfilled.append(index)
+            remaining = unfilled
+            position = end + 1
+        return remaining
+
+
+def field_extractor(template: DocumentTemplate) -> FieldExtractor:
+    return template_derived(template, "field_extractor", FieldExtractor)
 
 
 def normalize_regex(
@@ -13,41 +104,33 @@ def normalize_regex(
     template: DocumentTemplate,
     created_at: str,
 ) -> NormalizeSection:
-    fields: dict[str, list[FieldProposal]] = {}
-    lines = text.splitlines()
-
-    for field in template.fields:
-        candidates = [field.name] + field.synonyms
-        found_value = None
-        confidence = 0.0
-        for line in lines:
-            lowered = line.lower()
-            for candidate in candidates:
-                pattern = rf"\b{re.escape(candidate.lower())}\b\s*[:=-]\s*(.+)$"
-                match = re.search(pattern, lowered)
-                if match:
-                    raw_match = re.search(
-                        rf"\b{re.escape(candidate)}\b\s*[:=-]\s*(.+)$",
-                        line,
-                        flags=re.IGNORECASE,
-                    )
-                    found_value = raw_match.group(1).strip() if raw_match else match.group(1).strip()
-                    confidence = 0.9 if candidate == field.name else 0.75
-                    break
-            if found_value is not None:
-                break
+    return _regex_section(field_extractor(template).extract(text), created_at)
+
 
-        if found_value is not None:
-            proposal = FieldProposal(
+def normalize_regex_stream(
+    chunks: Iterable[str],
+    template: DocumentTemplate,
+    created_at: str,
+) -> NormalizeSection:
+    """:func:`normalize_regex` over whole-line chunks, stopping once every field is found."""
+    return _regex_section(field_extractor(template).extract_stream(chunks), created_at)
+
+
+def _regex_section(matches: list[tuple[str, str, float]], created_at: str) -> NormalizeSection:
+    proposals = [
+        (
+            name,
+            FieldProposal(
                 source="extract_text",
-                value=found_value,
+                value=value,
                 confidence=confidence,
                 stage=PipelineStage.NORMALIZE,
                 created_at=created_at,
-            )
-            fields = append_field_proposal(fields, field.name, proposal)
-
-    return NormalizeSection(ok=True, fields=fields)
+            ),
+        )
+        for name, value, confidence in matches
+    ]
+    return NormalizeSection(ok=True, fields=extend_field_proposals({}, proposals))
 
 
 def normalize_llm(
@@ -57,9 +140,12 @@ def normalize_llm(
     *,
     api_key: str,
     model: str,
+    field_fill: FieldFillBatcher | None = None,
 ) -> NormalizeSection:
-    fields: dict[str, list[FieldProposal]] = {}
-    for item in openai_field_fill(text=text, template=template, api_key=api_key, model=model):
+    """Fill fields with the LLM; a ``field_fill`` batcher packs the request with other documents'."""
+    fill = field_fill.fill if field_fill is not None else openai_field_fill
+    proposals: list[tuple[str, FieldProposal]] = []
+    for item in fill(text=text, template=template, api_key=api_key, model=model):
         if item.value is None:
             continue
         notes = item.notes
@@ -73,8 +159,8 @@ def normalize_llm(
             created_at=created_at,
             notes=notes,
         )
-        fields = append_field_proposal(fields, item.field_name, proposal)
-    return NormalizeSection(ok=True, fields=fields)
+        proposals.append((item.field_name, proposal))
+    return NormalizeSection(ok=True, fields=extend_field_proposals({}, proposals))
 
 
 def normalize(
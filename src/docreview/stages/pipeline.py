@@ -1,71 +1,126 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack, closing, nullcontext
 from pathlib import Path
 
 from docreview.core.enums import HandoffAction, HandoffReason, PipelineStage
-from docreview.core.schemas import Audit, DocumentMetadata, DocumentReviewPackage, Handoff
-from docreview.core.template_loader import get_template, load_templates
-from docreview.stages.classify import classify
-from docreview.stages.extract import extract
-from docreview.stages.ingest import ingest
-from docreview.stages.normalize import normalize_llm, normalize_regex
+from docreview.core.schemas import (
+    Audit,
+    ClassifySection,
+    DocumentMetadata,
+    DocumentReviewPackage,
+    ExtractSection,
+    Handoff,
+    NormalizeSection,
+    ValidateSection,
+    extend_field_proposals,
+)
+from docreview.core.template_loader import DocumentTemplate, get_registry, get_template
+from docreview.stages.classify import classify, classify_stream
+from docreview.stages.extract import extract, extract_text_stream, ocr_failed
+from docreview.stages.ingest import ingest_document, open_document
+from docreview.stages.normalize import PIPELINE_SOURCES, normalize_llm, normalize_regex, normalize_regex_stream
 from docreview.stages.render import render
 from docreview.stages.validate import validate
-from docreview.utils.openai_field_fill import FieldFillError
+from docreview.utils.artifact_cache import ArtifactCache, CacheEntry, cache_key, settings_key
+from docreview.utils.blob_store import BlobStore, externalize_text
+from docreview.utils.dedup import DedupMatch, DedupStore, Fingerprint, document_fingerprint
+from docreview.utils.metrics import collecting, current_collector, stage_timer
+from docreview.utils.openai_field_fill import FieldFillBatcher, FieldFillError
+from docreview.utils.profiling import StageProfiler
+from docreview.utils.pdf_structure import Buffer
+from docreview.utils.text_stream import TEXT_EXTENSIONS, iter_text_chunks, should_stream, stream_threshold_bytes
 
 
 def _env_or_value(value: str | None, env_key: str, default: str) -> str:
     return value or os.environ.get(env_key, default)
 
 
-def run_pipeline(
-    input_path: Path,
-    template_dir: Path,
-    created_at: str,
-    *,
-    fill_mode: str | None = None,
-    ocr_model: str | None = None,
-    field_model: str | None = None,
-) -> DocumentReviewPackage:
-    ingest_section, data = ingest(input_path)
-    audit: list[Audit] = [
-        Audit(stage=PipelineStage.INGEST, event="completed", detail="Ingest completed", created_at=created_at)
+def _run_classify(
+    text: str, created_at: str, templates: dict[str, DocumentTemplate]
+) -> tuple[ClassifySection, list[Handoff], list[Audit]]:
+    with stage_timer(PipelineStage.CLASSIFY):
+        classify_section, classify_handoffs = classify(
+            text,
+            created_at=created_at,
+            templates=templates,
+        )
+    audit = [
+        Audit(stage=PipelineStage.CLASSIFY, event="completed", detail="Classification completed", created_at=created_at)
     ]
-    handoffs = []
-    resolved_fill_mode = _env_or_value(fill_mode, "DOCREVIEW_FILL_MODE", "auto").lower()
-    resolved_ocr_model = _env_or_value(ocr_model, "DOCREVIEW_OCR_MODEL", "gpt-4o")
-    resolved_field_model = field_model or os.environ.get("DOCREVIEW_FIELD_MODEL") or resolved_ocr_model
-    api_key = os.environ.get("OPENAI_API_KEY")
+    return classify_section, classify_handoffs, audit
 
-    extract_section, extract_handoffs = extract(
-        data=data,
-        extension=input_path.suffix,
-        created_at=created_at,
-        api_key=api_key,
-        ocr_model=resolved_ocr_model,
-    )
-    handoffs.extend(extract_handoffs)
-    audit.append(
-        Audit(stage=PipelineStage.EXTRACT, event="completed", detail="Extraction completed", created_at=created_at)
-    )
 
-    templates = load_templates(template_dir)
-    classify_section, classify_handoffs = classify(
-        extract_section.text,
-        created_at=created_at,
-        templates=templates,
-    )
-    handoffs.extend(classify_handoffs)
-    audit.append(
+def _run_classify_stream(
+    chunks: Iterator[str], created_at: str, templates: dict[str, DocumentTemplate]
+) -> tuple[ClassifySection, list[Handoff], list[Audit]]:
+    with stage_timer(PipelineStage.CLASSIFY), closing(chunks):
+        classify_section, classify_handoffs = classify_stream(chunks, created_at=created_at, templates=templates)
+    audit = [
         Audit(stage=PipelineStage.CLASSIFY, event="completed", detail="Classification completed", created_at=created_at)
-    )
+    ]
+    return classify_section, classify_handoffs, audit
+
+
+def _run_normalize_stream(
+    chunks: Iterator[str], template: DocumentTemplate, created_at: str, *, fill_mode: str
+) -> tuple[NormalizeSection, list[Handoff], list[Audit], bool]:
+    """Regex fill over streamed text; LLM fill is never used for it."""
+    with stage_timer(PipelineStage.NORMALIZE), closing(chunks):
+        normalize_section = normalize_regex_stream(chunks, template=template, created_at=created_at)
+    detail = "Normalization mode: regex (streamed text)"
+    if fill_mode != "regex":
+        detail += f"; fill_mode {fill_mode} is not applied to streamed text"
+    audit = [
+        Audit(stage=PipelineStage.NORMALIZE, event="mode_selected", detail=detail, created_at=created_at),
+        Audit(
+            stage=PipelineStage.NORMALIZE, event="completed", detail="Normalization completed", created_at=created_at
+        ),
+    ]
+    return normalize_section, [], audit, True
+
+
+def _run_normalize(
+    text: str,
+    template: DocumentTemplate,
+    created_at: str,
+    *,
+    fill_mode: str,
+    field_model: str,
+    api_key: str | None,
+    field_fill: FieldFillBatcher | None = None,
+) -> tuple[NormalizeSection, list[Handoff], list[Audit], bool]:
+    """Fill template fields; the last flag reports cacheability."""
+    with stage_timer(PipelineStage.NORMALIZE):
+        return _fill_fields(
+            text,
+            template,
+            created_at,
+            fill_mode=fill_mode,
+            field_model=field_model,
+            api_key=api_key,
+            field_fill=field_fill,
+        )
 
-    template = get_template(templates, classify_section.document_type)
 
+def _fill_fields(
+    text: str,
+    template: DocumentTemplate,
+    created_at: str,
+    *,
+    fill_mode: str,
+    field_model: str,
+    api_key: str | None,
+    field_fill: FieldFillBatcher | None,
+) -> tuple[NormalizeSection, list[Handoff], list[Audit], bool]:
+    handoffs: list[Handoff] = []
+    audit: list[Audit] = []
+    cacheable = True
     llm_available = bool(api_key)
-    if resolved_fill_mode == "regex":
-        normalize_section = normalize_regex(extract_section.text, template=template, created_at=created_at)
+    if fill_mode == "regex":
+        normalize_section = normalize_regex(text, template=template, created_at=created_at)
         audit.append(
             Audit(
                 stage=PipelineStage.NORMALIZE,
@@ -76,27 +131,30 @@ def run_pipeline(
         )
     else:
         try:
-            if resolved_fill_mode == "llm" and not llm_available:
+            if fill_mode == "llm" and not llm_available:
                 raise FieldFillError("LLM mode requested but OPENAI_API_KEY is missing.")
-            if resolved_fill_mode == "auto" and not llm_available:
+            if fill_mode == "auto" and not llm_available:
                 raise FieldFillError("LLM unavailable (OPENAI_API_KEY missing); falling back to regex.")
             normalize_section = normalize_llm(
-                extract_section.text,
+                text,
                 template=template,
                 created_at=created_at,
                 api_key=api_key or "",
-                model=resolved_field_model,
+                model=field_model,
+                field_fill=field_fill,
             )
             audit.append(
                 Audit(
                     stage=PipelineStage.NORMALIZE,
                     event="mode_selected",
-                    detail=f"Normalization mode: llm ({resolved_field_model})",
+                    detail=f"Normalization mode: llm ({field_model})",
                     created_at=created_at,
                 )
             )
         except FieldFillError as exc:
-            blocking = resolved_fill_mode == "llm"
+            # A failure with a key present may be transient; never cache it.
+            cacheable = not llm_available
+            blocking = fill_mode == "llm"
             handoffs.append(
                 Handoff(
                     stage=PipelineStage.NORMALIZE,
@@ -107,7 +165,7 @@ def run_pipeline(
                     blocking=blocking,
                 )
             )
-            normalize_section = normalize_regex(extract_section.text, template=template, created_at=created_at)
+            normalize_section = normalize_regex(text, template=template, created_at=created_at)
             audit.append(
                 Audit(
                     stage=PipelineStage.NORMALIZE,
@@ -119,20 +177,395 @@ def run_pipeline(
     audit.append(
         Audit(stage=PipelineStage.NORMALIZE, event="completed", detail="Normalization completed", created_at=created_at)
     )
+    return normalize_section, handoffs, audit, cacheable
 
-    validate_section, validate_handoffs = validate(
-        normalize_section=normalize_section,
-        template=template,
-        created_at=created_at,
+
+def _run_upstream(
+    data: Buffer | None,
+    extension: str,
+    created_at: str,
+    templates: dict[str, DocumentTemplate],
+    *,
+    fill_mode: str,
+    ocr_model: str,
+    ocr_mode: str,
+    field_model: str,
+    api_key: str | None,
+    page_count: int | None = None,
+    field_fill: FieldFillBatcher | None = None,
+    blobs: BlobStore | None = None,
+    external_text: bool = False,
+    file_hash: str = "",
+    duplicates: Sequence[DedupMatch] = (),
+    images: list[bytes] | None = None,
+) -> tuple[ExtractSection, ClassifySection, NormalizeSection, list[Handoff], list[Audit], bool]:
+    """Run extract, classify and normalize; the last flag reports cacheability.
+
+    ``data=None`` means ingest rejected the document, so extraction is skipped.
+    Near-``duplicates`` from the dedup store let an identical file skip OCR and
+    an identical text skip classify and normalize; other image matches are
+    only reported. ``images`` are pages already rendered for the fingerprint.
+    """
+    if data is not None and should_stream(extension, len(data)):
+        return _run_upstream_stream(data, created_at, templates, fill_mode=fill_mode, blobs=blobs)
+    handoffs: list[Handoff] = []
+    audit: list[Audit] = []
+
+    # A dHash sees little more than the layout, so only an identical file may reuse OCR text.
+    rescan = next((match for match in duplicates if match.kind == "image" and match.file_hash == file_hash), None)
+    similar = next((match for match in duplicates if match.kind == "image"), None)
+
+    if data is None:
+        extract_section = ExtractSection(ok=False, text="", used_ocr_stub=True, method="stub", page_count=page_count)
+        audit.append(
+            Audit(
+                stage=PipelineStage.EXTRACT,
+                event="skipped",
+                detail="Extraction skipped; input rejected at ingest",
+                created_at=created_at,
+            )
+        )
+    elif rescan is not None:
+        # Only OCR is skipped; classify and normalize still run on the reused text.
+        extract_section = rescan.entry.extract
+        handoffs.append(
+            _near_duplicate_handoff(rescan, created_at, "the file is identical, so its OCR text was reused")
+        )
+        audit.append(
+            Audit(
+                stage=PipelineStage.EXTRACT,
+                event="dedup_hit",
+                detail=f"Reused OCR text of identical file {rescan.file_hash[:12]}; OCR skipped.",
+                created_at=created_at,
+            )
+        )
+    else:
+        with stage_timer(PipelineStage.EXTRACT):
+            extract_section, extract_handoffs = extract(
+                data=data,
+                extension=extension,
+                created_at=created_at,
+                api_key=api_key,
+                ocr_model=ocr_model,
+                ocr_mode=ocr_mode,
+                blobs=blobs if external_text else None,
+                images=images,
+            )
+        handoffs.extend(extract_handoffs)
+        audit.append(
+            Audit(stage=PipelineStage.EXTRACT, event="completed", detail="Extraction completed", created_at=created_at)
+        )
+        if similar is not None:
+            handoffs.append(
+                _near_duplicate_handoff(
+                    similar, created_at, "nothing was reused, so check it is not a repeat submission", blocking=False
+                )
+            )
+    # A failed OCR call may succeed next time, so its output is neither cached nor reused.
+    degraded = data is not None and rescan is None and ocr_failed(extract_section, extension, api_key)
+
+    # Text is cheap to extract, and only identical text may reuse another document's fields.
+    copy = next(
+        (match for match in duplicates if match.kind == "text" and match.entry.extract.text == extract_section.text),
+        None,
     )
-    handoffs.extend(validate_handoffs)
-    audit.append(
-        Audit(stage=PipelineStage.VALIDATE, event="completed", detail="Validation completed", created_at=created_at)
+    if copy is not None:
+        handoffs.extend(h for h in copy.entry.handoffs if h.stage != PipelineStage.EXTRACT)
+        handoffs.append(
+            _near_duplicate_handoff(copy, created_at, "the text is identical, so classify and normalize were reused")
+        )
+        audit.append(
+            Audit(
+                stage=PipelineStage.EXTRACT,
+                event="dedup_hit",
+                detail=f"Reused classify and normalize outputs of {copy.file_hash[:12]}; LLM calls skipped.",
+                created_at=created_at,
+            )
+        )
+        return extract_section, copy.entry.classify, copy.entry.normalize, handoffs, audit, not degraded
+
+    classify_section, classify_handoffs, classify_audit = _run_classify(extract_section.text, created_at, templates)
+    handoffs.extend(classify_handoffs)
+    audit.extend(classify_audit)
+
+    template = get_template(templates, classify_section.document_type)
+    normalize_section, normalize_handoffs, normalize_audit, cacheable = _run_normalize(
+        extract_section.text,
+        template,
+        created_at,
+        fill_mode=fill_mode,
+        field_model=field_model,
+        api_key=api_key,
+        field_fill=field_fill,
     )
+    handoffs.extend(normalize_handoffs)
+    audit.extend(normalize_audit)
+    return extract_section, classify_section, normalize_section, handoffs, audit, cacheable and not degraded
+
+
+def _run_upstream_stream(
+    data: Buffer,
+    created_at: str,
+    templates: dict[str, DocumentTemplate],
+    *,
+    fill_mode: str,
+    blobs: BlobStore | None,
+) -> tuple[ExtractSection, ClassifySection, NormalizeSection, list[Handoff], list[Audit], bool]:
+    """Upstream stages for large text inputs, each pass reading the buffer in chunks."""
+    with stage_timer(PipelineStage.EXTRACT):
+        extract_section = extract_text_stream(data, blobs=blobs)
+    stored = (
+        f"full text stored as {extract_section.text_ref}"
+        if extract_section.text_ref
+        else "only a preview is kept in the artifact"
+    )
+    audit = [
+        Audit(
+            stage=PipelineStage.EXTRACT,
+            event="streamed",
+            detail=f"Text input of {len(data)} bytes processed in chunks; {stored}",
+            created_at=created_at,
+        ),
+        Audit(stage=PipelineStage.EXTRACT, event="completed", detail="Extraction completed", created_at=created_at),
+    ]
+    classify_section, handoffs, classify_audit = _run_classify_stream(iter_text_chunks(data), created_at, templates)
+    audit.extend(classify_audit)
+    template = get_template(templates, classify_section.document_type)
+    normalize_section, normalize_handoffs, normalize_audit, cacheable = _run_normalize_stream(
+        iter_text_chunks(data), template, created_at, fill_mode=fill_mode
+    )
+    handoffs.extend(normalize_handoffs)
+    audit.extend(normalize_audit)
+    return extract_section, classify_section, normalize_section, handoffs, audit, cacheable
+
+
+def run_pipeline(
+    input_path: Path,
+    template_dir: Path,
+    created_at: str,
+    *,
+    fill_mode: str | None = None,
+    ocr_model: str | None = None,
+    field_model: str | None = None,
+    ocr_mode: str | None = None,
+    templates: dict[str, DocumentTemplate] | None = None,
+    cache: ArtifactCache | None = None,
+    artifact: DocumentReviewPackage | None = None,
+    from_stage: PipelineStage | str | None = None,
+    metrics: str | None = None,
+    dedup: DedupStore | None = None,
+    field_fill: FieldFillBatcher | None = None,
+    blobs: BlobStore | None = None,
+    external_text: bool = False,
+    profiler: StageProfiler | None = None,
+    source_path: str | None = None,
+) -> DocumentReviewPackage:
+    """Run every stage for ``input_path``.
+
+    Given an existing ``artifact``, only ``from_stage`` (default classify) and
+    later stages are recomputed; see :func:`rerun_pipeline`.
+
+    With a ``dedup`` store, a scan identical to an earlier file reuses that
+    document's OCR text, and a document whose extracted text is identical to
+    an earlier one reuses its classify and normalize outputs. Either way it
+    gets a blocking ``near_duplicate`` handoff; a scan that only looks similar
+    is OCRed and gets a non-blocking one.
+
+    A ``field_fill`` batcher packs LLM field fill with other documents of the
+    same type that are in flight on other threads.
+
+    Text inputs above ``DOCREVIEW_STREAM_THRESHOLD_BYTES`` are streamed: each
+    stage reads them in chunks, fields are always filled by regex, and the
+    extract section keeps a preview plus a reference into ``blobs``. With
+    ``external_text`` any text longer than the preview, and every image sent
+    to OCR, is kept in ``blobs`` the same way.
+
+    ``metrics`` (or ``DOCREVIEW_METRICS``) set to ``timing`` or ``memory``
+    attaches a ``metrics`` section with per-stage resource usage; the default
+    ``off`` leaves the artifact byte-for-byte reproducible.
+
+    A ``profiler`` records where the run spends time and memory. Setting
+    ``DOCREVIEW_PROFILE`` to a directory profiles runs and writes their
+    reports there, named after the input and the profiler's run id; runs that
+    overlap one already being profiled are not profiled. See
+    :mod:`docreview.utils.profiling`.
+
+    ``source_path`` is recorded in the metadata in place of ``input_path``,
+    for inputs staged under a temporary path such as server uploads.
+    """
+    resolved_metrics = _env_or_value(metrics, "DOCREVIEW_METRICS", "off").lower()
+    profile_dir = os.environ.get("DOCREVIEW_PROFILE")
+    if profiler is None and profile_dir:
+        profiler = StageProfiler()
+    with collecting(resolved_metrics, profiler) as collector, profiler or nullcontext():
+        if artifact is not None:
+            package = rerun_pipeline(
+                artifact,
+                from_stage or PipelineStage.CLASSIFY,
+                template_dir,
+                created_at,
+                fill_mode=fill_mode,
+                field_model=field_model,
+                templates=templates,
+                blobs=blobs,
+            )
+        else:
+            package = _run_document(
+                input_path,
+                template_dir,
+                created_at,
+                fill_mode=fill_mode,
+                ocr_model=ocr_model,
+                field_model=field_model,
+                ocr_mode=ocr_mode,
+                templates=templates,
+                cache=cache,
+                dedup=dedup,
+                field_fill=field_fill,
+                blobs=blobs,
+                external_text=external_text,
+                source_path=source_path,
+            )
+    if collector is not None and resolved_metrics != "off":
+        package.metrics = collector.section()
+    if profiler is not None and profile_dir and profiler.active:
+        profiler.write(Path(profile_dir), f"{input_path.stem}.{profiler.run_id}")
+    return package
+
+
+def _run_document(
+    input_path: Path,
+    template_dir: Path,
+    created_at: str,
+    *,
+    fill_mode: str | None,
+    ocr_model: str | None,
+    field_model: str | None,
+    ocr_mode: str | None,
+    templates: dict[str, DocumentTemplate] | None,
+    cache: ArtifactCache | None,
+    dedup: DedupStore | None,
+    field_fill: FieldFillBatcher | None,
+    blobs: BlobStore | None,
+    external_text: bool,
+    source_path: str | None,
+) -> DocumentReviewPackage:
+    with stage_timer(PipelineStage.INGEST):
+        ingest_section, handoffs, page_count = ingest_document(input_path, created_at)
+    audit: list[Audit] = [
+        Audit(stage=PipelineStage.INGEST, event="completed", detail="Ingest completed", created_at=created_at)
+    ]
+    resolved_fill_mode = _env_or_value(fill_mode, "DOCREVIEW_FILL_MODE", "auto").lower()
+    resolved_ocr_model = _env_or_value(ocr_model, "DOCREVIEW_OCR_MODEL", "gpt-4o")
+    resolved_ocr_mode = _env_or_value(ocr_mode, "DOCREVIEW_OCR_MODE", "auto").lower()
+    resolved_field_model = field_model or os.environ.get("DOCREVIEW_FIELD_MODEL") or resolved_ocr_model
+    api_key = os.environ.get("OPENAI_API_KEY")
+
+    if templates is None:
+        templates = get_registry(template_dir).templates()
+
+    key = None
+    entry = None
+    if cache is not None and ingest_section.ok:
+        key = cache_key(
+            ingest_section.file_hash,
+            templates,
+            ocr_model=resolved_ocr_model,
+            ocr_mode=resolved_ocr_mode,
+            field_model=resolved_field_model,
+            fill_mode=resolved_fill_mode,
+            llm_available=bool(api_key),
+        )
+        entry = cache.get(key)
+
+    if entry is not None:
+        extract_section = entry.extract
+        classify_section = entry.classify
+        normalize_section = entry.normalize
+        handoffs.extend(entry.handoffs)
+        collector = current_collector()
+        if collector is not None:
+            collector.cache_hit = True
+        audit.append(
+            Audit(
+                stage=PipelineStage.EXTRACT,
+                event="cache_hit",
+                detail=f"Reused extract, classify and normalize outputs from cache entry {entry.key[:16]}.",
+                created_at=created_at,
+            )
+        )
+    else:
+        settings = None
+        fingerprint: Fingerprint | None = None
+        duplicates: list[DedupMatch] = []
+        with ExitStack() as stack:
+            data = stack.enter_context(open_document(input_path)) if ingest_section.ok else None
+            # Plain text filled by regex makes no OCR or LLM calls, so there is nothing to reuse.
+            streamed = data is not None and should_stream(input_path.suffix, len(data))
+            regex_only = resolved_fill_mode == "regex" or not api_key or streamed
+            skip_dedup = regex_only and input_path.suffix.lower() in TEXT_EXTENSIONS
+            if dedup is not None and data is not None and not skip_dedup:
+                settings = settings_key(
+                    templates,
+                    ocr_model=resolved_ocr_model,
+                    ocr_mode=resolved_ocr_mode,
+                    field_model=resolved_field_model,
+                    fill_mode=resolved_fill_mode,
+                    llm_available=bool(api_key),
+                )
+                fingerprint = document_fingerprint(data, input_path.suffix)
+                if fingerprint is not None:
+                    duplicates = dedup.matches(settings, fingerprint)
+            (
+                extract_section,
+                classify_section,
+                normalize_section,
+                upstream_handoffs,
+                upstream_audit,
+                cacheable,
+            ) = _run_upstream(
+                data,
+                input_path.suffix,
+                created_at,
+                templates,
+                fill_mode=resolved_fill_mode,
+                ocr_model=resolved_ocr_model,
+                ocr_mode=resolved_ocr_mode,
+                field_model=resolved_field_model,
+                api_key=api_key,
+                page_count=page_count,
+                field_fill=field_fill,
+                blobs=blobs,
+                external_text=external_text,
+                file_hash=ingest_section.file_hash,
+                duplicates=duplicates,
+                images=fingerprint.images if fingerprint is not None else None,
+            )
+        reused = any(a.event == "dedup_hit" for a in upstream_audit)
+        handoffs.extend(upstream_handoffs)
+        audit.extend(upstream_audit)
+        upstream = CacheEntry(
+            key=key or "",
+            extract=extract_section,
+            classify=classify_section,
+            normalize=normalize_section,
+            handoffs=upstream_handoffs,
+        )
+        if cache is not None and key is not None and cacheable:
+            cache.put(upstream)
+        if dedup is not None and settings is not None and fingerprint is not None and not reused and cacheable:
+            dedup.add(settings, fingerprint, ingest_section.file_hash, upstream.model_copy(update={"key": settings}))
+
+    if external_text and blobs is not None:
+        extract_section = externalize_text(extract_section, blobs)
+    template = get_template(templates, classify_section.document_type)
+    validate_section, validate_handoffs, validate_audit = _run_validate(normalize_section, template, created_at)
+    handoffs.extend(validate_handoffs)
+    audit.extend(validate_audit)
 
     metadata = DocumentMetadata(
         document_id=ingest_section.file_hash[:12],
-        source_path=str(input_path),
+        source_path=source_path or str(input_path),
         file_name=input_path.name,
         file_hash=ingest_section.file_hash,
         file_size_bytes=ingest_section.file_size_bytes,
@@ -151,8 +584,194 @@ def run_pipeline(
         handoffs=handoffs,
         audit=audit,
     )
-    package.render = render(package)
+    return _render_package(package, created_at)
+
+
+def _near_duplicate_handoff(match: DedupMatch, created_at: str, reused: str, *, blocking: bool = True) -> Handoff:
+    # Blocking by default: whatever was reused came from another document, which may belong to someone else.
+    return Handoff(
+        stage=PipelineStage.EXTRACT,
+        reason=HandoffReason.NEAR_DUPLICATE,
+        action=HandoffAction.MANUAL_REVIEW,
+        message=(
+            f"Content matches earlier document {match.file_hash[:12]} "
+            f"({match.kind} fingerprint distance {match.distance}); {reused}."
+        ),
+        created_at=created_at,
+        blocking=blocking,
+    )
+
+
+def _run_validate(
+    normalize_section: NormalizeSection, template: DocumentTemplate, created_at: str
+) -> tuple[ValidateSection, list[Handoff], list[Audit]]:
+    with stage_timer(PipelineStage.VALIDATE):
+        validate_section, validate_handoffs = validate(
+            normalize_section=normalize_section,
+            template=template,
+            created_at=created_at,
+        )
+    audit = [
+        Audit(stage=PipelineStage.VALIDATE, event="completed", detail="Validation completed", created_at=created_at)
+    ]
+    return validate_section, validate_handoffs, audit
+
+
+def _render_package(package: DocumentReviewPackage, created_at: str) -> DocumentReviewPackage:
+    with stage_timer(PipelineStage.RENDER):
+        package.render = render(package)
     package.audit.append(
         Audit(stage=PipelineStage.RENDER, event="completed", detail="Render completed", created_at=created_at)
     )
     return package
+
+
+RERUN_STAGES = (PipelineStage.CLASSIFY, PipelineStage.NORMALIZE, PipelineStage.VALIDATE, PipelineStage.RENDER)
+_STAGE_ORDER = {stage: index for index, stage in enumerate(PipelineStage)}
+
+
+def _handoff_identity(handoff: Handoff) -> tuple[str, str, str | None, str]:
+    return handoff.stage.value, handoff.reason.value, handoff.field_name, handoff.message
+
+
+def _carry_resolutions(recomputed: list[Handoff], previous: list[Handoff]) -> list[Handoff]:
+    """Keep reviewer resolutions for handoffs that the rerun raises again."""
+    resolved = {_handoff_identity(h): h for h in previous if h.resolved}
+    carried: list[Handoff] = []
+    for handoff in recomputed:
+        earlier = resolved.get(_handoff_identity(handoff))
+        if earlier is not None:
+            handoff = handoff.model_copy(
+                update={
+                    "resolved": True,
+                    "resolved_at": earlier.resolved_at,
+                    "resolution": earlier.resolution,
+                    "resolved_by": earlier.resolved_by,
+                }
+            )
+        carried.append(handoff)
+    return carried
+
+
+def _keep_review_proposals(recomputed: NormalizeSection, previous: NormalizeSection) -> NormalizeSection:
+    """Re-append proposals that did not come from the pipeline (e.g. patches)."""
+    kept = [
+        (field_name, proposal)
+        for field_name, proposals in previous.fields.items()
+        for proposal in proposals
+        if proposal.source not in PIPELINE_SOURCES
+    ]
+    return recomputed.model_copy(update={"fields": extend_field_proposals(recomputed.fields, kept)})
+
+
+def _text_blobs(extract_section: ExtractSection, blobs: BlobStore | None) -> BlobStore:
+    ref = extract_section.text_ref or ""
+    if blobs is None or not blobs.exists(ref):
+        raise ValueError(f"extract text is stored as {ref}; pass the blob store that holds it")
+    return blobs
+
+
+def rerun_pipeline(
+    package: DocumentReviewPackage,
+    from_stage: PipelineStage | str,
+    template_dir: Path,
+    created_at: str,
+    *,
+    fill_mode: str | None = None,
+    field_model: str | None = None,
+    templates: dict[str, DocumentTemplate] | None = None,
+    blobs: BlobStore | None = None,
+) -> DocumentReviewPackage:
+    """Recompute ``from_stage`` and everything after it from an existing artifact.
+
+    Sections upstream of ``from_stage`` (always ingest and extract, so no OCR)
+    are reused as-is. Text kept in a blob store (``extract.text_ref``) is read
+    back from ``blobs``, in chunks when it is above the stream threshold.
+    Downstream handoffs are replaced by the recomputed ones, keeping earlier
+    resolutions; the audit trail is appended to, never rewritten.
+    """
+    stage = PipelineStage(from_stage)
+    if stage not in RERUN_STAGES:
+        raise ValueError(f"from_stage must be one of: {', '.join(s.value for s in RERUN_STAGES)}")
+    if templates is None:
+        templates = get_registry(template_dir).templates()
+    resolved_fill_mode = _env_or_value(fill_mode, "DOCREVIEW_FILL_MODE", "auto").lower()
+    resolved_field_model = (
+        field_model
+        or os.environ.get("DOCREVIEW_FIELD_MODEL")
+        or package.extract.model
+        or os.environ.get("DOCREVIEW_OCR_MODEL", "gpt-4o")
+    )
+
+    def recomputed(section_stage: PipelineStage) -> bool:
+        return _STAGE_ORDER[section_stage] >= _STAGE_ORDER[stage]
+
+    kept = [h for h in package.handoffs if not recomputed(h.stage)]
+    new_handoffs: list[Handoff] = []
+    audit = list(package.audit)
+    audit.append(
+        Audit(
+            stage=stage,
+            event="rerun",
+            detail=f"Re-running from {stage.value}; upstream sections reused from the existing artifact.",
+            created_at=created_at,
+        )
+    )
+
+    text = package.extract.text
+    text_ref = package.extract.text_ref
+    store: BlobStore | None = None
+    if text_ref and (recomputed(PipelineStage.CLASSIFY) or recomputed(PipelineStage.NORMALIZE)):
+        store = _text_blobs(package.extract, blobs)
+        # Text too large to load is re-read in chunks, exactly as the first run streamed it.
+        if (package.extract.text_bytes or 0) <= stream_threshold_bytes():
+            text = store.read_bytes(text_ref).decode("utf-8")
+            store = None
+    classify_section = package.classify
+    if recomputed(PipelineStage.CLASSIFY):
+        if store is not None and text_ref:
+            classify_section, classify_handoffs, classify_audit = _run_classify_stream(
+                store.iter_text(text_ref), created_at, templates
+            )
+        else:
+            classify_section, classify_handoffs, classify_audit = _run_classify(text, created_at, templates)
+        new_handoffs.extend(classify_handoffs)
+        audit.extend(classify_audit)
+    template = get_template(templates, classify_section.document_type)
+
+    normalize_section = package.normalize
+    if recomputed(PipelineStage.NORMALIZE):
+        if store is not None and text_ref:
+            normalize_section, normalize_handoffs, normalize_audit, _ = _run_normalize_stream(
+                store.iter_text(text_ref), template, created_at, fill_mode=resolved_fill_mode
+            )
+        else:
+            normalize_section, normalize_handoffs, normalize_audit, _ = _run_normalize(
+                text,
+                template,
+                created_at,
+                fill_mode=resolved_fill_mode,
+                field_model=resolved_field_model,
+                api_key=os.environ.get("OPENAI_API_KEY"),
+            )
+        normalize_section = _keep_review_proposals(normalize_section, package.normalize)
+        new_handoffs.extend(normalize_handoffs)
+        audit.extend(normalize_audit)
+
+    validate_section = package.validate_section
+    if recomputed(PipelineStage.VALIDATE):
+        validate_section, validate_handoffs, validate_audit = _run_validate(normalize_section, template, created_at)
+        new_handoffs.extend(validate_handoffs)
+        audit.extend(validate_audit)
+
+    updated = package.model_copy(
+        update={
+            "classify": classify_section,
+            "normalize": normalize_section,
+            "validate_section": validate_section,
+            "handoffs": kept + _carry_resolutions(new_handoffs, package.handoffs),
+            "audit": audit,
+            "metrics": None,
+        }
+    )
+    return _render_package(updated, created_at)
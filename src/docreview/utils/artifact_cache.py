@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from docreview.core.schemas import ClassifySection, ExtractSection, Handoff, NormalizeSection
+from docreview.core.template_loader import DocumentTemplate, template_derived
+
+CACHE_FORMAT_VERSION = "1"
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_CACHE_DIRNAME = ".docreview-cache"
+
+
+class CacheEntry(BaseModel):
+    key: str
+    extract: ExtractSection
+    classify: ClassifySection
+    normalize: NormalizeSection
+    handoffs: list[Handoff] = Field(default_factory=list)
+
+
+def template_fingerprint(templates: dict[str, DocumentTemplate]) -> str:
+    digest = hashlib.sha256()
+    for doc_type in sorted(templates):
+        template = templates[doc_type]
+        digest.update(f"{doc_type}@{template.version}\n".encode("utf-8"))
+        digest.update(template_derived(template, "model_json", lambda t: t.model_dump_json().encode("utf-8")))
+    return digest.hexdigest()
+
+
+def cache_key(
+    file_hash: str,
+    templates: dict[str, DocumentTemplate],
+    *,
+    ocr_model: str,
+    ocr_mode: str = "auto",
+    field_model: str,
+    fill_mode: str,
+    llm_available: bool,
+) -> str:
+    """Content address for upstream stage outputs of one document."""
+    payload = {
+        "format": CACHE_FORMAT_VERSION,
+        "file_hash": file_hash,
+        "templates": template_fingerprint(templates),
+        "ocr_model": ocr_model,
+        "ocr_mode": ocr_mode,
+        "field_model": field_model,
+        "fill_mode": fill_mode,
+        "llm_available": llm_available,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def settings_key(
+    templates: dict[str, DocumentTemplate],
+    *,
+    ocr_model: str,
+    ocr_mode: str = "auto",
+    field_model: str,
+    fill_mode: str,
+    llm_available: bool,
+) -> str:
+    """Content address of the settings that shape upstream outputs, for any document."""
+    return cache_key(
+        "",
+        templates,
+        ocr_model=ocr_model,
+        ocr_mode=ocr_mode,
+        field_model=field_model,
+        fill_mode=fill_mode,
+        llm_available=llm_available,
+    )
+
+
+class ArtifactCache:
+    """On-disk, size-bounded LRU cache of extract/classify/normalize outputs.
+
+    Recency is tracked through file mtimes, so several processes can share one
+    cache directory without coordination; eviction is best effort.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            entry = CacheEntry.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            return None
+        if entry.key != key:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, entry: CacheEntry) -> None:
+        path = self._path(entry.key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = entry.model_dump_json().encode("utf-8")
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, path)
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(payload)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[int, int, Path]]:
+        entries: list[tuple[int, int, Path]] = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda item: (item[0], item[2].name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._size = total
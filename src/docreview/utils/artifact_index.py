@@ -0,0 +1,282 @@
+"""Incremental SQLite index over artifact folders for fleet-wide queries."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from docreview.utils.artifact_reader import ArtifactError, LazyArtifact
+from docreview.utils.patch_log import PatchLog, read_artifact
+
+# Bump when the tables change; an index with another version is rebuilt from scratch.
+SCHEMA_VERSION = 2
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    document_id TEXT NOT NULL,
+    audit_events INTEGER NOT NULL,
+    file_hash TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    document_type TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    validation_ok INTEGER NOT NULL,
+    open_handoffs INTEGER NOT NULL,
+    open_blocking_handoffs INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_document_type ON artifacts (document_type);
+CREATE INDEX IF NOT EXISTS artifacts_document_id ON artifacts (document_id);
+CREATE INDEX IF NOT EXISTS artifacts_file_hash ON artifacts (file_hash);
+-- Patches and reruns only append to the audit trail, so the version with the
+-- most audit events is the latest; the newest file breaks ties.
+CREATE VIEW IF NOT EXISTS latest_artifacts AS
+SELECT * FROM artifacts a
+WHERE NOT EXISTS (
+    SELECT 1 FROM artifacts b
+    WHERE b.document_id = a.document_id
+    AND (b.audit_events, b.mtime_ns, b.path) > (a.audit_events, a.mtime_ns, a.path)
+);
+CREATE TABLE IF NOT EXISTS handoffs (
+    path TEXT NOT NULL REFERENCES artifacts (path) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    action TEXT NOT NULL,
+    field_name TEXT,
+    blocking INTEGER NOT NULL,
+    resolved INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS handoffs_path ON handoffs (path);
+CREATE INDEX IF NOT EXISTS handoffs_reason ON handoffs (reason);
+CREATE TABLE IF NOT EXISTS fields (
+    path TEXT NOT NULL REFERENCES artifacts (path) ON DELETE CASCADE,
+    field_name TEXT NOT NULL,
+    value TEXT,
+    confidence REAL,
+    source TEXT,
+    status TEXT,
+    missing_required INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fields_path ON fields (path);
+CREATE INDEX IF NOT EXISTS fields_name_value ON fields (field_name, value);
+"""
+DROP_SCHEMA = """
+DROP VIEW IF EXISTS latest_artifacts;
+DROP TABLE IF EXISTS fields;
+DROP TABLE IF EXISTS handoffs;
+DROP TABLE IF EXISTS artifacts;
+"""
+
+
+class IndexStats(BaseModel):
+    scanned: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+
+
+class IndexedArtifact(BaseModel):
+    path: str
+    document_id: str
+    file_hash: str
+    file_name: str
+    document_type: str
+    confidence: float
+    validation_ok: bool
+    open_handoffs: int
+    open_blocking_handoffs: int
+
+
+def iter_artifact_files(root: Path) -> Iterator[Path]:
+    """Artifact JSON files under ``root``, skipping hidden folders and batch summaries."""
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+        for name in sorted(files):
+            if name.endswith(".json") and not name.startswith(("batch_summary_", ".")):
+                yield Path(directory) / name
+
+
+def _field_text(value: object) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _artifact_stat(path: Path) -> tuple[int, int]:
+    """Change stamp for an artifact, covering its patch log so a logged patch re-indexes it."""
+    stat = path.stat()
+    mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    log = PatchLog(path)
+    if log.exists():
+        log_stat = log.path.stat()
+        mtime_ns, size = max(mtime_ns, log_stat.st_mtime_ns), size + log_stat.st_size
+    return mtime_ns, size
+
+
+class ArtifactIndex:
+    """SQLite index keyed by artifact path; rows are refreshed only for new or changed files.
+
+    Every indexed version of a document keeps its row; queries see only the
+    latest version of each document unless asked for all of them.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.connection.executescript(DROP_SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> ArtifactIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def update(self, roots: list[Path]) -> IndexStats:
+        stats = IndexStats()
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self.connection.execute("SELECT path, mtime_ns, size FROM artifacts")
+        }
+        seen: set[str] = set()
+        with self.connection:
+            for root in roots:
+                for artifact_path in iter_artifact_files(root.resolve()):
+                    stats.scanned += 1
+                    key = str(artifact_path)
+                    seen.add(key)
+                    mtime_ns, size = _artifact_stat(artifact_path)
+                    if known.get(key) == (mtime_ns, size):
+                        stats.unchanged += 1
+                        continue
+                    self.connection.execute("DELETE FROM artifacts WHERE path = ?", (key,))
+                    try:
+                        self._insert(key, mtime_ns, size, read_artifact(artifact_path))
+                    except (ArtifactError, ValidationError, OSError):
+                        stats.failed += 1
+                        continue
+                    stats.updated += 1
+            prefixes = tuple(str(root.resolve()) + os.sep for root in roots)
+            stale = [(path,) for path in known if path.startswith(prefixes) and path not in seen]
+            self.connection.executemany("DELETE FROM artifacts WHERE path = ?", stale)
+            stats.removed = len(stale)
+        return stats
+
+    def _insert(self, path: str, mtime_ns: int, size: int, artifact: LazyArtifact) -> None:
+        metadata = artifact.metadata
+        classify = artifact.classify
+        validate = artifact.validate_section
+        handoffs = artifact.handoffs
+        normalize = artifact.section("normalize")
+        open_handoffs = [h for h in handoffs if not h.resolved]
+        self.connection.execute(
+            "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                mtime_ns,
+                size,
+                metadata.document_id,
+                len(artifact.section("audit")),
+                metadata.file_hash,
+                metadata.file_name,
+                classify.document_type,
+                classify.confidence,
+                validate.ok,
+                len(open_handoffs),
+                sum(1 for h in open_handoffs if h.blocking),
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO handoffs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (path, position, h.stage.value, h.reason.value, h.action.value, h.field_name, h.blocking, h.resolved)
+                for position, h in enumerate(handoffs)
+            ],
+        )
+        missing = set(validate.missing_required_fields)
+        names = list(dict.fromkeys([*normalize.fields, *validate.field_status, *missing]))
+        rows = []
+        for name in names:
+            proposals = normalize.fields.get(name) or []
+            latest = proposals[-1] if proposals else None
+            status = validate.field_status.get(name)
+            rows.append(
+                (
+                    path,
+                    name,
+                    _field_text(latest.value) if latest else None,
+                    latest.confidence if latest else None,
+                    latest.source if latest else None,
+                    status.value if status else None,
+                    name in missing,
+                )
+            )
+        self.connection.executemany("INSERT INTO fields VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def query(
+        self,
+        *,
+        document_type: str | None = None,
+        blocking: bool = False,
+        invalid: bool = False,
+        reason: str | None = None,
+        missing_field: str | None = None,
+        field_equals: tuple[str, str] | None = None,
+        all_versions: bool = False,
+        limit: int | None = None,
+    ) -> list[IndexedArtifact]:
+        """Artifacts matching every given filter, ordered by path.
+
+        Only the latest version of each document is considered, so a handoff
+        resolved by a later patch no longer matches; ``all_versions`` searches
+        every indexed version.
+
+        Child-table filters are uncorrelated ``IN`` subqueries so each one is
+        evaluated once through its index instead of once per artifact.
+        """
+        clauses: list[str] = []
+        params: list[object] = []
+        if document_type is not None:
+            clauses.append("a.document_type = ?")
+            params.append(document_type.lower())
+        if blocking:
+            clauses.append("a.open_blocking_handoffs > 0")
+        if invalid:
+            clauses.append("a.validation_ok = 0")
+        if reason is not None:
+            clauses.append("a.path IN (SELECT path FROM handoffs WHERE reason = ? AND resolved = 0)")
+            params.append(reason.lower())
+        if missing_field is not None:
+            clauses.append(
+                "a.path IN (SELECT path FROM fields WHERE field_name = ? AND (missing_required = 1 OR value IS NULL))"
+            )
+            params.append(missing_field)
+        if field_equals is not None:
+            clauses.append("a.path IN (SELECT path FROM fields WHERE field_name = ? AND value = ?)")
+            params.extend(field_equals)
+        table = "artifacts" if all_versions else "latest_artifacts"
+        sql = "SELECT " + ", ".join(f"a.{name}" for name in IndexedArtifact.model_fields) + f" FROM {table} a"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY a.path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        names = list(IndexedArtifact.model_fields)
+        return [
+            IndexedArtifact.model_validate(dict(zip(names, row))) for row in self.connection.execute(sql, params)
+        ]
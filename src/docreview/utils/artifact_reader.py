@@ -0,0 +1,196 @@
+"""Lazy, section-wise access to pipeline JSON artifacts.
+
+Artifacts written in the canonical or pretty JSON styles put every top-level
+key on its own line at two-space indent, and JSON strings never contain raw
+newlines. That lets :class:`LazyArtifact` find each section's byte span with a
+single scan and validate only the sections a caller asks for, leaving e.g. a
+multi-megabyte ``extract.text`` untouched. Any other layout falls back to a
+full parse.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from docreview.core.schemas import (
+    Audit,
+    ClassifySection,
+    DocumentMetadata,
+    DocumentReviewPackage,
+    ExtractSection,
+    Handoff,
+    IngestSection,
+    MetricsSection,
+    NormalizeSection,
+    RenderSection,
+    ValidateSection,
+)
+from docreview.utils.blob_store import BlobStore, check_blob_refs
+
+SECTION_TYPES: dict[str, Any] = {
+    "schema_version": str,
+    "metadata": DocumentMetadata,
+    "ingest": IngestSection,
+    "extract": ExtractSection,
+    "classify": ClassifySection,
+    "normalize": NormalizeSection,
+    "validate": ValidateSection,
+    "render": RenderSection,
+    "handoffs": list[Handoff],
+    "audit": list[Audit],
+    "metrics": MetricsSection | None,
+}
+_DEFAULTS: dict[str, Any] = {"schema_version": "1.0.0", "handoffs": [], "audit": [], "metrics": None}
+_ADAPTERS = {name: TypeAdapter(section_type) for name, section_type in SECTION_TYPES.items()}
+_TOP_LEVEL_KEY = re.compile(rb'\n  "([A-Za-z_]+)": ')
+_TOP_LEVEL_MARK = b'\n  "'
+
+
+class ArtifactError(ValueError):
+    """Raised when an artifact section is missing or cannot be parsed."""
+
+
+def _section_spans(data: bytes) -> dict[str, tuple[int, int]] | None:
+    body = data.rstrip()
+    if not (body.startswith(b'{\n  "') and body.endswith(b"\n}")):
+        return None
+    matches = []
+    position = body.find(_TOP_LEVEL_MARK)
+    while position != -1:
+        match = _TOP_LEVEL_KEY.match(body, position)
+        if match is None:
+            return None
+        matches.append(match)
+        position = body.find(_TOP_LEVEL_MARK, match.end())
+    spans: dict[str, tuple[int, int]] = {}
+    for match, following in zip(matches, matches[1:] + [None]):
+        if following is None:
+            end = len(body) - 2
+        else:
+            end = following.start() - 1
+            if body[end : end + 1] != b",":
+                return None
+        spans[match.group(1).decode("ascii")] = (match.end(), end)
+    return spans
+
+
+class LazyArtifact:
+    """Read individual sections of one artifact on demand."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self._spans = _section_spans(data)
+        self._parsed: dict[str, Any] | None = None
+        self._sections: dict[str, Any] = {}
+
+    @classmethod
+    def from_path(cls, path: Path) -> LazyArtifact:
+        return cls(path.read_bytes())
+
+    def _full(self) -> dict[str, Any]:
+        if self._parsed is None:
+            try:
+                parsed = json.loads(self.data)
+            except ValueError as exc:
+                raise ArtifactError(f"invalid JSON: {exc}") from exc
+            if not isinstance(parsed, dict):
+                raise ArtifactError("artifact is not a JSON object")
+            self._parsed = parsed
+        return self._parsed
+
+    def section(self, name: str) -> Any:
+        """Validated value of the top-level section ``name`` (by JSON alias)."""
+        if name not in SECTION_TYPES:
+            raise KeyError(name)
+        if name in self._sections:
+            return self._sections[name]
+        adapter = _ADAPTERS[name]
+        if self._spans is not None and name in self._spans:
+            start, end = self._spans[name]
+            value = adapter.validate_json(self.data[start:end])
+        else:
+            raw = self._full() if self._spans is None else {}
+            if name in raw:
+                value = adapter.validate_python(raw[name])
+            elif name in _DEFAULTS:
+                value = adapter.validate_python(_DEFAULTS[name])
+            else:
+                raise ArtifactError(f"artifact has no '{name}' section")
+        self._sections[name] = value
+        return value
+
+    @property
+    def metadata(self) -> DocumentMetadata:
+        return self.section("metadata")
+
+    @property
+    def classify(self) -> ClassifySection:
+        return self.section("classify")
+
+    @property
+    def validate_section(self) -> ValidateSection:
+        return self.section("validate")
+
+    @property
+    def render(self) -> RenderSection:
+        return self.section("render")
+
+    @property
+    def handoffs(self) -> list[Handoff]:
+        return self.section("handoffs")
+
+    @property
+    def metrics(self) -> MetricsSection | None:
+        return self.section("metrics")
+
+    def package(self) -> DocumentReviewPackage:
+        return DocumentReviewPackage.model_validate_json(self.data)
+
+
+def validate_artifact(data: bytes, blobs: BlobStore | None = None, *, verify_blobs: bool = False) -> list[str]:
+    """Validate an artifact section by section; returns error messages.
+
+    Each section is validated and dropped before the next, so peak memory is
+    bounded by the largest section rather than the whole package. Errors found
+    on the fast path are confirmed with a full validation, which also covers
+    layouts the section scan does not understand.
+
+    Extracted text may be inline or a blob reference with a preview; both
+    forms are valid. With ``blobs``, every reference must also resolve to a
+    stored blob of the recorded size, and with ``verify_blobs`` to matching
+    content.
+    """
+    errors, extract = _validate_sections(data)
+    if errors or blobs is None or extract is None:
+        return errors
+    return check_blob_refs(extract, blobs, verify=verify_blobs)
+
+
+def _validate_sections(data: bytes) -> tuple[list[str], ExtractSection | None]:
+    spans = _section_spans(data)
+    if spans is not None:
+        try:
+            extract = None
+            for name, adapter in _ADAPTERS.items():
+                if name in spans:
+                    start, end = spans[name]
+                    value = adapter.validate_json(data[start:end])
+                    if name == "extract":
+                        extract = value
+                elif name not in _DEFAULTS:
+                    raise ArtifactError(name)
+            return [], extract
+        except (ValidationError, ArtifactError):
+            pass
+    try:
+        package = DocumentReviewPackage.model_validate_json(data)
+    except ValidationError as exc:
+        return [
+            f"{'.'.join(str(part) for part in error['loc']) or '<root>'}: {error['msg']}" for error in exc.errors()
+        ], None
+    return [], package.extract
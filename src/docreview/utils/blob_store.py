@@ -0,0 +1,130 @@
+"""Content-addressed storage for payloads too large to embed in artifacts.
+
+Blobs live under ``<root>/<first two hex digits>/<sha256>`` and are referred to
+as ``sha256:<hex>``. Writing the same content twice stores it once, so every
+version of a patched artifact shares one copy of its extracted text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from docreview.core.schemas import ExtractSection
+from docreview.utils.text_stream import PREVIEW_CHARS, iter_text_chunks
+
+DEFAULT_BLOB_DIRNAME = ".docreview-blobs"
+REF_PREFIX = "sha256:"
+
+
+class BlobStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path(self, ref: str) -> Path:
+        if not ref.startswith(REF_PREFIX) or len(ref) != len(REF_PREFIX) + 64:
+            raise ValueError(f"not a blob reference: {ref!r}")
+        digest = ref[len(REF_PREFIX) :]
+        return self.root / digest[:2] / digest
+
+    def exists(self, ref: str) -> bool:
+        return self.path(ref).is_file()
+
+    def put_chunks(self, chunks: Iterable[bytes]) -> tuple[str, int]:
+        """Store streamed content; returns its reference and size in bytes."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        handle = tempfile.NamedTemporaryFile(dir=self.root, prefix=".tmp-", delete=False)
+        try:
+            with handle:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    handle.write(chunk)
+                    size += len(chunk)
+            ref = REF_PREFIX + digest.hexdigest()
+            target = self.path(ref)
+            if target.exists():
+                os.unlink(handle.name)
+            else:
+                target.parent.mkdir(exist_ok=True)
+                os.replace(handle.name, target)
+        except BaseException:
+            if os.path.exists(handle.name):
+                os.unlink(handle.name)
+            raise
+        return ref, size
+
+    def put(self, data: bytes) -> str:
+        return self.put_chunks([data])[0]
+
+    def read_bytes(self, ref: str) -> bytes:
+        return self.path(ref).read_bytes()
+
+    def iter_text(self, ref: str) -> Iterator[str]:
+        """Stream a UTF-8 blob back as whole-line text chunks without loading it."""
+        with self.path(ref).open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                chunks = iter_text_chunks(mapped)
+                try:
+                    yield from chunks
+                finally:
+                    chunks.close()
+
+
+def externalize_text(section: ExtractSection, blobs: BlobStore) -> ExtractSection:
+    """Move inline text longer than the preview into ``blobs``; other sections are returned as-is."""
+    if section.text_ref is not None or len(section.text) <= PREVIEW_CHARS:
+        return section
+    data = section.text.encode("utf-8")
+    return section.model_copy(
+        update={"text": section.text[:PREVIEW_CHARS], "text_ref": blobs.put(data), "text_bytes": len(data)}
+    )
+
+
+def _blob_refs(section: ExtractSection) -> list[tuple[str, str]]:
+    refs = [("extract.text_ref", section.text_ref)] if section.text_ref else []
+    return refs + [(f"extract.image_refs.{index}", ref) for index, ref in enumerate(section.image_refs)]
+
+
+def copy_blob_refs(section: ExtractSection, source: BlobStore, target: BlobStore) -> None:
+    """Copy the blobs ``section`` references from ``source`` into ``target`` unless it already has them."""
+    for location, ref in _blob_refs(section):
+        if target.exists(ref):
+            continue
+        if not source.exists(ref):
+            raise ValueError(f"{location}: blob {ref} not found in {source.root}")
+        with source.path(ref).open("rb") as handle:
+            target.put_chunks(iter(lambda: handle.read(1 << 20), b""))
+
+
+def check_blob_refs(section: ExtractSection, blobs: BlobStore, *, verify: bool = False) -> list[str]:
+    """Problems with the blobs an extract section references; ``verify`` also re-hashes them."""
+    refs = _blob_refs(section)
+    if refs and not blobs.root.is_dir():
+        return [f"extract references {len(refs)} blob(s) but there is no blob store at {blobs.root}"]
+    errors: list[str] = []
+    for location, ref in refs:
+        path = blobs.path(ref)
+        if not path.is_file():
+            errors.append(f"{location}: blob {ref} not found in {blobs.root}")
+            continue
+        if location == "extract.text_ref" and section.text_bytes is not None:
+            size = path.stat().st_size
+            if size != section.text_bytes:
+                errors.append(f"{location}: blob is {size} bytes, artifact records {section.text_bytes}")
+                continue
+        if verify and REF_PREFIX + _file_sha256(path) != ref:
+            errors.append(f"{location}: blob content does not match {ref}")
+    return errors
+
+
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
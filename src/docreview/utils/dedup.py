@@ -0,0 +1,251 @@
+"""Near-duplicate detection so re-uploaded documents skip OCR and LLM calls.
+
+Documents with text (plain text files and PDFs with a text layer) are
+fingerprinted with a 64-bit SimHash over word 3-shingles. Scanned PDFs and
+images get a 64-bit difference hash (dHash) per rendered page, which needs
+Pillow (``pip install .[pdf]``); without it such documents are not
+fingerprinted. Two documents match when every hash is within a Hamming
+distance threshold.
+
+Fingerprints only find candidates. Documents that follow one template (two
+people's paystubs) are near-identical by any text hash, and a dHash sees little
+more than the page layout. So the pipeline reuses field values only for an
+exact text match and OCR text only for an identical file; any other match is
+just reported.
+
+:class:`DedupStore` keeps fingerprints in SQLite next to the upstream outputs
+they produced. Each hash is split into eight 8-bit bands that are indexed, so
+by pigeonhole any match within seven bits shares at least one band with the
+query and lookups never scan the whole store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import io
+import json
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from docreview.utils.artifact_cache import CacheEntry
+from docreview.utils.pdf_extract import extract_text_layer, pdf_to_images
+from docreview.utils.pdf_structure import Buffer
+from docreview.utils.text_stream import TEXT_EXTENSIONS
+
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".tiff", ".webp"})
+DEFAULT_TEXT_THRESHOLD = 3
+DEFAULT_IMAGE_THRESHOLD = 6
+DEFAULT_DEDUP_DBNAME = ".docreview-dedup.sqlite"
+SIMHASH_MAX_SHINGLES = 4096
+BANDS = 8
+BAND_BITS = 64 // BANDS
+
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    settings TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    file_hash TEXT NOT NULL,
+    hashes TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    settings TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    band INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    document INTEGER NOT NULL REFERENCES documents (id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS bands_lookup ON bands (settings, kind, band, value);
+"""
+
+
+class Fingerprint(BaseModel):
+    kind: str
+    hashes: list[int]
+    # Pages of a scanned PDF rendered for hashing, handed on so extract does not render them again.
+    images: list[bytes] = Field(default_factory=list, exclude=True, repr=False)
+
+
+class DedupMatch(BaseModel):
+    file_hash: str
+    kind: str
+    distance: int
+    entry: CacheEntry
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over word 3-shingles of case-folded text.
+
+    Shingles are counted before hashing, so repeated lines cost one hash.
+    Long documents keep only the shingles with the smallest hashes (a bottom-k
+    sample), which is deterministic and still stable under small edits.
+    """
+    words = text.lower().split()
+    counts = Counter(zip(words, words[1:], words[2:])) if len(words) >= 3 else Counter((word,) for word in words)
+    weights: dict[int, int] = {}
+    for shingle, count in counts.items():
+        value = _hash64(" ".join(shingle).encode("utf-8"))
+        weights[value] = weights.get(value, 0) + count
+    items = heapq.nsmallest(SIMHASH_MAX_SHINGLES, weights.items())
+    total = sum(weight for _, weight in items)
+    result = 0
+    for bit in range(64):
+        mask = 1 << bit
+        if 2 * sum(weight for value, weight in items if value & mask) > total:
+            result |= mask
+    return result
+
+
+def dhash(image_bytes: bytes) -> int | None:
+    """64-bit difference hash of an image; None without Pillow or for unreadable images."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            pixels = image.convert("L").resize((9, 8), Image.Resampling.LANCZOS).tobytes()
+    except (OSError, ValueError):
+        return None
+    result = 0
+    for row in range(8):
+        for column in range(8):
+            result = (result << 1) | (pixels[row * 9 + column] > pixels[row * 9 + column + 1])
+    return result
+
+
+def hamming(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def document_fingerprint(data: Buffer, extension: str) -> Fingerprint | None:
+    """Fingerprint a document without OCR; None when it cannot be fingerprinted cheaply.
+
+    For a scanned PDF the rendered pages are kept on :attr:`Fingerprint.images`.
+    """
+    ext = extension.lower()
+    if ext in TEXT_EXTENSIONS:
+        return Fingerprint(kind="text", hashes=[simhash(str(data, "utf-8", errors="replace"))])
+    if ext == ".pdf":
+        text = extract_text_layer(data)
+        if text:
+            return Fingerprint(kind="text", hashes=[simhash(text)])
+        images = pdf_to_images(data)
+        pages = [dhash(page) for page in images]
+    elif ext in IMAGE_EXTENSIONS:
+        images = []
+        pages = [dhash(bytes(data))]
+    else:
+        return None
+    if not pages or any(page is None for page in pages):
+        return None
+    return Fingerprint(kind="image", hashes=[page for page in pages if page is not None], images=images)
+
+
+def _bands(value: int) -> list[tuple[int, int]]:
+    mask = (1 << BAND_BITS) - 1
+    return [(band, (value >> (band * BAND_BITS)) & mask) for band in range(BANDS)]
+
+
+class DedupStore:
+    """SQLite store of fingerprints and the upstream outputs they produced.
+
+    Entries are partitioned by ``settings`` (see
+    :func:`~docreview.utils.artifact_cache.settings_key`) so results are only
+    reused under the same templates, models and fill mode.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        text_threshold: int = DEFAULT_TEXT_THRESHOLD,
+        image_threshold: int = DEFAULT_IMAGE_THRESHOLD,
+    ) -> None:
+        if max(text_threshold, image_threshold) >= BANDS:
+            raise ValueError(f"thresholds must be below {BANDS} bits")
+        self.db_path = db_path
+        self.thresholds = {"text": text_threshold, "image": image_threshold}
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> DedupStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def find(self, settings: str, fingerprint: Fingerprint) -> DedupMatch | None:
+        """Closest stored document within the threshold for this fingerprint kind."""
+        matches = self.matches(settings, fingerprint)
+        return matches[0] if matches else None
+
+    def matches(self, settings: str, fingerprint: Fingerprint) -> list[DedupMatch]:
+        """Every stored document within the threshold, closest first."""
+        first = fingerprint.hashes[0]
+        clauses = " OR ".join("(band = ? AND value = ?)" for _ in range(BANDS))
+        params: list[object] = [settings, fingerprint.kind]
+        for band, value in _bands(first):
+            params.extend((band, value))
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT id, hashes FROM documents WHERE id IN "
+                f"(SELECT document FROM bands WHERE settings = ? AND kind = ? AND ({clauses}))",
+                params,
+            ).fetchall()
+        threshold = self.thresholds[fingerprint.kind]
+        close: list[tuple[int, int]] = []
+        for document, hashes_json in rows:
+            hashes = [int(value, 16) for value in json.loads(hashes_json)]
+            if len(hashes) != len(fingerprint.hashes):
+                continue
+            distance = max(hamming(left, right) for left, right in zip(hashes, fingerprint.hashes))
+            if distance <= threshold:
+                close.append((distance, document))
+        matches = []
+        for distance, document in sorted(close):
+            with self._lock:
+                file_hash, entry_json = self.connection.execute(
+                    "SELECT file_hash, entry FROM documents WHERE id = ?", (document,)
+                ).fetchone()
+            matches.append(
+                DedupMatch(
+                    file_hash=file_hash,
+                    kind=fingerprint.kind,
+                    distance=distance,
+                    entry=CacheEntry.model_validate_json(entry_json),
+                )
+            )
+        return matches
+
+    def add(self, settings: str, fingerprint: Fingerprint, file_hash: str, entry: CacheEntry) -> None:
+        hashes_json = json.dumps([f"{value:016x}" for value in fingerprint.hashes])
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO documents (settings, kind, file_hash, hashes, entry) VALUES (?, ?, ?, ?, ?)",
+                (settings, fingerprint.kind, file_hash, hashes_json, entry.model_dump_json()),
+            )
+            self.connection.executemany(
+                "INSERT INTO bands VALUES (?, ?, ?, ?, ?)",
+                [
+                    (settings, fingerprint.kind, band, value, cursor.lastrowid)
+                    for band, value in _bands(fingerprint.hashes[0])
+                ],
+            )
@@ -0,0 +1,184 @@
+"""Rotating JSONL sink for bulk artifacts, with a byte-offset index.
+
+Each record is one compact JSON line. With ``gzip`` or ``zstd`` compression
+every record is written as its own gzip member / zstd frame, so a record can
+be decompressed on its own from the offset recorded in the index while the
+whole shard still streams with ordinary ``gzip``/``zstd`` readers.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import re
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+from pydantic import BaseModel
+
+COMPRESSIONS = ("none", "gzip", "zstd")
+DEFAULT_SHARD_MAX_BYTES = 256 * 1024 * 1024
+_SUFFIXES = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+class IndexEntry(BaseModel):
+    file: str
+    offset: int
+    length: int
+    document_id: str | None = None
+    input_path: str | None = None
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise RuntimeError("zstd compression needs the zstandard package; install with `.[zstd]`") from exc
+    return zstandard
+
+
+def _compressor(compression: str) -> Callable[[bytes], bytes]:
+    if compression == "gzip":
+        return lambda data: gzip.compress(data, mtime=0)
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().compress
+    return lambda data: data
+
+
+def _compression_of(path: Path) -> str:
+    for compression, suffix in _SUFFIXES.items():
+        if compression != "none" and path.name.endswith(suffix):
+            return compression
+    return "none"
+
+
+def _open_stream(path: Path) -> BinaryIO:
+    compression = _compression_of(path)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        handle = path.open("rb")
+        return _zstandard().ZstdDecompressor().stream_reader(handle, read_across_frames=True, closefd=True)
+    return path.open("rb")
+
+
+def _decompress(compression: str, data: bytes) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().decompress(data)
+    return data
+
+
+class JsonlSink:
+    """Append artifacts to ``<prefix>-NNNNN<suffix>`` shards in ``directory``.
+
+    A shard is closed once it reaches ``max_bytes`` (on disk, after
+    compression). Every record is listed in ``<prefix>.index.jsonl`` with its
+    shard, byte offset and length. A new sink never appends to an existing
+    shard, so offsets written by earlier runs stay valid.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        prefix: str = "artifacts",
+        compression: str = "none",
+        max_bytes: int = DEFAULT_SHARD_MAX_BYTES,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of: {', '.join(COMPRESSIONS)}")
+        self.directory = directory
+        self.prefix = prefix
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.index_path = directory / f"{prefix}.index.jsonl"
+        self._compress = _compressor(compression)
+        self._shard_number = self._last_shard_number()
+        self._handle: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._shard_path: Path | None = None
+        self._shard_size = 0
+        self.records = 0
+
+    def _last_shard_number(self) -> int:
+        pattern = re.compile(rf"^{re.escape(self.prefix)}-(\d+)\.jsonl")
+        numbers = [int(m.group(1)) for p in self.directory.glob(f"{self.prefix}-*") if (m := pattern.match(p.name))]
+        return max(numbers, default=0)
+
+    def _rotate(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        self._shard_number += 1
+        self._shard_path = self.directory / f"{self.prefix}-{self._shard_number:05d}{_SUFFIXES[self.compression]}"
+        self._handle = self._shard_path.open("xb")
+        self._shard_size = 0
+
+    def write(self, line: str, *, document_id: str | None = None, input_path: str | None = None) -> IndexEntry:
+        """Append one compact JSON document (without trailing newline)."""
+        if self._index is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._index = self.index_path.open("ab")
+        if self._handle is None or self._shard_size >= self.max_bytes:
+            self._rotate()
+        assert self._handle is not None and self._shard_path is not None
+        payload = self._compress(line.encode("utf-8") + b"\n")
+        entry = IndexEntry(
+            file=self._shard_path.name,
+            offset=self._shard_size,
+            length=len(payload),
+            document_id=document_id,
+            input_path=input_path,
+        )
+        self._handle.write(payload)
+        self._shard_size += len(payload)
+        self._index.write(entry.model_dump_json().encode("utf-8") + b"\n")
+        self.records += 1
+        return entry
+
+    def close(self) -> None:
+        # Shard data is flushed before the index that points into it.
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    def __enter__(self) -> JsonlSink:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def read_index(directory: Path, prefix: str = "artifacts") -> Iterator[IndexEntry]:
+    index_path = directory / f"{prefix}.index.jsonl"
+    with index_path.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield IndexEntry.model_validate_json(line)
+
+
+def read_record(directory: Path, entry: IndexEntry) -> str:
+    """Read one record by its index entry without touching the rest of the shard."""
+    path = directory / entry.file
+    with path.open("rb") as handle:
+        handle.seek(entry.offset)
+        data = handle.read(entry.length)
+    return _decompress(_compression_of(path), data).decode("utf-8").rstrip("\n")
+
+
+def iter_records(directory: Path, prefix: str = "artifacts") -> Iterator[str]:
+    """Stream every record of every shard in write order."""
+    pattern = re.compile(rf"^{re.escape(prefix)}-(\d+)\.jsonl")
+    shards = sorted(
+        (int(m.group(1)), p) for p in directory.glob(f"{prefix}-*") if (m := pattern.match(p.name))
+    )
+    for _, path in shards:
+        with _open_stream(path) as raw, io.TextIOWrapper(raw, encoding="utf-8") as text:
+            for line in text:
+                if line.strip():
+                    yield line.rstrip("\n")
@@ -0,0 +1,314 @@
+"""Opt-in per-stage timing and resource instrumentation.
+
+A :class:`MetricsCollector` is bound to the current context while a document
+runs; :func:`stage_timer`, :func:`subprocess_timer` and :func:`record_api_call`
+are no-ops when nothing is collecting, so the default pipeline pays only a
+context-variable lookup per stage. Collected numbers land in the package's
+``metrics`` section, which is omitted from the artifact when metrics are off.
+
+``memory`` mode additionally traces allocations with :mod:`tracemalloc`. The
+tracer is process-wide, so peak figures from concurrent documents (``serve``
+with ``--concurrency`` above one) overlap and are only indicative.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from docreview.core.enums import PipelineStage
+from docreview.core.schemas import MetricsSection, StageMetrics
+
+METRICS_MODES = ("off", "timing", "memory")
+WALL_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_COLLECTOR: ContextVar[MetricsCollector | None] = ContextVar("docreview_metrics", default=None)
+_TRACE_LOCK = threading.Lock()
+_TRACE_USERS = 0
+
+
+def _start_tracing() -> None:
+    global _TRACE_USERS
+    with _TRACE_LOCK:
+        if _TRACE_USERS == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _TRACE_USERS = 1
+        elif _TRACE_USERS:
+            _TRACE_USERS += 1
+
+
+def _stop_tracing() -> None:
+    global _TRACE_USERS
+    with _TRACE_LOCK:
+        if _TRACE_USERS:
+            _TRACE_USERS -= 1
+            if _TRACE_USERS == 0:
+                tracemalloc.stop()
+
+
+class MetricsCollector:
+    """Accumulates :class:`StageMetrics` for one document."""
+
+    def __init__(self, mode: str = "timing") -> None:
+        if mode not in METRICS_MODES or mode == "off":
+            raise ValueError(f"mode must be one of: {', '.join(METRICS_MODES[1:])}")
+        self.mode = mode
+        self.trace_memory = mode == "memory"
+        self.cache_hit = False
+        self.stages: list[StageMetrics] = []
+        self._current: StageMetrics | None = None
+        self._lock = threading.Lock()
+        self._started_ns = time.time_ns()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+
+    @contextmanager
+    def stage(self, stage: PipelineStage) -> Iterator[StageMetrics]:
+        metrics = StageMetrics(stage=stage, started_at_unix_ns=time.time_ns(), wall_seconds=0.0, cpu_seconds=0.0)
+        previous = self._current
+        self._current = metrics
+        base_memory = 0
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_seconds = time.perf_counter() - wall_start
+            metrics.cpu_seconds = time.thread_time() - cpu_start
+            if self.trace_memory and tracemalloc.is_tracing():
+                metrics.peak_memory_bytes = max(0, tracemalloc.get_traced_memory()[1] - base_memory)
+            self._current = previous
+            self.stages.append(metrics)
+
+    def add_subprocess(self, seconds: float) -> None:
+        with self._lock:
+            if self._current is not None:
+                self._current.subprocess_calls += 1
+                self._current.subprocess_seconds += seconds
+
+    def add_api_call(self, seconds: float, input_tokens: int = 0, output_tokens: int = 0) -> None:
+        with self._lock:
+            if self._current is not None:
+                self._current.api_calls += 1
+                self._current.api_seconds += seconds
+                self._current.api_input_tokens += input_tokens
+                self._current.api_output_tokens += output_tokens
+
+    def section(self) -> MetricsSection:
+        return MetricsSection(
+            mode=self.mode,
+            started_at_unix_ns=self._started_ns,
+            wall_seconds=time.perf_counter() - self._wall_start,
+            cpu_seconds=time.thread_time() - self._cpu_start,
+            cache_hit=self.cache_hit,
+            stages=list(self.stages),
+        )
+
+
+def current_collector() -> MetricsCollector | None:
+    return _COLLECTOR.get()
+
+
+@contextmanager
+def collecting(mode: str, collector: MetricsCollector | None = None) -> Iterator[MetricsCollector | None]:
+    """Bind a collector for ``mode`` to the current context; yields None for ``off``.
+
+    A given ``collector`` (e.g. a profiler) is bound instead, whatever ``mode`` is.
+    """
+    if mode not in METRICS_MODES:
+        raise ValueError(f"metrics must be one of: {', '.join(METRICS_MODES)}")
+    if collector is None and mode == "off":
+        yield None
+        return
+    if collector is None:
+        collector = MetricsCollector(mode)
+    if collector.trace_memory:
+        _start_tracing()
+    token = _COLLECTOR.set(collector)
+    try:
+        yield collector
+    finally:
+        _COLLECTOR.reset(token)
+        if collector.trace_memory:
+            _stop_tracing()
+
+
+@contextmanager
+def stage_timer(stage: PipelineStage) -> Iterator[None]:
+    collector = _COLLECTOR.get()
+    if collector is None:
+        yield
+        return
+    with collector.stage(stage):
+        yield
+
+
+@contextmanager
+def subprocess_timer() -> Iterator[None]:
+    collector = _COLLECTOR.get()
+    if collector is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        collector.add_subprocess(time.perf_counter() - started)
+
+
+def _usage_tokens(response: Any) -> tuple[int, int]:
+    usage = getattr(response, "usage", None)
+    if usage is None and isinstance(response, dict):
+        usage = response.get("usage")
+    if usage is None:
+        return 0, 0
+    if isinstance(usage, dict):
+        return int(usage.get("input_tokens") or 0), int(usage.get("output_tokens") or 0)
+    return int(getattr(usage, "input_tokens", 0) or 0), int(getattr(usage, "output_tokens", 0) or 0)
+
+
+def record_api_call(seconds: float, response: Any = None) -> None:
+    """Attribute one external API call (latency including retries) to the running stage."""
+    collector = _COLLECTOR.get()
+    if collector is not None:
+        collector.add_api_call(seconds, *_usage_tokens(response))
+
+
+class MetricsAggregate:
+    """Running totals over many documents, rendered as Prometheus text."""
+
+    def __init__(self, buckets: tuple[float, ...] = WALL_SECONDS_BUCKETS) -> None:
+        self.buckets = buckets
+        self.documents = 0
+        self.cache_hits = 0
+        self._stages: dict[str, dict[str, float]] = {}
+        self._histograms: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, section: MetricsSection) -> None:
+        with self._lock:
+            self.documents += 1
+            self.cache_hits += int(section.cache_hit)
+            for stage in section.stages:
+                totals = self._stages.setdefault(
+                    stage.stage.value,
+                    dict.fromkeys(
+                        (
+                            "runs",
+                            "wall_seconds",
+                            "cpu_seconds",
+                            "peak_memory_bytes",
+                            "subprocess_calls",
+                            "subprocess_seconds",
+                            "api_calls",
+                            "api_seconds",
+                            "api_input_tokens",
+                            "api_output_tokens",
+                        ),
+                        0.0,
+                    ),
+                )
+                totals["runs"] += 1
+                for name in totals:
+                    if name not in ("runs", "peak_memory_bytes"):
+                        totals[name] += getattr(stage, name)
+                if stage.peak_memory_bytes is not None:
+                    totals["peak_memory_bytes"] = max(totals["peak_memory_bytes"], stage.peak_memory_bytes)
+                counts = self._histograms.setdefault(stage.stage.value, [0] * len(self.buckets))
+                for index, bound in enumerate(self.buckets):
+                    if stage.wall_seconds <= bound:
+                        counts[index] += 1
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            stages = {name: dict(values) for name, values in sorted(self._stages.items())}
+            histograms = {name: list(counts) for name, counts in self._histograms.items()}
+            documents, cache_hits = self.documents, self.cache_hits
+        lines = [
+            "# HELP docreview_documents_total Documents with collected metrics.",
+            "# TYPE docreview_documents_total counter",
+            f"docreview_documents_total {documents}",
+            "# HELP docreview_cache_hits_total Documents served from the artifact cache.",
+            "# TYPE docreview_cache_hits_total counter",
+            f"docreview_cache_hits_total {cache_hits}",
+            "# HELP docreview_stage_wall_seconds Wall time per stage run.",
+            "# TYPE docreview_stage_wall_seconds histogram",
+        ]
+        for name, values in stages.items():
+            for bound, count in zip(self.buckets, histograms[name]):
+                lines.append(f'docreview_stage_wall_seconds_bucket{{stage="{name}",le="{bound:g}"}} {count}')
+            lines.append(f'docreview_stage_wall_seconds_bucket{{stage="{name}",le="+Inf"}} {values["runs"]:g}')
+            lines.append(f'docreview_stage_wall_seconds_sum{{stage="{name}"}} {values["wall_seconds"]:.6f}')
+            lines.append(f'docreview_stage_wall_seconds_count{{stage="{name}"}} {values["runs"]:g}')
+        counters = (
+            ("cpu_seconds", "CPU time spent in the stage's thread."),
+            ("subprocess_calls", "External processes started by the stage."),
+            ("subprocess_seconds", "Wall time spent waiting on external processes."),
+            ("api_calls", "External API calls made by the stage."),
+            ("api_seconds", "Latency of external API calls, including retries."),
+        )
+        for metric, help_text in counters:
+            lines.append(f"# HELP docreview_stage_{metric}_total {help_text}")
+            lines.append(f"# TYPE docreview_stage_{metric}_total counter")
+            for name, values in stages.items():
+                lines.append(f'docreview_stage_{metric}_total{{stage="{name}"}} {values[metric]:g}')
+        lines.append("# HELP docreview_stage_api_tokens_total Tokens reported by external API usage.")
+        lines.append("# TYPE docreview_stage_api_tokens_total counter")
+        for name, values in stages.items():
+            for direction in ("input", "output"):
+                count = values[f"api_{direction}_tokens"]
+                lines.append(f'docreview_stage_api_tokens_total{{stage="{name}",direction="{direction}"}} {count:g}')
+        lines.append("# HELP docreview_stage_peak_memory_bytes Largest traced allocation peak seen for the stage.")
+        lines.append("# TYPE docreview_stage_peak_memory_bytes gauge")
+        for name, values in stages.items():
+            lines.append(f'docreview_stage_peak_memory_bytes{{stage="{name}"}} {values["peak_memory_bytes"]:g}')
+        return "\n".join(lines) + "\n"
+
+
+def prometheus_text(sections: Iterable[MetricsSection]) -> str:
+    aggregate = MetricsAggregate()
+    for section in sections:
+        aggregate.add(section)
+    return aggregate.prometheus()
+
+
+def export_otel_spans(section: MetricsSection, *, document_id: str, tracer: Any = None) -> None:
+    """Emit one ``docreview.pipeline`` span with a child span per stage.
+
+    Spans go to ``tracer`` or the globally configured OpenTelemetry tracer
+    provider, using the recorded start times.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError as exc:
+        raise RuntimeError("OpenTelemetry export needs opentelemetry-api; install with `.[otel]`") from exc
+    tracer = tracer or trace.get_tracer("docreview")
+    root = tracer.start_span(
+        "docreview.pipeline",
+        start_time=section.started_at_unix_ns,
+        attributes={"docreview.document_id": document_id, "docreview.cache_hit": section.cache_hit},
+    )
+    context = trace.set_span_in_context(root)
+    for stage in section.stages:
+        attributes = {
+            f"docreview.{name}": value
+            for name, value in stage.model_dump(exclude={"started_at_unix_ns"}, mode="json").items()
+            if value is not None
+        }
+        span = tracer.start_span(
+            f"docreview.{stage.stage.value}",
+            context=context,
+            start_time=stage.started_at_unix_ns,
+            attributes=attributes,
+        )
+        span.end(end_time=stage.started_at_unix_ns + int(stage.wall_seconds * 1e9))
+    root.end(end_time=section.started_at_unix_ns + int(section.wall_seconds * 1e9))
@@ -0,0 +1,287 @@
+"""Shared OpenAI client access with retry, backoff and concurrency limits."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import random
+import threading
+import time
+import weakref
+from collections.abc import Coroutine, Mapping, Sequence
+from concurrent.futures import Future
+from typing import Any, NamedTuple, TypeVar
+
+from pydantic import BaseModel, Field
+
+from docreview.utils.metrics import record_api_call
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+RETRYABLE_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError", "TimeoutError"})
+DEFAULT_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+_CLIENTS: dict[tuple[object, str, str | None], Any] = {}
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[object, str, str | None], Any]] = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENTS_LOCK = threading.Lock()
+_SYNC_SEMAPHORE: threading.BoundedSemaphore | None = None
+_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+class ResponseOutcome(NamedTuple):
+    response: Any
+    error: BaseException | None
+    elapsed_seconds: float
+
+
+class RetryPolicy(BaseModel):
+    max_attempts: int = Field(default=4, ge=1)
+    base_delay: float = Field(default=0.5, ge=0.0)
+    max_delay: float = Field(default=8.0, ge=0.0)
+    timeout: float = Field(default=60.0, gt=0.0)
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Exponential backoff with jitter; a server ``Retry-After`` wins if longer."""
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        backoff *= random.uniform(0.5, 1.0)
+        if retry_after is not None:
+            return max(backoff, retry_after)
+        return backoff
+
+
+def default_policy() -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=int(os.environ.get("DOCREVIEW_OPENAI_MAX_ATTEMPTS", "4")),
+        timeout=float(os.environ.get("DOCREVIEW_OPENAI_TIMEOUT", "60")),
+    )
+
+
+def max_concurrency() -> int:
+    return max(1, int(os.environ.get("DOCREVIEW_OPENAI_CONCURRENCY", str(DEFAULT_CONCURRENCY))))
+
+
+def _client_kwargs(api_key: str) -> dict[str, Any]:
+    # Retries are handled here so backoff and concurrency limits stay consistent.
+    kwargs: dict[str, Any] = {"api_key": api_key, "max_retries": 0}
+    base_url = os.environ.get("OPENAI_BASE_URL")
+    if base_url:
+        kwargs["base_url"] = base_url
+    return kwargs
+
+
+def get_client(api_key: str) -> Any:
+    """Return a process-wide OpenAI client so connections are reused."""
+    try:
+        from openai import OpenAI
+    except ImportError as exc:  # pragma: no cover - environment dependent
+        raise ImportError("openai package not installed; install with `.[ocr]`") from exc
+
+    cache_key = (OpenAI, api_key, os.environ.get("OPENAI_BASE_URL"))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(cache_key)
+        if client is None:
+            client = OpenAI(**_client_kwargs(api_key))
+            _CLIENTS[cache_key] = client
+    return client
+
+
+def get_async_client(api_key: str) -> Any:
+    """Return the running event loop's AsyncOpenAI client so its connection pool is reused.
+
+    Async clients are bound to the loop they were first used on, so the cache
+    is per loop as well as per key and base URL.
+    """
+    try:
+        from openai import AsyncOpenAI
+    except ImportError as exc:  # pragma: no cover - environment dependent
+        raise ImportError("openai package not installed; install with `.[ocr]`") from exc
+
+    loop = asyncio.get_running_loop()
+    cache_key = (AsyncOpenAI, api_key, os.environ.get("OPENAI_BASE_URL"))
+    with _CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get(cache_key)
+        if client is None:
+            client = AsyncOpenAI(**_client_kwargs(api_key))
+            clients[cache_key] = client
+    return client
+
+
+def _shared_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _CLIENTS_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="docreview-openai", daemon=True).start()
+        return _LOOP
+
+
+def _reset_after_fork() -> None:
+    # The loop thread does not survive a fork, and clients and the semaphore may hold
+    # connections or permits of the parent's threads; a child process starts its own.
+    global _CLIENTS_LOCK, _LOOP, _SYNC_SEMAPHORE
+    _CLIENTS_LOCK = threading.Lock()
+    _LOOP = None
+    _SYNC_SEMAPHORE = None
+    _CLIENTS.clear()
+    _ASYNC_CLIENTS.clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _sync_semaphore() -> threading.BoundedSemaphore:
+    global _SYNC_SEMAPHORE
+    with _CLIENTS_LOCK:
+        if _SYNC_SEMAPHORE is None:
+            _SYNC_SEMAPHORE = threading.BoundedSemaphore(max_concurrency())
+        return _SYNC_SEMAPHORE
+
+
+def is_retryable(exc: BaseException) -> bool:
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES
+    return type(exc).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def create_response(api_key: str, *, policy: RetryPolicy | None = None, **request: Any) -> Any:
+    """Call ``responses.create`` on the shared client with retry and backoff."""
+    client = get_client(api_key)
+    policy = policy or default_policy()
+    semaphore = _sync_semaphore()
+    started = time.perf_counter()
+    attempt = 1
+    while True:
+        try:
+            with semaphore:
+                response = client.responses.create(timeout=policy.timeout, **request)
+            record_api_call(time.perf_counter() - started, response)
+            return response
+        except Exception as exc:
+            if attempt >= policy.max_attempts or not is_retryable(exc):
+                record_api_call(time.perf_counter() - started)
+                raise
+            time.sleep(policy.delay(attempt, retry_after_seconds(exc)))
+            attempt += 1
+
+
+async def acreate_response(
+    client: Any,
+    semaphore: asyncio.Semaphore,
+    *,
+    policy: RetryPolicy,
+    **request: Any,
+) -> Any:
+    attempt = 1
+    while True:
+        try:
+            async with semaphore:
+                return await client.responses.create(timeout=policy.timeout, **request)
+        except Exception as exc:
+            if attempt >= policy.max_attempts or not is_retryable(exc):
+                raise
+            await asyncio.sleep(policy.delay(attempt, retry_after_seconds(exc)))
+            attempt += 1
+
+
+async def _timed_response(
+    client: Any,
+    semaphore: asyncio.Semaphore,
+    policy: RetryPolicy,
+    request: Mapping[str, Any],
+) -> ResponseOutcome:
+    started = time.perf_counter()
+    try:
+        response = await acreate_response(client, semaphore, policy=policy, **request)
+    except Exception as exc:
+        elapsed = time.perf_counter() - started
+        record_api_call(elapsed)
+        return ResponseOutcome(None, exc, elapsed)
+    elapsed = time.perf_counter() - started
+    record_api_call(elapsed, response)
+    return ResponseOutcome(response, None, elapsed)
+
+
+async def _gather_responses(
+    api_key: str,
+    requests: Sequence[Mapping[str, Any]],
+    policy: RetryPolicy,
+    concurrency: int,
+) -> list[ResponseOutcome]:
+    client = get_async_client(api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+    return list(
+        await asyncio.gather(*(_timed_response(client, semaphore, policy, request) for request in requests))
+    )
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the process-wide client loop and wait for its result.
+
+    The loop runs on a daemon thread and outlives each call, so async clients
+    cached on it keep their connections. Works from inside another event loop;
+    it must not be called from a coroutine already running on the client loop.
+    """
+    loop = _shared_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_coroutine cannot wait on the loop it is running on")
+    # Carry context variables (e.g. the metrics collector) into the loop thread.
+    context = contextvars.copy_context()
+    done: Future[T] = Future()
+
+    def finish(task: asyncio.Task[T]) -> None:
+        if task.cancelled():
+            done.cancel()
+        elif task.exception() is not None:
+            done.set_exception(task.exception())
+        else:
+            done.set_result(task.result())
+
+    loop.call_soon_threadsafe(lambda: loop.create_task(coro, context=context).add_done_callback(finish))
+    return done.result()
+
+
+def create_responses(
+    api_key: str,
+    requests: Sequence[Mapping[str, Any]],
+    *,
+    policy: RetryPolicy | None = None,
+    concurrency: int | None = None,
+) -> list[ResponseOutcome]:
+    """Run several requests concurrently over the shared, pooled async client.
+
+    Outcomes keep request order; a request that still fails after its retries
+    carries the exception instead of a response.
+    """
+    if not requests:
+        return []
+    return run_coroutine(
+        _gather_responses(
+            api_key,
+            requests,
+            policy or default_policy(),
+            concurrency or max_concurrency(),
+        )
+    )
@@ -2,18 +2,11 @@ from __future__ import annotations
 
 import base64
 
+from docreview.core.schemas import PageExtract
+from docreview.utils.openai_client import create_response, create_responses
 
-def openai_vision_extract(image_data: list[bytes], api_key: str, model: str = "gpt-4o") -> str:
-    """Extract text from document images using OpenAI vision."""
-    try:
-        from openai import OpenAI
-    except ImportError as exc:  # pragma: no cover - environment dependent
-        raise ImportError("openai package not installed; install with `.[ocr]`") from exc
-
-    if not image_data:
-        return ""
 
-    client = OpenAI(api_key=api_key)
+def _vision_content(image_data: list[bytes]) -> list[dict[str, object]]:
     content: list[dict[str, object]] = [
         {
             "type": "input_text",
@@ -31,9 +24,47 @@ def openai_vision_extract(image_data: list[bytes], api_key: str, model: str = "g
                 "image_url": f"data:image/png;base64,{encoded}",
             }
         )
+    return content
+
+
+def openai_vision_extract(image_data: list[bytes], api_key: str, model: str = "gpt-4o") -> str:
+    """Extract text from document images using OpenAI vision."""
+    if not image_data:
+        return ""
 
-    response = client.responses.create(
+    response = create_response(
+        api_key,
         model=model,
-        input=[{"role": "user", "content": content}],
+        input=[{"role": "user", "content": _vision_content(image_data)}],
     )
     return response.output_text.strip()
+
+
+def openai_vision_extract_pages(
+    image_data: list[bytes], api_key: str, model: str = "gpt-4o"
+) -> list[tuple[PageExtract, str]]:
+    """OCR each page as its own concurrent request, keeping page order.
+
+    Retries happen per page inside the client layer, so one flaky page never
+    re-sends the others. Failed pages come back with ``ok=False`` and no text.
+    """
+    requests = [
+        {"model": model, "input": [{"role": "user", "content": _vision_content([image])}]}
+        for image in image_data
+    ]
+    results: list[tuple[PageExtract, str]] = []
+    for page_number, outcome in enumerate(create_responses(api_key, requests), start=1):
+        text = outcome.response.output_text.strip() if outcome.error is None else ""
+        results.append(
+            (
+                PageExtract(
+                    page_number=page_number,
+                    ok=outcome.error is None and bool(text),
+                    model=model,
+                    elapsed_ms=round(outcome.elapsed_seconds * 1000, 3),
+                    error=f"{type(outcome.error).__name__}: {outcome.error}" if outcome.error else None,
+                ),
+                text,
+            )
+        )
+    return results
@@ -1,10 +1,36 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
-from docreview.core.template_loader import DocumentTemplate
+from docreview.core.template_loader import DocumentTemplate, template_derived
+from docreview.utils.openai_client import create_response
+
+# Packs stay well inside a 128k-token context at roughly four characters per token.
+DEFAULT_PACK_DOCUMENTS = 8
+DEFAULT_PACK_CHARS = 120_000
+DEFAULT_PACK_LINGER = 0.1
+
+_PROMPT = (
+    "You are a deterministic information extraction system.\n"
+    "Extract values for the provided template fields from DOCUMENT_TEXT.\n"
+    "Rules:\n"
+    "- Use only explicit information in DOCUMENT_TEXT.\n"
+    "- If a field value is not present, set value to null.\n"
+    "- Do not infer or fabricate missing values.\n"
+    "- Confidence must be between 0 and 1.\n"
+    "- Provide a short evidence quote when available.\n"
+    "- Return JSON only matching the requested shape.\n"
+)
+_PACKED_RULES = (
+    "Several documents follow, each introduced by a DOCUMENT <id> header. Extract fields for every "
+    "document separately and never use one document's text for another.\n"
+)
 
 
 class FieldFillError(RuntimeError):
@@ -23,6 +49,18 @@ class FieldFillResponse(BaseModel):
     field_values: list[FieldFillItem] = Field(default_factory=list)
 
 
+class PackedFieldFillDocument(FieldFillResponse):
+    # Models often answer with the document id as a JSON number.
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    document: str
+
+
+class PackedFieldFillResponse(BaseModel):
+    # Entries are validated one by one, so a malformed entry only costs that document a retry.
+    documents: list[Any] = Field(default_factory=list)
+
+
 def _template_payload(template: DocumentTemplate) -> list[dict[str, object]]:
     return [
         {
@@ -35,6 +73,40 @@ def _template_payload(template: DocumentTemplate) -> list[dict[str, object]]:
     ]
 
 
+def _template_payload_json(template: DocumentTemplate) -> str:
+    return template_derived(
+        template, "field_fill_payload", lambda t: json.dumps(_template_payload(t), ensure_ascii=True)
+    )
+
+
+def _request_json(api_key: str, model: str, content: list[dict[str, str]]) -> Any:
+    try:
+        response = create_response(
+            api_key,
+            model=model,
+            input=[{"role": "user", "content": content}],
+            temperature=0,
+            text={"format": {"type": "json_object"}},
+        )
+        raw = response.output_text.strip()
+        if not raw:
+            raise FieldFillError("LLM returned empty output for field extraction.")
+        if raw.startswith("```"):
+            raw = raw.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+        return json.loads(raw)
+    except FieldFillError:
+        raise
+    except ImportError as exc:  # pragma: no cover - environment dependent
+        raise FieldFillError("openai package not installed; install with `.[ocr]`") from exc
+    except Exception as exc:  # pragma: no cover - network/runtime dependent
+        raise FieldFillError(f"LLM field extraction failed: {exc}") from exc
+
+
+def _allowed_items(items: list[FieldFillItem], template: DocumentTemplate) -> list[FieldFillItem]:
+    allowed = {field.name for field in template.fields}
+    return [item for item in items if item.field_name in allowed]
+
+
 def openai_field_fill(
     *,
     text: str,
@@ -47,27 +119,9 @@ def openai_field_fill(
     if not template.fields:
         return []
 
-    try:
-        from openai import OpenAI
-    except ImportError as exc:  # pragma: no cover - environment dependent
-        raise FieldFillError("openai package not installed; install with `.[ocr]`") from exc
-
-    client = OpenAI(api_key=api_key)
-    prompt = (
-        "You are a deterministic information extraction system.\n"
-        "Extract values for the provided template fields from DOCUMENT_TEXT.\n"
-        "Rules:\n"
-        "- Use only explicit information in DOCUMENT_TEXT.\n"
-        "- If a field value is not present, set value to null.\n"
-        "- Do not infer or fabricate missing values.\n"
-        "- Confidence must be between 0 and 1.\n"
-        "- Provide a short evidence quote when available.\n"
-        "- Return JSON only matching the requested shape.\n"
-    )
-
     content = [
-        {"type": "input_text", "text": prompt},
-        {"type": "input_text", "text": f"TEMPLATE_FIELDS:\n{json.dumps(_template_payload(template), ensure_ascii=True)}"},
+        {"type": "input_text", "text": _PROMPT},
+        {"type": "input_text", "text": f"TEMPLATE_FIELDS:\n{_template_payload_json(template)}"},
         {"type": "input_text", "text": f"DOCUMENT_TEXT:\n{text}"},
         {
             "type": "input_text",
@@ -77,25 +131,218 @@ def openai_field_fill(
             ),
         },
     ]
+    try:
+        parsed = FieldFillResponse.model_validate(_request_json(api_key, model, content))
+    except FieldFillError:
+        raise
+    except Exception as exc:  # pragma: no cover - depends on model output
+        raise FieldFillError(f"LLM field extraction failed: {exc}") from exc
+    return _allowed_items(parsed.field_values, template)
+
+
+def openai_field_fill_packed(
+    *,
+    texts: Sequence[str],
+    template: DocumentTemplate,
+    api_key: str,
+    model: str,
+) -> list[list[FieldFillItem]]:
+    """Fill fields for several documents of one template in a single request.
 
+    The instructions and template fields come first so every pack shares the
+    same prompt prefix. Results are returned in input order; a document the
+    model left out of its answer is retried on its own.
+    """
+    if not api_key:
+        raise FieldFillError("OPENAI_API_KEY is missing.")
+    if not template.fields:
+        return [[] for _ in texts]
+    if len(texts) == 1:
+        return [openai_field_fill(text=texts[0], template=template, api_key=api_key, model=model)]
+
+    content = [
+        {"type": "input_text", "text": _PROMPT + _PACKED_RULES},
+        {"type": "input_text", "text": f"TEMPLATE_FIELDS:\n{_template_payload_json(template)}"},
+        *({"type": "input_text", "text": f"DOCUMENT {index}:\n{text}"} for index, text in enumerate(texts, 1)),
+        {
+            "type": "input_text",
+            "text": (
+                "Return exactly this JSON shape, with one entry per DOCUMENT id:\n"
+                '{"documents":[{"document":"1","field_values":[{"field_name":"...", "value":null, '
+                '"confidence":0.0, "evidence":null, "notes":null}]}]}\n'
+            ),
+        },
+    ]
     try:
-        response = client.responses.create(
-            model=model,
-            input=[{"role": "user", "content": content}],
-            temperature=0,
-            text={"format": {"type": "json_object"}},
-        )
-        raw = response.output_text.strip()
-        if not raw:
-            raise FieldFillError("LLM returned empty output for field extraction.")
-        if raw.startswith("```"):
-            raw = raw.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
-        payload = json.loads(raw)
-        parsed = FieldFillResponse.model_validate(payload)
+        parsed = PackedFieldFillResponse.model_validate(_request_json(api_key, model, content))
     except FieldFillError:
         raise
-    except Exception as exc:  # pragma: no cover - network/runtime dependent
+    except Exception as exc:  # pragma: no cover - depends on model output
         raise FieldFillError(f"LLM field extraction failed: {exc}") from exc
 
-    allowed = {field.name for field in template.fields}
-    return [item for item in parsed.field_values if item.field_name in allowed]
+    by_document: dict[str, list[FieldFillItem]] = {}
+    for raw_entry in parsed.documents:
+        try:
+            entry = PackedFieldFillDocument.model_validate(raw_entry)
+        except ValidationError:
+            continue
+        by_document[entry.document.strip()] = entry.field_values
+    results: list[list[FieldFillItem]] = []
+    for index, text in enumerate(texts, 1):
+        items = by_document.get(str(index))
+        if items is None:
+            items = openai_field_fill(text=text, template=template, api_key=api_key, model=model)
+        results.append(_allowed_items(items, template))
+    return results
+
+
+class _Pack:
+    def __init__(self, template: DocumentTemplate, api_key: str, model: str) -> None:
+        self.template = template
+        self.api_key = api_key
+        self.model = model
+        self.texts: list[str] = []
+        self.futures: list[Future[list[FieldFillItem]]] = []
+        self.chars = 0
+        self.timer: threading.Timer | None = None
+
+
+class FieldFillBatcher:
+    """Packs concurrent field fill calls for the same template and model into shared requests.
+
+    :meth:`fill` has the signature of :func:`openai_field_fill` and blocks until
+    its pack is sent: when the pack holds ``max_documents`` documents, when the
+    next document would push it past ``max_chars``, or ``linger`` seconds after
+    the pack was opened. A document longer than ``max_chars`` goes on its own.
+
+    Callers that announce their documents with :meth:`expect` and :meth:`done`
+    let open packs go out as soon as every document in flight is waiting, since
+    no other document can join them before one is answered.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_documents: int = DEFAULT_PACK_DOCUMENTS,
+        max_chars: int = DEFAULT_PACK_CHARS,
+        linger: float = DEFAULT_PACK_LINGER,
+    ) -> None:
+        self.max_documents = max(1, max_documents)
+        self.max_chars = max_chars
+        self.linger = linger
+        self.requests = 0
+        self._open: dict[tuple[str, str, str, str], _Pack] = {}
+        self._remaining = 0
+        self._concurrency = 1
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    def expect(self, documents: int, *, concurrency: int) -> None:
+        """Announce ``documents`` more documents, processed ``concurrency`` at a time."""
+        with self._lock:
+            self._remaining += documents
+            self._concurrency = concurrency
+
+    def done(self) -> None:
+        """Mark one announced document as finished, whether or not it filled fields."""
+        with self._lock:
+            self._remaining -= 1
+            ready = self._close_if_stalled()
+        self._send_all(ready)
+
+    def fill(
+        self,
+        *,
+        text: str,
+        template: DocumentTemplate,
+        api_key: str,
+        model: str,
+    ) -> list[FieldFillItem]:
+        if not api_key or not template.fields or self.max_documents == 1 or len(text) >= self.max_chars:
+            with self._lock:
+                self.requests += bool(api_key and template.fields)
+            return openai_field_fill(text=text, template=template, api_key=api_key, model=model)
+
+        key = (template.doc_type, template.version, model, api_key)
+        future: Future[list[FieldFillItem]] = Future()
+        ready: list[_Pack] = []
+        with self._lock:
+            pack = self._open.get(key)
+            if pack is not None and pack.chars + len(text) > self.max_chars:
+                ready.append(self._close(key))
+                pack = None
+            if pack is None:
+                pack = self._open[key] = _Pack(template, api_key, model)
+                pack.timer = threading.Timer(self.linger, self._expire, (key, pack))
+                pack.timer.daemon = True
+                pack.timer.start()
+            pack.texts.append(text)
+            pack.futures.append(future)
+            pack.chars += len(text)
+            if len(pack.texts) >= self.max_documents:
+                ready.append(self._close(key))
+            self._waiting += 1
+            ready.extend(self._close_if_stalled())
+        try:
+            self._send_all(ready)
+            return future.result()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def _close(self, key: tuple[str, str, str, str]) -> _Pack:
+        pack = self._open.pop(key)
+        if pack.timer is not None:
+            pack.timer.cancel()
+        self.requests += 1
+        return pack
+
+    def _close_if_stalled(self) -> list[_Pack]:
+        in_flight = min(self._remaining, self._concurrency)
+        if not in_flight or self._waiting < in_flight:
+            return []
+        return [self._close(key) for key in list(self._open)]
+
+    def _expire(self, key: tuple[str, str, str, str], pack: _Pack) -> None:
+        with self._lock:
+            if self._open.get(key) is not pack:
+                return
+            self._close(key)
+        self._send(pack)
+
+    def _send_all(self, packs: list[_Pack]) -> None:
+        # Packs for other templates go out on their own threads; the last one is sent here.
+        for pack in packs[:-1]:
+            threading.Thread(target=self._send, args=(pack,), daemon=True).start()
+        if packs:
+            self._send(packs[-1])
+
+    def _send(self, pack: _Pack) -> None:
+        try:
+            results = openai_field_fill_packed(
+                texts=pack.texts, template=pack.template, api_key=pack.api_key, model=pack.model
+            )
+        except Exception as exc:
+            if len(pack.texts) == 1:
+                pack.futures[0].set_exception(exc)
+            else:
+                self._send_each(pack)
+            return
+        except BaseException as exc:
+            for future in pack.futures:
+                future.set_exception(exc)
+            return
+        for future, items in zip(pack.futures, results):
+            future.set_result(items)
+
+    def _send_each(self, pack: _Pack) -> None:
+        # A failed pack falls back to one request per document, so one bad document fails alone.
+        with self._lock:
+            self.requests += len(pack.texts)
+        for future, text in zip(pack.futures, pack.texts):
+            try:
+                future.set_result(
+                    openai_field_fill(text=text, template=pack.template, api_key=pack.api_key, model=pack.model)
+                )
+            except Exception as exc:
+                future.set_exception(exc)
@@ -0,0 +1,202 @@
+"""Local HTTP stub of the OpenAI Responses API for offline tests and benchmarks."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+Responder = Callable[[dict[str, Any]], str]
+
+_PACKED_DOCUMENT = re.compile(r"DOCUMENT (\w+):\n(.*)", re.DOTALL)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The stdlib default backlog of 5 stalls bursts of concurrent connections.
+    request_queue_size = 128
+
+
+def _input_texts(request: dict[str, Any]) -> list[str]:
+    texts: list[str] = []
+    for message in request.get("input", []):
+        for part in message.get("content", []):
+            if part.get("type") == "input_text":
+                texts.append(str(part.get("text", "")))
+    return texts
+
+
+def _fill_values(fields: list[dict[str, Any]], body: str) -> list[dict[str, Any]]:
+    values = []
+    for field in fields:
+        match = re.search(rf"^\s*{re.escape(field['name'])}\s*[:=-]\s*(.+)$", body, re.IGNORECASE | re.MULTILINE)
+        values.append(
+            {
+                "field_name": field["name"],
+                "value": match.group(1).strip() if match else None,
+                "confidence": 0.9 if match else 0.0,
+                "evidence": match.group(0).strip() if match else None,
+                "notes": None,
+            }
+        )
+    return values
+
+
+def default_responder(request: dict[str, Any]) -> str:
+    """Deterministic stand-in for OCR and field fill responses.
+
+    Field fill requests get ``name: value`` matches for the template fields,
+    per ``DOCUMENT <id>`` part for packed requests; everything else is treated
+    as OCR and answered with a fixed page of text.
+    """
+    texts = _input_texts(request)
+    fields_text = next((t for t in texts if t.startswith("TEMPLATE_FIELDS:\n")), None)
+    document = next((t for t in texts if t.startswith("DOCUMENT_TEXT:\n")), None)
+    packed = [match for t in texts if (match := _PACKED_DOCUMENT.match(t))]
+    if fields_text is None or (document is None and not packed):
+        return "Paystub\nemployee_name: Jane Doe\nemployer_name: ACME Corp\nnet_pay: 2450.25"
+
+    fields = json.loads(fields_text.split("\n", 1)[1])
+    if document is None:
+        entries = [
+            {"document": match.group(1), "field_values": _fill_values(fields, match.group(2))} for match in packed
+        ]
+        return json.dumps({"documents": entries})
+    return json.dumps({"field_values": _fill_values(fields, document.split("\n", 1)[1])})
+
+
+class StubOpenAIServer:
+    """Threaded local server answering ``POST /v1/responses``.
+
+    ``latency`` delays every response, and the first ``fail_first`` requests are
+    answered with HTTP 429 so retry paths can be exercised. ``max_in_flight``
+    is the most requests that were being handled at once, so tests can check
+    that calls overlap without timing them. Use as a context manager and point
+    ``OPENAI_BASE_URL`` at :attr:`base_url`.
+    """
+
+    def __init__(
+        self,
+        responder: Responder = default_responder,
+        *,
+        latency: float = 0.0,
+        fail_first: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.responder = responder
+        self.latency = latency
+        self.fail_first = fail_first
+        self.requests: list[dict[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = _StubHTTPServer((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+            def _send(self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:
+                with stub._lock:
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    self._respond()
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                with stub._lock:
+                    stub.requests.append(request)
+                    should_fail = len(stub.requests) <= stub.fail_first
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if should_fail:
+                    self._send(
+                        429,
+                        {"error": {"message": "rate limited", "type": "rate_limit_error", "code": None}},
+                        {"retry-after": "0"},
+                    )
+                    return
+                if not self.path.rstrip("/").endswith("/responses"):
+                    self._send(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+                    return
+                self._send(200, stub_response_payload(request, stub.responder(request)))
+
+        return Handler
+
+    def start(self) -> StubOpenAIServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> StubOpenAIServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def stub_response_payload(request: dict[str, Any], text: str) -> dict[str, Any]:
+    # Rough four-characters-per-token estimate so usage accounting can be exercised.
+    input_tokens = sum(len(part) for part in _input_texts(request)) // 4
+    output_tokens = len(text) // 4
+    return {
+        "id": "resp_stub",
+        "object": "response",
+        "created_at": 0,
+        "status": "completed",
+        "model": request.get("model", "stub"),
+        "output": [
+            {
+                "type": "message",
+                "id": "msg_stub",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens_details": {"reasoning_tokens": 0},
+        },
+    }
@@ -0,0 +1,173 @@
+"""Append-only patch logs in place of versioned patch outputs.
+
+``docreview patch --log`` appends each patch as one line of
+``<artifact stem>.patches.jsonl`` next to the base artifact instead of writing
+another full copy of it. Readers materialize the current state by replaying
+the logged patches onto the base artifact. Every ``snapshot_every`` entries
+the replayed state is written to ``<artifact stem>.patches.snapshot`` behind a
+one-line header with the entry count and log offset it covers, so a read only
+replays the entries after the last snapshot and an append only counts them.
+Logged entries are never rewritten; an append first drops a trailing line left
+by an interrupted write. The snapshot is a cache that can be deleted at any
+time.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+from pydantic import BaseModel, ValidationError
+
+from docreview.core.patch import PatchPayload, apply_patch
+from docreview.core.schemas import DocumentReviewPackage
+from docreview.utils.artifact_reader import ArtifactError, LazyArtifact
+from docreview.utils.serialization import encode_model_json
+
+LOG_SUFFIX = ".patches.jsonl"
+SNAPSHOT_SUFFIX = ".patches.snapshot"
+DEFAULT_SNAPSHOT_EVERY = 16
+READ_BLOCK = 1 << 16
+
+
+class PatchLogEntry(BaseModel):
+    created_at: str
+    patch: PatchPayload
+
+
+class SnapshotHeader(BaseModel):
+    entries: int
+    offset: int
+
+
+class PatchLog:
+    def __init__(self, artifact: Path, *, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY) -> None:
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+        self.artifact = artifact
+        self.path = artifact.with_name(artifact.stem + LOG_SUFFIX)
+        self.snapshot_path = artifact.with_name(artifact.stem + SNAPSHOT_SUFFIX)
+        self.snapshot_every = snapshot_every
+        self._entries: int | None = None
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    def append(self, patch: PatchPayload, created_at: str) -> int:
+        """Log ``patch``; returns the number of entries now in the log."""
+        line = PatchLogEntry(created_at=created_at, patch=patch).model_dump_json() + "\n"
+        with self.path.open("a+b") as handle:
+            _drop_torn_line(handle)
+            if self._entries is None:
+                self._entries = self._count_entries(handle)
+            handle.write(line.encode("utf-8"))
+        self._entries += 1
+        if self._entries % self.snapshot_every == 0:
+            self.write_snapshot()
+        return self._entries
+
+    def materialize(self) -> DocumentReviewPackage:
+        """Base artifact with every logged patch applied."""
+        return self._replay()[0]
+
+    def write_snapshot(self) -> None:
+        package, entries, offset = self._replay()
+        header = SnapshotHeader(entries=entries, offset=offset)
+        handle = tempfile.NamedTemporaryFile(dir=self.path.parent, prefix=".tmp-", delete=False)
+        try:
+            with handle:
+                handle.write(header.model_dump_json().encode("utf-8") + b"\n")
+                handle.write(encode_model_json(package))
+            os.replace(handle.name, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(handle.name):
+                os.unlink(handle.name)
+            raise
+
+    def _snapshot_header(self, handle: BinaryIO) -> SnapshotHeader | None:
+        try:
+            header = SnapshotHeader.model_validate_json(handle.readline())
+        except ValidationError:
+            return None
+        if not self.exists() or header.offset > self.path.stat().st_size:
+            return None
+        return header
+
+    def _count_entries(self, log: BinaryIO) -> int:
+        # Entries up to the snapshot offset are known from its header; only the tail is counted.
+        header = None
+        try:
+            with self.snapshot_path.open("rb") as handle:
+                header = self._snapshot_header(handle)
+        except OSError:
+            pass
+        entries, offset = (header.entries, header.offset) if header is not None else (0, 0)
+        log.seek(offset)
+        while block := log.read(READ_BLOCK):
+            entries += block.count(b"\n")
+        return entries
+
+    def _load_snapshot(self) -> tuple[DocumentReviewPackage, int, int] | None:
+        try:
+            with self.snapshot_path.open("rb") as handle:
+                header = self._snapshot_header(handle)
+                if header is None:
+                    return None
+                package = DocumentReviewPackage.model_validate_json(handle.read())
+        except (OSError, ValidationError):
+            return None
+        return package, header.entries, header.offset
+
+    def _replay(self) -> tuple[DocumentReviewPackage, int, int]:
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            package, entries, offset = snapshot
+        else:
+            package, entries, offset = DocumentReviewPackage.model_validate_json(self.artifact.read_bytes()), 0, 0
+        if not self.exists():
+            return package, entries, offset
+        with self.path.open("rb") as handle:
+            handle.seek(offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    # An interrupted append; the entry was never completed.
+                    break
+                try:
+                    entry = PatchLogEntry.model_validate_json(line)
+                except ValidationError as exc:
+                    raise ArtifactError(f"{self.path} entry {entries + 1}: {exc}") from exc
+                package = apply_patch(package, entry.patch, entry.created_at)
+                entries += 1
+                offset += len(line)
+        return package, entries, offset
+
+
+def _drop_torn_line(handle: BinaryIO) -> None:
+    """Truncate ``handle`` after its last newline, dropping an entry an interrupted append left behind."""
+    end = handle.seek(0, os.SEEK_END)
+    if end == 0:
+        return
+    handle.seek(end - 1)
+    if handle.read(1) == b"\n":
+        return
+    position = end
+    while position > 0:
+        start = max(0, position - READ_BLOCK)
+        handle.seek(start)
+        block = handle.read(position - start)
+        newline = block.rfind(b"\n")
+        if newline != -1:
+            position = start + newline + 1
+            break
+        position = start
+    handle.truncate(position)
+
+
+def read_artifact(path: Path) -> LazyArtifact:
+    """The artifact at ``path``, materialized through its patch log when it has one."""
+    log = PatchLog(path)
+    if not log.exists():
+        return LazyArtifact.from_path(path)
+    return LazyArtifact(encode_model_json(log.materialize()))
@@ -1,48 +1,148 @@
 from __future__ import annotations
 
+import importlib.util
+import io
+import os
+import shutil
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+from docreview.utils.metrics import subprocess_timer
 
-def extract_text_layer(data: bytes) -> str | None:
-    """Extract text from PDF text layer using pdftotext."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        base = Path(temp_dir) / "document"
-        pdf_path = base.with_suffix(".pdf")
-        txt_path = base.with_suffix(".txt")
-        pdf_path.write_bytes(data)
+PDF_BACKENDS = ("auto", "poppler", "pdfium", "none")
+RENDER_DPI = 150
+
+
+class PdfBackend:
+    """Text-layer extraction and page rendering for PDF bytes."""
+
+    name = "none"
+
+    def extract_text(self, data: bytes) -> str | None:
+        return None
+
+    def render_pages(self, data: bytes) -> list[bytes]:
+        return []
+
+
+class PopplerBackend(PdfBackend):
+    """Poppler CLI tools fed through stdin, so the PDF never touches disk."""
+
+    name = "poppler"
+
+    @staticmethod
+    def available() -> bool:
+        # Both tools are needed: pdftotext for the text layer, pdftoppm to render pages for OCR.
+        return all(shutil.which(tool) is not None for tool in ("pdftotext", "pdftoppm"))
+
+    def extract_text(self, data: bytes) -> str | None:
         try:
-            subprocess.run(
-                ["pdftotext", "-layout", str(pdf_path), str(txt_path)],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
+            with subprocess_timer():
+                completed = subprocess.run(
+                    ["pdftotext", "-layout", "-", "-"],
+                    input=data,
+                    check=False,
+                    capture_output=True,
+                )
         except FileNotFoundError:
             return None
-        if not txt_path.exists():
+        if completed.returncode != 0:
             return None
-        text = txt_path.read_text(encoding="utf-8", errors="replace").strip()
+        text = completed.stdout.decode("utf-8", errors="replace").strip()
         return text or None
 
+    def render_pages(self, data: bytes) -> list[bytes]:
+        # pdftoppm can only stream a single page to stdout, so page images still
+        # land in a scratch directory; the input PDF itself is piped.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_prefix = Path(temp_dir) / "page"
+            try:
+                with subprocess_timer():
+                    subprocess.run(
+                        ["pdftoppm", "-png", "-r", str(RENDER_DPI), "-", str(output_prefix)],
+                        input=data,
+                        check=False,
+                        capture_output=True,
+                    )
+            except FileNotFoundError:
+                return []
+            pages: list[bytes] = []
+            for image_path in sorted(Path(temp_dir).glob("page-*.png"), key=lambda p: p.name):
+                pages.append(image_path.read_bytes())
+            return pages
+
+
+class PdfiumBackend(PdfBackend):
+    """In-process pypdfium2 backend (``pip install .[pdf]``)."""
+
+    name = "pdfium"
+
+    @staticmethod
+    def available() -> bool:
+        return importlib.util.find_spec("pypdfium2") is not None
+
+    def extract_text(self, data: bytes) -> str | None:
+        import pypdfium2 as pdfium
 
-def pdf_to_images(data: bytes) -> list[bytes]:
-    """Convert PDF pages to PNG images using pdftoppm."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        pdf_path = Path(temp_dir) / "document.pdf"
-        output_prefix = Path(temp_dir) / "page"
-        pdf_path.write_bytes(data)
         try:
-            subprocess.run(
-                ["pdftoppm", "-png", str(pdf_path), str(output_prefix)],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
+            document = pdfium.PdfDocument(bytes(data))
+        except pdfium.PdfiumError:
+            return None
+        try:
+            pages = [page.get_textpage().get_text_range() for page in document]
+        finally:
+            document.close()
+        text = "\f".join(pages).strip()
+        return text or None
+
+    def render_pages(self, data: bytes) -> list[bytes]:
+        import pypdfium2 as pdfium
+
+        if importlib.util.find_spec("PIL") is None:
+            return []
+        try:
+            document = pdfium.PdfDocument(bytes(data))
+        except pdfium.PdfiumError:
             return []
         pages: list[bytes] = []
-        for image_path in sorted(Path(temp_dir).glob("page-*.png"), key=lambda p: p.name):
-            pages.append(image_path.read_bytes())
+        try:
+            for page in document:
+                buffer = io.BytesIO()
+                page.render(scale=RENDER_DPI / 72).to_pil().save(buffer, format="PNG")
+                pages.append(buffer.getvalue())
+        finally:
+            document.close()
         return pages
+
+
+@lru_cache(maxsize=None)
+def select_pdf_backend(name: str = "auto") -> PdfBackend:
+    """Resolve a backend name; ``auto`` keeps poppler output when both of its tools are installed."""
+    if name == "poppler":
+        return PopplerBackend()
+    if name == "pdfium":
+        return PdfiumBackend()
+    if name == "none":
+        return PdfBackend()
+    if PopplerBackend.available():
+        return PopplerBackend()
+    if PdfiumBackend.available():
+        return PdfiumBackend()
+    return PdfBackend()
+
+
+def get_pdf_backend() -> PdfBackend:
+    name = os.environ.get("DOCREVIEW_PDF_BACKEND", "auto").lower()
+    return select_pdf_backend(name if name in PDF_BACKENDS else "auto")
+
+
+def extract_text_layer(data: bytes) -> str | None:
+    """Extract text from the PDF text layer using the selected backend."""
+    return get_pdf_backend().extract_text(data)
+
+
+def pdf_to_images(data: bytes) -> list[bytes]:
+    """Render PDF pages to PNG images using the selected backend."""
+    return get_pdf_backend().render_pages(data)
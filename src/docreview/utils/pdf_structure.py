@@ -0,0 +1,303 @@
+"""Minimal PDF structure reader for cheap, exact page counts.
+
+Only the trailer, the cross-reference chain, the catalog and the root page
+tree node are touched, so the cost is independent of file size when the input
+is memory-mapped. Classic xref tables, xref streams (with PNG predictors),
+object streams and incremental updates are supported.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import zlib
+from pathlib import Path
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+
+TAIL_BYTES = 4096
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)")
+_OBJ_HEADER = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj\b")
+_XREF_SUBSECTION = re.compile(rb"\s*(\d+)\s+(\d+)\s*[\r\n]")
+_XREF_ENTRY = re.compile(rb"(\d{10})\s(\d{5})\s([nf])")
+_TRAILER = re.compile(rb"\s*trailer\s*")
+_XREF_KEYWORD = re.compile(rb"\s*xref")
+_STREAM_KEYWORD = re.compile(rb"\s*stream\r?\n")
+_PAGE_MARKER = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+
+
+class PdfStructureError(ValueError):
+    """Raised when the PDF structure cannot be followed."""
+
+
+def _ref(pattern: bytes) -> re.Pattern[bytes]:
+    return re.compile(pattern + rb"\s+(\d+)\s+(\d+)\s+R")
+
+
+_ROOT_REF = _ref(rb"/Root")
+_PAGES_REF = _ref(rb"/Pages")
+_PREV = re.compile(rb"/Prev\s+(\d+)")
+_XREF_STM = re.compile(rb"/XRefStm\s+(\d+)")
+_COUNT = re.compile(rb"/Count\s+(\d+)(?:\s+(\d+)\s+R)?")
+_LENGTH = re.compile(rb"/Length\s+(\d+)(?:\s+(\d+)\s+R)?")
+_INT_KEY = {key: re.compile(rb"/" + key + rb"\s+(\d+)") for key in (b"Size", b"Predictor", b"Columns", b"N", b"First")}
+_ARRAY_KEY = {key: re.compile(rb"/" + key + rb"\s*\[([^\]]*)\]") for key in (b"W", b"Index")}
+
+
+def _ints(raw: bytes) -> list[int]:
+    return [int(token) for token in raw.split()]
+
+
+def _dict_end(data: Buffer, start: int) -> int:
+    """Return the index just past the ``>>`` closing the dictionary at ``start``."""
+    if data[start : start + 2] != b"<<":
+        raise PdfStructureError("expected dictionary")
+    depth = 0
+    position = start
+    limit = len(data)
+    while position < limit - 1:
+        pair = data[position : position + 2]
+        if pair == b"<<":
+            depth += 1
+            position += 2
+        elif pair == b">>":
+            depth -= 1
+            position += 2
+            if depth == 0:
+                return position
+        else:
+            position += 1
+    raise PdfStructureError("unterminated dictionary")
+
+
+def _png_unpredict(raw: bytes, columns: int) -> bytes:
+    row_size = columns + 1
+    previous = bytearray(columns)
+    output = bytearray()
+    for offset in range(0, len(raw) - row_size + 1, row_size):
+        filter_type = raw[offset]
+        row = bytearray(raw[offset + 1 : offset + row_size])
+        for i in range(columns):
+            left = row[i - 1] if i else 0
+            up = previous[i]
+            if filter_type == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif filter_type == 2:
+                row[i] = (row[i] + up) & 0xFF
+            elif filter_type == 3:
+                row[i] = (row[i] + ((left + up) >> 1)) & 0xFF
+            elif filter_type == 4:
+                up_left = previous[i - 1] if i else 0
+                estimate = left + up - up_left
+                pa, pb, pc = abs(estimate - left), abs(estimate - up), abs(estimate - up_left)
+                predictor = left if pa <= pb and pa <= pc else up if pb <= pc else up_left
+                row[i] = (row[i] + predictor) & 0xFF
+        output.extend(row)
+        previous = row
+    return bytes(output)
+
+
+class PdfStructureReader:
+    """Lazy reader over the cross-reference chain of one PDF buffer."""
+
+    def __init__(self, data: Buffer) -> None:
+        self.data = data
+        self._entries: dict[int, tuple[int, int, int]] = {}
+        self._root: tuple[int, int] | None = None
+        self._object_streams: dict[int, tuple[bytes, list[int]]] = {}
+        self._loaded = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        tail_start = max(0, len(self.data) - TAIL_BYTES)
+        matches = list(_STARTXREF.finditer(self.data, tail_start))
+        if not matches:
+            raise PdfStructureError("startxref not found")
+        pending = [int(matches[-1].group(1))]
+        visited: set[int] = set()
+        while pending:
+            offset = pending.pop(0)
+            if offset in visited or offset >= len(self.data):
+                continue
+            visited.add(offset)
+            trailer = self._read_section(offset)
+            if self._root is None:
+                root = _ROOT_REF.search(trailer)
+                if root:
+                    self._root = (int(root.group(1)), int(root.group(2)))
+            for pattern in (_XREF_STM, _PREV):
+                found = pattern.search(trailer)
+                if found:
+                    pending.append(int(found.group(1)))
+        if self._root is None:
+            raise PdfStructureError("trailer has no /Root")
+        self._loaded = True
+
+    def _remember(self, number: int, entry: tuple[int, int, int]) -> None:
+        # Sections are read newest first, so the first entry seen wins.
+        self._entries.setdefault(number, entry)
+
+    def _read_section(self, offset: int) -> bytes:
+        header = _XREF_KEYWORD.match(self.data, offset)
+        if header:
+            return self._read_xref_table(header.end())
+        return self._read_xref_stream(offset)
+
+    def _read_xref_table(self, position: int) -> bytes:
+        while True:
+            subsection = _XREF_SUBSECTION.match(self.data, position)
+            if not subsection:
+                break
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            position = subsection.end()
+            for index in range(count):
+                entry = _XREF_ENTRY.search(self.data, position, position + 40)
+                if not entry:
+                    raise PdfStructureError("malformed xref entry")
+                position = entry.end()
+                if entry.group(3) == b"n":
+                    self._remember(first + index, (1, int(entry.group(1)), int(entry.group(2))))
+                else:
+                    self._remember(first + index, (0, 0, 0))
+        trailer = _TRAILER.match(self.data, position)
+        if not trailer:
+            raise PdfStructureError("trailer not found")
+        start = trailer.end()
+        return bytes(self.data[start : _dict_end(self.data, start)])
+
+    def _object_dict_and_stream(self, offset: int) -> tuple[bytes, bytes | None]:
+        header = _OBJ_HEADER.match(self.data, offset)
+        if not header:
+            raise PdfStructureError(f"no object at offset {offset}")
+        start = self.data.find(b"<<", header.end())
+        end = _dict_end(self.data, start)
+        dictionary = bytes(self.data[start:end])
+        stream = _STREAM_KEYWORD.match(self.data, end)
+        if not stream:
+            return dictionary, None
+        length_match = _LENGTH.search(dictionary)
+        if length_match and length_match.group(2) is None:
+            length = int(length_match.group(1))
+        elif length_match:
+            length = int(self._resolve(int(length_match.group(1))).strip().split()[0])
+        else:
+            length = self.data.find(b"endstream", stream.end()) - stream.end()
+        raw = bytes(self.data[stream.end() : stream.end() + length])
+        return dictionary, self._decode(dictionary, raw)
+
+    @staticmethod
+    def _decode(dictionary: bytes, raw: bytes) -> bytes:
+        if b"/FlateDecode" in dictionary:
+            raw = zlib.decompress(raw)
+        elif b"/Filter" in dictionary:
+            raise PdfStructureError("unsupported stream filter")
+        predictor = _INT_KEY[b"Predictor"].search(dictionary)
+        if predictor and int(predictor.group(1)) >= 10:
+            columns = _INT_KEY[b"Columns"].search(dictionary)
+            raw = _png_unpredict(raw, int(columns.group(1)) if columns else 1)
+        return raw
+
+    def _read_xref_stream(self, offset: int) -> bytes:
+        dictionary, stream = self._object_dict_and_stream(offset)
+        if stream is None or b"/XRef" not in dictionary:
+            raise PdfStructureError("expected xref stream")
+        widths_match = _ARRAY_KEY[b"W"].search(dictionary)
+        if not widths_match:
+            raise PdfStructureError("xref stream without /W")
+        widths = _ints(widths_match.group(1))
+        index_match = _ARRAY_KEY[b"Index"].search(dictionary)
+        if index_match:
+            index = _ints(index_match.group(1))
+        else:
+            size = _INT_KEY[b"Size"].search(dictionary)
+            index = [0, int(size.group(1)) if size else 0]
+        row_size = sum(widths)
+        position = 0
+        for first, count in zip(index[0::2], index[1::2]):
+            for number in range(first, first + count):
+                row = stream[position : position + row_size]
+                position += row_size
+                fields: list[int] = []
+                cursor = 0
+                for width in widths:
+                    fields.append(int.from_bytes(row[cursor : cursor + width], "big") if width else 0)
+                    cursor += width
+                kind = fields[0] if widths[0] else 1
+                self._remember(number, (kind, fields[1], fields[2]))
+        return dictionary
+
+    def _resolve(self, number: int) -> bytes:
+        self._load()
+        entry = self._entries.get(number)
+        if entry is None or entry[0] == 0:
+            raise PdfStructureError(f"object {number} not found")
+        kind, first, second = entry
+        if kind == 1:
+            header = _OBJ_HEADER.match(self.data, first)
+            if not header:
+                raise PdfStructureError(f"no object at offset {first}")
+            end = self.data.find(b"endobj", header.end())
+            return bytes(self.data[header.end() : end if end != -1 else None])
+        content, offsets = self._object_stream(first)
+        start = offsets[second]
+        end = offsets[second + 1] if second + 1 < len(offsets) else len(content)
+        return content[start:end]
+
+    def _object_stream(self, number: int) -> tuple[bytes, list[int]]:
+        cached = self._object_streams.get(number)
+        if cached is not None:
+            return cached
+        entry = self._entries.get(number)
+        if entry is None or entry[0] != 1:
+            raise PdfStructureError(f"object stream {number} not found")
+        dictionary, stream = self._object_dict_and_stream(entry[1])
+        count = _INT_KEY[b"N"].search(dictionary)
+        first = _INT_KEY[b"First"].search(dictionary)
+        if stream is None or not count or not first:
+            raise PdfStructureError("malformed object stream")
+        header = _ints(stream[: int(first.group(1))])
+        offsets = [int(first.group(1)) + off for off in header[1 : 2 * int(count.group(1)) : 2]]
+        self._object_streams[number] = (stream, offsets)
+        return stream, offsets
+
+    def page_count(self) -> int:
+        self._load()
+        assert self._root is not None
+        catalog = self._resolve(self._root[0])
+        pages = _PAGES_REF.search(catalog)
+        if not pages:
+            raise PdfStructureError("catalog has no /Pages")
+        tree = self._resolve(int(pages.group(1)))
+        count = _COUNT.search(tree)
+        if not count:
+            raise PdfStructureError("page tree has no /Count")
+        if count.group(2) is not None:
+            return int(self._resolve(int(count.group(1))).split()[0])
+        return int(count.group(1))
+
+
+def pdf_page_count(data: Buffer) -> int | None:
+    """Exact page count from the page tree, or ``None`` if the structure is unreadable."""
+    try:
+        return PdfStructureReader(data).page_count()
+    except (PdfStructureError, ValueError, IndexError, zlib.error):
+        return None
+
+
+def estimate_page_count(data: Buffer) -> int | None:
+    """Structural page count, falling back to counting page objects in the raw bytes."""
+    count = pdf_page_count(data)
+    if count is not None:
+        return count
+    return sum(1 for _ in _PAGE_MARKER.finditer(data)) or None
+
+
+def pdf_page_count_path(path: Path) -> int | None:
+    """Page count of a file on disk via ``mmap``, without reading it into memory."""
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            return None
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return estimate_page_count(mapped)
@@ -0,0 +1,181 @@
+"""Profiling for slow documents: where time and memory go, stage by stage.
+
+:class:`StageProfiler` is a :class:`~docreview.utils.metrics.MetricsCollector`
+that also runs :mod:`cProfile` on the pipeline thread, samples that thread's
+stack every ``interval`` seconds, and with ``memory`` diffs :mod:`tracemalloc`
+snapshots around every stage. Each stack sample is rooted at the stage that
+was running, so the collapsed-stack file renders as a flamegraph split by
+stage (``flamegraph.pl``, speedscope). The per-stage table keeps the metrics
+split of subprocess (poppler) and API (OpenAI) time; cProfile shows the rest,
+such as pydantic validation and regex scans.
+
+Profiled timings include the profilers' own overhead, so compare them with
+each other rather than with unprofiled runs. cProfile and tracemalloc are per
+process, so only one profiler is active at a time: one entered while another
+is running records stage metrics only and reports ``active`` as false.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+
+from docreview.core.enums import PipelineStage
+from docreview.core.schemas import StageMetrics
+from docreview.utils.metrics import MetricsCollector
+
+DEFAULT_SAMPLE_INTERVAL = 0.001
+DEFAULT_TOP = 25
+OUTSIDE_STAGE = "pipeline"
+
+_ACTIVE = threading.Lock()
+_RUN_IDS = itertools.count(1)
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+
+class StageProfiler(MetricsCollector):
+    """Metrics collector that also profiles; use as a context manager around the run."""
+
+    def __init__(
+        self, *, memory: bool = True, interval: float = DEFAULT_SAMPLE_INTERVAL, top: int = DEFAULT_TOP
+    ) -> None:
+        super().__init__("memory" if memory else "timing")
+        self.interval = interval
+        self.top = top
+        self.profile = cProfile.Profile()
+        self.samples: Counter[str] = Counter()
+        self.allocations: list[tuple[str, list[tracemalloc.StatisticDiff]]] = []
+        self._profiling = False
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._thread_id = 0
+        self._root: FrameType | None = None
+        self.run_id = f"{os.getpid()}-{next(_RUN_IDS)}"
+        self.active = False
+
+    def __enter__(self) -> StageProfiler:
+        self.active = _ACTIVE.acquire(blocking=False)
+        if not self.active:
+            return self
+        self._thread_id = threading.get_ident()
+        self._root = sys._getframe(1)
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name="docreview-profiler", daemon=True)
+        self._sampler.start()
+        self.profile.enable()
+        self._profiling = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if not self.active:
+            return
+        self.profile.disable()
+        self._profiling = False
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self._root = None
+        _ACTIVE.release()
+
+    @contextmanager
+    def stage(self, stage: PipelineStage) -> Iterator[StageMetrics]:
+        tracing = self.active and self.trace_memory and tracemalloc.is_tracing()
+        before = self._snapshot() if tracing else None
+        with super().stage(stage) as metrics:
+            yield metrics
+        if before is not None:
+            with self._paused():
+                diffs = self._snapshot().compare_to(before, "lineno")
+            grown = [diff for diff in diffs if diff.size_diff > 0]
+            self.allocations.append((stage.value, grown[: self.top]))
+
+    @contextmanager
+    def _paused(self) -> Iterator[None]:
+        # Keeps the profiler's own bookkeeping out of the cProfile report and the samples.
+        if not self._profiling:
+            yield
+            return
+        self.profile.disable()
+        self._profiling = False
+        try:
+            yield
+        finally:
+            self.profile.enable()
+            self._profiling = True
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        with self._paused():
+            return tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+            )
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self._profiling:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            current = self._current
+            names = []
+            while frame is not None and frame is not self._root:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            if frame is None:
+                # The thread is outside the profiled call.
+                continue
+            names.append(_frame_name(frame))
+            names.append(current.stage.value if current is not None else OUTSIDE_STAGE)
+            self.samples[";".join(reversed(names))] += 1
+
+    def collapsed(self) -> str:
+        """Stack samples in collapsed (``frame;frame count``) flamegraph format."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+
+    def report(self) -> str:
+        lines = ["Stages (seconds; peak memory in KiB):"]
+        lines.append(f"  {'stage':<10} {'wall':>8} {'cpu':>8} {'subproc':>8} {'api':>8} {'peak':>10} {'samples':>8}")
+        stage_samples: Counter[str] = Counter()
+        for stack, count in self.samples.items():
+            stage_samples[stack.split(";", 1)[0]] += count
+        for metrics in self.stages:
+            peak = "-" if metrics.peak_memory_bytes is None else f"{metrics.peak_memory_bytes / 1024:.1f}"
+            lines.append(
+                f"  {metrics.stage.value:<10} {metrics.wall_seconds:>8.4f} {metrics.cpu_seconds:>8.4f} "
+                f"{metrics.subprocess_seconds:>8.4f} {metrics.api_seconds:>8.4f} {peak:>10} "
+                f"{stage_samples[metrics.stage.value]:>8}"
+            )
+        for order, label in (("cumulative", "cumulative"), ("tottime", "own")):
+            text = io.StringIO()
+            pstats.Stats(self.profile, stream=text).strip_dirs().sort_stats(order).print_stats(self.top)
+            lines += ["", f"Top {self.top} functions by {label} time:", text.getvalue().strip()]
+        if self.allocations:
+            lines += ["", f"Top {self.top} allocation sites per stage (net growth):"]
+            for stage, diffs in self.allocations:
+                lines.append(f"  {stage}:")
+                lines += [f"    {diff}" for diff in diffs]
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: Path, name: str) -> list[Path]:
+        """Write ``<name>.pstats``, ``<name>.collapsed`` and ``<name>.profile.txt``."""
+        directory.mkdir(parents=True, exist_ok=True)
+        stats_path = directory / f"{name}.pstats"
+        collapsed_path = directory / f"{name}.collapsed"
+        report_path = directory / f"{name}.profile.txt"
+        self.profile.dump_stats(stats_path)
+        collapsed_path.write_text(self.collapsed(), encoding="utf-8")
+        report_path.write_text(self.report(), encoding="utf-8")
+        return [stats_path, collapsed_path, report_path]
@@ -1,14 +1,61 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime
+from pathlib import Path
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-def dump_model_json(model: BaseModel) -> str:
+JSON_STYLES = ("canonical", "pretty", "compact")
+
+
+def encode_model_json(model: BaseModel, style: str = "canonical") -> bytes:
+    """Serialize a model to UTF-8 JSON bytes.
+
+    ``canonical`` is the historical artifact format: sorted keys, two-space
+    indent, ASCII escapes. ``pretty`` (indented) and ``compact`` (one line)
+    keep the schema's field order and write UTF-8 directly; they are encoded
+    natively by orjson when it is installed, otherwise by pydantic-core.
+    """
+    if style == "canonical":
+        return dump_model_json(model).encode("ascii")
+    if style not in JSON_STYLES:
+        raise ValueError(f"style must be one of: {', '.join(JSON_STYLES)}")
+    indent = style == "pretty"
+    if orjson is not None:
+        return orjson.dumps(
+            model.model_dump(mode="json", by_alias=True),
+            option=orjson.OPT_INDENT_2 if indent else 0,
+        )
+    return model.model_dump_json(by_alias=True, indent=2 if indent else None).encode("utf-8")
+
+
+def dump_model_json(model: BaseModel, style: str = "canonical") -> str:
+    if style != "canonical":
+        return encode_model_json(model, style).decode("utf-8")
     return json.dumps(
         model.model_dump(mode="json", by_alias=True),
         sort_keys=True,
         indent=2,
         ensure_ascii=True,
     )
+
+
+def dump_model_json_line(model: BaseModel) -> str:
+    """Single-line form for JSONL sinks."""
+    return dump_model_json(model, "compact")
+
+
+def versioned_output_path(output_dir: Path, stem: str, suffix: str = ".json") -> Path:
+    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    candidate = output_dir / f"{stem}_{timestamp}{suffix}"
+    counter = 1
+    while candidate.exists():
+        candidate = output_dir / f"{stem}_{timestamp}_v{counter}{suffix}"
+        counter += 1
+    return candidate
@@ -0,0 +1,55 @@
+"""Chunked decoding of large plain-text inputs.
+
+Text documents above :func:`stream_threshold_bytes` are never decoded into one
+string. :func:`iter_text_chunks` yields decoded text in pieces that always end
+on a line break, so line-oriented consumers (keyword scoring, regex field
+extraction) see exactly the lines they would see in the full text.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+from collections.abc import Iterator
+
+from docreview.utils.pdf_structure import Buffer
+
+TEXT_EXTENSIONS = frozenset({".txt", ".md", ".json", ".csv"})
+DEFAULT_STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+PREVIEW_CHARS = 4096
+
+
+def stream_threshold_bytes() -> int:
+    return int(os.environ.get("DOCREVIEW_STREAM_THRESHOLD_BYTES", str(DEFAULT_STREAM_THRESHOLD_BYTES)))
+
+
+def should_stream(extension: str, size: int) -> bool:
+    """True for text inputs large enough to be processed chunk by chunk."""
+    return extension.lower() in TEXT_EXTENSIONS and size > stream_threshold_bytes()
+
+
+def iter_text_chunks(data: Buffer, *, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[str]:
+    """Decode UTF-8 ``data`` incrementally into chunks of whole lines.
+
+    Invalid bytes are replaced, as in ``str(data, "utf-8", errors="replace")``,
+    and the chunks concatenate to exactly that string.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    view = memoryview(data)
+    carry = ""
+    try:
+        for offset in range(0, len(view), chunk_bytes):
+            text = carry + decoder.decode(view[offset : offset + chunk_bytes])
+            # "\r\n" split across chunks must stay together, so never cut after a trailing "\r".
+            cut = max(text.rfind("\n"), text.rfind("\r", 0, len(text) - 1)) + 1
+            if cut:
+                yield text[:cut]
+                carry = text[cut:]
+            else:
+                carry = text
+        carry += decoder.decode(b"", final=True)
+        if carry:
+            yield carry
+    finally:
+        view.release()
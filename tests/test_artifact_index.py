@@ -0,0 +1,84 @@
+from pathlib import Path
+import json
+import os
+
+from typer.testing import CliRunner
+
+from docreview.cli import app
+from docreview.utils.artifact_index import ArtifactIndex
+
+runner = CliRunner()
+
+
+def _run(source: Path, out: Path) -> Path:
+    result = runner.invoke(app, ["run", "--input", str(source), "--output", str(out), "--fill-mode", "regex"])
+    assert result.exit_code in (0, 3)
+    return Path(result.stdout.strip().splitlines()[-1])
+
+
+def test_index_is_incremental_and_queryable(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "full.txt").write_text(
+        "Paystub\nGross Pay 12\nemployee_name: Jane Doe\nemployer_name: ACME\nnet_pay: 10", encoding="utf-8"
+    )
+    (docs / "partial.txt").write_text("Paystub\nGross Pay 12\nNet Pay\nemployee_name: John Roe", encoding="utf-8")
+    (docs / "unknown.txt").write_text("nothing useful", encoding="utf-8")
+    out = tmp_path / "out"
+    artifacts = {path.stem: _run(path, out) for path in sorted(docs.iterdir())}
+    db = tmp_path / "index.sqlite"
+
+    with ArtifactIndex(db) as index:
+        first = index.update([out])
+        assert (first.scanned, first.updated, first.failed) == (3, 3, 0)
+        assert index.update([out]).unchanged == 3
+
+        paystubs = index.query(document_type="paystub")
+        assert sorted(Path(row.path).name.split("_")[0] for row in paystubs) == ["full", "partial"]
+        missing = index.query(document_type="paystub", missing_field="net_pay")
+        assert [row.path for row in missing] == [str(artifacts["partial"].resolve())]
+        assert [row.file_name for row in index.query(field_equals=("net_pay", "10"))] == ["full.txt"]
+        blocking = {row.file_name for row in index.query(blocking=True)}
+        assert "unknown.txt" in blocking
+
+    artifacts["unknown"].unlink()
+    data = json.loads(artifacts["full"].read_text(encoding="utf-8"))
+    data["classify"]["document_type"] = "t4"
+    artifacts["full"].write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    os.utime(artifacts["full"], ns=(1, 1))
+
+    result = runner.invoke(app, ["index", "--input", str(out), "--db", str(db)])
+    assert result.exit_code == 0
+    assert "updated=1 unchanged=1 removed=1" in result.stdout
+
+    result = runner.invoke(app, ["query", "--db", str(db), "--doc-type", "t4", "--format", "paths"])
+    assert result.stdout.strip() == str(artifacts["full"].resolve())
+
+
+def test_query_matches_latest_version_only(tmp_path: Path) -> None:
+    source = tmp_path / "unknown.txt"
+    source.write_text("nothing useful", encoding="utf-8")
+    out = tmp_path / "out"
+    artifact = _run(source, out)
+    handoffs = json.loads(artifact.read_text(encoding="utf-8"))["handoffs"]
+    resolutions = [{"index": index, "resolution": "checked"} for index in range(len(handoffs))]
+    patch = tmp_path / "patch.json"
+    patch.write_text(json.dumps({"handoff_resolutions": resolutions}), encoding="utf-8")
+    result = runner.invoke(app, ["patch", "--input", str(artifact), "--patch", str(patch), "--output", str(out)])
+    assert result.exit_code == 0, result.output
+    patched = Path(result.stdout.strip())
+    db = tmp_path / "index.sqlite"
+
+    with ArtifactIndex(db) as index:
+        assert index.update([out]).updated == 2
+        assert index.query(blocking=True) == []
+        assert [row.path for row in index.query()] == [str(patched.resolve())]
+        assert [row.path for row in index.query(blocking=True, all_versions=True)] == [str(artifact.resolve())]
+
+    result = runner.invoke(app, ["query", "--db", str(db), "--blocking", "--all-versions", "--format", "paths"])
+    assert result.stdout.strip() == str(artifact.resolve())
+
+    result = runner.invoke(app, ["query", "--db", str(db), "--format", "JSON"])
+    assert json.loads(result.stdout.splitlines()[0])["path"] == str(patched.resolve())
+    result = runner.invoke(app, ["query", "--db", str(db), "--format", "path"])
+    assert result.exit_code == 2
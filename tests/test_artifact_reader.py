@@ -0,0 +1,55 @@
+from pathlib import Path
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from docreview.cli import app
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.artifact_reader import LazyArtifact, validate_artifact
+from docreview.utils.serialization import encode_model_json
+
+runner = CliRunner()
+PAYSTUB = Path(__file__).parent / "fixtures" / "paystub_sample.txt"
+
+
+@pytest.mark.parametrize("style", ["canonical", "pretty", "compact"])
+def test_lazy_sections_match_full_package(template_dir, created_at, style: str) -> None:
+    package = run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex")
+    artifact = LazyArtifact(encode_model_json(package, style))
+    assert artifact.classify == package.classify
+    assert artifact.validate_section == package.validate_section
+    assert artifact.handoffs == package.handoffs
+    assert artifact.render == package.render
+    assert "extract" not in artifact._sections
+    assert validate_artifact(artifact.data) == []
+
+
+def test_validate_artifact_reports_section_errors(template_dir, created_at) -> None:
+    package = run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex")
+    data = json.loads(encode_model_json(package))
+    data["classify"]["confidence"] = 3
+    del data["render"]
+    broken = json.dumps(data, sort_keys=True, indent=2).encode()
+    errors = validate_artifact(broken)
+    assert any(error.startswith("classify.confidence") for error in errors)
+    assert any(error.startswith("render") for error in errors)
+
+
+def test_summarize_directory(tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    for name in ("a.txt", "b.txt"):
+        source = tmp_path / name
+        source.write_text(PAYSTUB.read_text(encoding="utf-8"), encoding="utf-8")
+        assert runner.invoke(app, ["run", "--input", str(source), "--output", str(out), "--fill-mode", "regex"]).exit_code in (0, 3)
+    (out / "batch_summary_x.json").write_text("{}", encoding="utf-8")
+
+    result = runner.invoke(app, ["summarize", "--input", str(out), "--format", "json"])
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [Path(line["path"]).name.split("_")[0] for line in lines] == ["a", "b"]
+    assert all(line["document_type"] == "paystub" for line in lines)
+
+    markdown = runner.invoke(app, ["summarize", "--input", str(out)])
+    assert markdown.exit_code == 0
+    assert markdown.stdout.count("Document Review") == 2
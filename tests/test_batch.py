@@ -0,0 +1,118 @@
+from pathlib import Path
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from docreview.batch import BatchOptions, collect_inputs, run_batch
+from docreview.cli import app
+from docreview.utils.openai_stub import StubOpenAIServer
+
+runner = CliRunner()
+
+
+def _write_inputs(folder: Path) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "a.txt").write_text(
+        "Paystub\nemployee_name: Jane Doe\nemployer_name: ACME Corp\nnet_pay: 10",
+        encoding="utf-8",
+    )
+    (folder / "b.txt").write_text("x y z no matching keywords", encoding="utf-8")
+
+
+def test_collect_inputs_directory_manifest_and_glob(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    _write_inputs(docs)
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        json.dumps({"input": "docs/b.txt"}) + "\n\n" + json.dumps(str(docs / "a.txt")) + "\n",
+        encoding="utf-8",
+    )
+
+    assert [p.name for p in collect_inputs(str(docs))] == ["a.txt", "b.txt"]
+    assert [p.name for p in collect_inputs(str(manifest))] == ["b.txt", "a.txt"]
+    assert [p.name for p in collect_inputs(str(docs / "*.txt"))] == ["a.txt", "b.txt"]
+
+
+def test_run_batch_in_process_rolls_up_exit_codes(tmp_path: Path, template_dir, created_at) -> None:
+    docs = tmp_path / "docs"
+    _write_inputs(docs)
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="regex")
+    summary = run_batch(collect_inputs(str(docs)), tmp_path / "out", options, workers=1)
+
+    assert summary.total == 2
+    assert summary.succeeded == 1
+    assert summary.blocked == 1
+    assert summary.exit_code == 3
+    assert all(item.output_path and Path(item.output_path).exists() for item in summary.items)
+
+
+def test_run_batch_reports_failures(tmp_path: Path, template_dir, created_at) -> None:
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="regex")
+    summary = run_batch([tmp_path / "missing.txt"], tmp_path / "out", options, workers=1)
+    assert summary.failed == 1
+    assert summary.items[0].error
+    assert summary.exit_code == 1
+
+
+def test_run_batch_cli_with_worker_pool(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    output_dir = tmp_path / "out"
+    _write_inputs(docs)
+    result = runner.invoke(
+        app,
+        ["run-batch", "--input", str(docs), "--output", str(output_dir), "--workers", "2", "--fill-mode", "regex"],
+    )
+    assert result.exit_code == 3
+    summary_path = next(output_dir.glob("batch_summary_*.json"))
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["total"] == 2
+    assert summary["blocked"] == 1
+    assert len([p for p in output_dir.glob("*.json") if not p.name.startswith("batch_summary")]) == 2
+
+
+def test_run_batch_packs_field_fill_per_document_type(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for index in range(6):
+        (docs / f"pay{index}.txt").write_text(
+            f"Paystub\nemployee_name: Worker {index}\nemployer_name: ACME Corp\nnet_pay: {100 + index}",
+            encoding="utf-8",
+        )
+    (docs / "bank.txt").write_text("Bank Statement\nAccount Number: 12345\nOpening Balance: 10", encoding="utf-8")
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="llm")
+    with StubOpenAIServer() as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        single = run_batch(collect_inputs(str(docs)), tmp_path / "single", options, workers=1)
+        unpacked_requests = len(stub.requests)
+        packed = run_batch(
+            collect_inputs(str(docs)),
+            tmp_path / "packed",
+            options.model_copy(update={"fill_batch": 8}),
+            workers=1,
+        )
+        packed_requests = len(stub.requests) - unpacked_requests
+
+    assert unpacked_requests == 7
+    # All seven documents are in flight at once: one pack of paystubs, one for the bank statement.
+    assert packed_requests == 2
+    for left, right in zip(single.items, packed.items):
+        assert left.input_path == right.input_path
+        assert Path(left.output_path).read_text(encoding="utf-8") == Path(right.output_path).read_text(encoding="utf-8")
+
+
+def test_run_batch_ignores_fill_batch_without_llm_fill(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    import docreview.batch as batch_module
+
+    def no_threads(*args, **kwargs):
+        raise AssertionError("fill_batch should only switch to threads when LLM fill runs")
+
+    monkeypatch.setattr(batch_module, "ThreadPoolExecutor", no_threads)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    _write_inputs(tmp_path / "docs")
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="regex", fill_batch=8)
+    summary = run_batch(collect_inputs(str(tmp_path / "docs")), tmp_path / "out", options, workers=1)
+    assert summary.total == 2
+    assert summary.failed == 0
@@ -0,0 +1,118 @@
+from pathlib import Path
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from docreview.cli import app
+from docreview.stages.pipeline import rerun_pipeline, run_pipeline
+from docreview.utils.artifact_reader import validate_artifact
+from docreview.utils.blob_store import BlobStore
+from docreview.utils.openai_stub import StubOpenAIServer
+from docreview.utils.serialization import dump_model_json
+from docreview.utils.text_stream import PREVIEW_CHARS
+
+runner = CliRunner()
+
+
+def _paystub(tmp_path: Path) -> Path:
+    path = tmp_path / "paystub.txt"
+    lines = ["Paystub", "employee_name: Jane Doe", "employer_name: Acme Corp", "pay_date: 2024-01-31"]
+    lines += [f"line {row}: regular hours 8.00 rate 25.00" for row in range(400)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_external_text_shrinks_artifact_and_validates(tmp_path: Path, template_dir: Path, created_at: str) -> None:
+    source = _paystub(tmp_path)
+    blobs = BlobStore(tmp_path / "blobs")
+    inline = run_pipeline(source, template_dir, created_at, fill_mode="regex")
+    external = run_pipeline(source, template_dir, created_at, fill_mode="regex", blobs=blobs, external_text=True)
+
+    assert external.extract.text == inline.extract.text[:PREVIEW_CHARS]
+    assert blobs.read_bytes(external.extract.text_ref).decode("utf-8") == inline.extract.text
+    assert external.normalize == inline.normalize
+    assert len(dump_model_json(external)) < len(dump_model_json(inline)) - 10_000
+    assert validate_artifact(dump_model_json(external).encode("utf-8"), blobs, verify_blobs=True) == []
+    assert validate_artifact(dump_model_json(inline).encode("utf-8"), blobs) == []
+
+    rerun = rerun_pipeline(external, "classify", template_dir, created_at, blobs=blobs)
+    assert rerun.normalize == inline.normalize
+
+    blobs.path(external.extract.text_ref).write_bytes(b"tampered")
+    errors = validate_artifact(dump_model_json(external).encode("utf-8"), blobs)
+    assert any("artifact records" in error for error in errors)
+    blobs.path(external.extract.text_ref).unlink()
+    errors = validate_artifact(dump_model_json(external).encode("utf-8"), blobs)
+    assert any("not found" in error for error in errors)
+
+    bad = json.loads(dump_model_json(external))
+    bad["extract"]["text_ref"] = "sha256:xyz"
+    assert validate_artifact(json.dumps(bad).encode("utf-8"))
+
+
+def test_patch_versions_share_one_text_blob(tmp_path: Path) -> None:
+    source = _paystub(tmp_path)
+    output = tmp_path / "out"
+    result = runner.invoke(
+        app, ["run", "--input", str(source), "--output", str(output), "--fill-mode", "regex", "--external-text"]
+    )
+    assert result.exit_code == 0, result.output
+    artifact = sorted(output.glob("*.json"))[0]
+    patch = tmp_path / "patch.json"
+    update = {"field_name": "employee_name", "value": "Jane A. Doe", "confidence": 0.95, "source": "agent_review"}
+    patch.write_text(json.dumps({"field_updates": [update]}), encoding="utf-8")
+    for _ in range(2):
+        result = runner.invoke(app, ["patch", "--input", str(artifact), "--patch", str(patch), "--output", str(output)])
+        assert result.exit_code == 0, result.output
+
+    versions = [json.loads(path.read_text(encoding="utf-8")) for path in sorted(output.glob("*.json"))]
+    assert len(versions) == 3
+    assert len({version["extract"]["text_ref"] for version in versions}) == 1
+    assert len([path for path in (output / ".docreview-blobs").rglob("*") if path.is_file()]) == 1
+
+    check = runner.invoke(app, ["validate-json", "--input", str(artifact), "--verify-blobs"])
+    assert check.exit_code == 0, check.output
+    missing = runner.invoke(app, ["validate-json", "--input", str(artifact), "--blob-dir", str(tmp_path / "none")])
+    assert missing.exit_code == 2
+
+
+def test_patch_into_another_folder_carries_blobs(tmp_path: Path) -> None:
+    source = _paystub(tmp_path)
+    first, second = tmp_path / "a", tmp_path / "b"
+    result = runner.invoke(
+        app, ["run", "--input", str(source), "--output", str(first), "--fill-mode", "regex", "--external-text"]
+    )
+    assert result.exit_code == 0, result.output
+    artifact = Path(result.stdout.strip().splitlines()[-1])
+    patch = tmp_path / "patch.json"
+    patch.write_text(json.dumps({"field_updates": []}), encoding="utf-8")
+    result = runner.invoke(app, ["patch", "--input", str(artifact), "--patch", str(patch), "--output", str(second)])
+    assert result.exit_code == 0, result.output
+    patched = Path(result.stdout.strip())
+    check = runner.invoke(app, ["validate-json", "--input", str(patched), "--verify-blobs"])
+    assert check.exit_code == 0, check.output
+
+    (first / ".docreview-blobs").rename(tmp_path / "moved")
+    check = runner.invoke(app, ["validate-json", "--input", str(artifact)])
+    assert check.exit_code == 1 and "no blob store" in check.output
+    rerun = runner.invoke(app, ["run", "--from-artifact", str(artifact), "--output", str(tmp_path / "rerun")])
+    assert rerun.exit_code == 2 and "--blob-dir" in rerun.output
+
+
+def test_ocr_page_images_are_referenced(tmp_path: Path, template_dir: Path, created_at: str, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    image_module = pytest.importorskip("PIL.Image")
+    scan = tmp_path / "scan.png"
+    buffer = io.BytesIO()
+    image_module.new("L", (120, 160), color=240).save(buffer, format="PNG")
+    scan.write_bytes(buffer.getvalue())
+    blobs = BlobStore(tmp_path / "blobs")
+    with StubOpenAIServer() as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        package = run_pipeline(scan, template_dir, created_at, fill_mode="regex", blobs=blobs, external_text=True)
+    assert package.extract.method == "openai_vision"
+    assert package.extract.image_refs == [blobs.put(scan.read_bytes())]
+    assert validate_artifact(dump_model_json(package).encode("utf-8"), blobs, verify_blobs=True) == []
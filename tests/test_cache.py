@@ -0,0 +1,120 @@
+from pathlib import Path
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+import docreview.stages.pipeline as pipeline_module
+from docreview.cli import app
+from docreview.core.schemas import ClassifySection, ExtractSection, NormalizeSection
+from docreview.core.template_loader import load_templates
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.artifact_cache import ArtifactCache, CacheEntry, cache_key
+from docreview.utils.openai_stub import StubOpenAIServer
+
+runner = CliRunner()
+
+
+def _entry(key: str, text: str = "sample") -> CacheEntry:
+    return CacheEntry(
+        key=key,
+        extract=ExtractSection(ok=True, text=text, used_ocr_stub=False, method="text_layer"),
+        classify=ClassifySection(ok=True, document_type="paystub", confidence=0.9),
+        normalize=NormalizeSection(ok=True, fields={}),
+    )
+
+
+def test_cache_key_depends_on_models_and_templates(template_dir) -> None:
+    templates = load_templates(template_dir)
+    base = dict(ocr_model="gpt-4o", field_model="gpt-4o", fill_mode="auto", llm_available=False)
+    key = cache_key("a" * 64, templates, **base)
+    assert key == cache_key("a" * 64, templates, **base)
+    assert key != cache_key("a" * 64, templates, **{**base, "field_model": "gpt-4.1-mini"})
+    templates["paystub"] = templates["paystub"].model_copy(update={"version": "2.0"})
+    assert key != cache_key("a" * 64, templates, **base)
+
+
+def test_cache_round_trip_and_lru_eviction(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path, max_bytes=12_000)
+    for index, key in enumerate(["a" * 64, "b" * 64, "c" * 64]):
+        cache.put(_entry(key, text="x" * 3000))
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, ns=(index * 10**9, index * 10**9))
+
+    assert cache.get("a" * 64) is not None  # refreshes recency of "a"
+    cache.put(_entry("d" * 64, text="x" * 3000))
+
+    assert cache.get("b" * 64) is None
+    assert cache.get("a" * 64) is not None
+    assert cache.get("d" * 64) is not None
+
+
+def test_pipeline_cache_hit_skips_upstream_stages(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    fixture = Path(__file__).parent / "fixtures" / "paystub_sample.txt"
+    cache = ArtifactCache(tmp_path / "cache")
+    first = run_pipeline(fixture, template_dir, created_at, fill_mode="regex", cache=cache)
+
+    def fail_extract(**kwargs):
+        raise AssertionError("extract should not run on a cache hit")
+
+    monkeypatch.setattr(pipeline_module, "extract", fail_extract)
+    second = run_pipeline(fixture, template_dir, created_at, fill_mode="regex", cache=cache)
+
+    assert second.normalize == first.normalize
+    assert second.handoffs == first.handoffs
+    assert any(event.event == "cache_hit" for event in second.audit)
+    assert second.validate_section == first.validate_section
+
+
+def test_run_cache_is_opt_in(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv("DOCREVIEW_CACHE_DIR", raising=False)
+    input_file = tmp_path / "paystub.txt"
+    input_file.write_text("Paystub\nemployee_name: Jane Doe\nemployer_name: ACME\nnet_pay: 1", encoding="utf-8")
+
+    cached_out = tmp_path / "cached"
+    for _ in range(2):
+        result = runner.invoke(app, ["run", "--input", str(input_file), "--output", str(cached_out), "--cache"])
+        assert result.exit_code == 0
+    latest = sorted(cached_out.glob("*.json"))[-1]
+    payload = json.loads(latest.read_text(encoding="utf-8"))
+    assert any(event["event"] == "cache_hit" for event in payload["audit"])
+
+    uncached_out = tmp_path / "uncached"
+    for _ in range(2):
+        result = runner.invoke(app, ["run", "--input", str(input_file), "--output", str(uncached_out)])
+        assert result.exit_code == 0
+    assert not (uncached_out / ".docreview-cache").exists()
+    latest = sorted(uncached_out.glob("*.json"))[-1]
+    assert not any(event["event"] == "cache_hit" for event in json.loads(latest.read_text(encoding="utf-8"))["audit"])
+
+    monkeypatch.setenv("DOCREVIEW_CACHE_DIR", str(tmp_path / "env-cache"))
+    result = runner.invoke(app, ["run", "--input", str(input_file), "--output", str(uncached_out), "--no-cache"])
+    assert result.exit_code == 0
+    assert not (tmp_path / "env-cache").exists()
+
+
+def test_failed_ocr_is_not_cached(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    import docreview.stages.extract as extract_module
+
+    scan = tmp_path / "scan.pdf"
+    scan.write_bytes(b"%PDF-1.4 scanned")
+    monkeypatch.setattr(extract_module, "extract_text_layer", lambda data: None)
+    monkeypatch.setattr(extract_module, "pdf_to_images", lambda data: [b"p1", b"p2"])
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DOCREVIEW_OPENAI_MAX_ATTEMPTS", "1")
+    cache = ArtifactCache(tmp_path / "cache")
+
+    with StubOpenAIServer(fail_first=10**6) as failing:
+        monkeypatch.setenv("OPENAI_BASE_URL", failing.base_url)
+        first = run_pipeline(scan, template_dir, created_at, fill_mode="regex", cache=cache)
+    assert first.extract.used_ocr_stub
+
+    with StubOpenAIServer() as healthy:
+        monkeypatch.setenv("OPENAI_BASE_URL", healthy.base_url)
+        second = run_pipeline(scan, template_dir, created_at, fill_mode="regex", cache=cache)
+        assert len(healthy.requests) == 2
+    assert not any(event.event == "cache_hit" for event in second.audit)
+    assert second.extract.method == "openai_vision_pages"
+    assert "[OCR_STUB" not in second.extract.text
@@ -333,6 +333,7 @@ def test_run_llm_mode_uses_field_model(tmp_path: Path, monkeypatch) -> None:
         *,
         api_key: str,
         model: str,
+        field_fill=None,
     ) -> NormalizeSection:
         captured["model"] = model
         proposal = FieldProposal(
@@ -371,3 +372,60 @@ def test_run_llm_mode_uses_field_model(tmp_path: Path, monkeypatch) -> None:
     artifact = sorted(output_dir.glob("*.json"))[0]
     payload = json.loads(artifact.read_text(encoding="utf-8"))
     assert payload["normalize"]["fields"]["employee_name"][0]["source"] == "openai_field_fill"
+
+
+def test_run_from_artifact_reruns_downstream_stages(tmp_path: Path) -> None:
+    input_file = tmp_path / "paystub.txt"
+    input_file.write_text("Paystub\nemployee_name: Jane Doe\nemployer_name: ACME Corp\nnet_pay: 1", encoding="utf-8")
+    first = runner.invoke(app, ["run", "--input", str(input_file), "--output", str(tmp_path / "a"), "--fill-mode", "regex"])
+    artifact = Path(first.stdout.strip())
+    input_file.unlink()
+
+    rerun = runner.invoke(
+        app,
+        ["run", "--from-artifact", str(artifact), "--from-stage", "validate", "--output", str(tmp_path / "b")],
+    )
+    assert rerun.exit_code == 0
+    payload = json.loads(Path(rerun.stdout.strip()).read_text(encoding="utf-8"))
+    assert payload["metadata"]["file_name"] == "paystub.txt"
+    assert "rerun" in [event["event"] for event in payload["audit"]]
+
+    bad = runner.invoke(app, ["run", "--from-artifact", str(artifact), "--from-stage", "extract", "--output", str(tmp_path)])
+    assert bad.exit_code == 2
+
+    ignored = runner.invoke(app, ["run", "--input", str(artifact), "--from-stage", "validate", "--output", str(tmp_path)])
+    assert ignored.exit_code == 2 and "--from-artifact" in ignored.output
+
+
+def test_patch_batch_writes_each_artifact_once(tmp_path: Path) -> None:
+    output = tmp_path / "out"
+    artifacts = []
+    for name in ("first", "second"):
+        source = tmp_path / f"{name}.txt"
+        source.write_text("Paystub\nemployee_name: Jane Doe\nemployer_name: ACME\n", encoding="utf-8")
+        runner.invoke(app, ["run", "--input", str(source), "--output", str(tmp_path / name)])
+        artifacts.append(sorted((tmp_path / name).glob("*.json"))[0])
+    relative = str(artifacts[0].relative_to(tmp_path))
+    spellings = [relative, str(artifacts[1]), f"./{relative}", str(artifacts[1]), str(artifacts[0])]
+    lines = [
+        {
+            "artifact": spelling,
+            "patch": {"field_updates": [{"field_name": "net_pay", "value": index, "confidence": 0.9}]},
+        }
+        for index, spelling in enumerate(spellings)
+    ]
+    patches = tmp_path / "patches.jsonl"
+    patches.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n", encoding="utf-8")
+
+    result = runner.invoke(app, ["patch-batch", "--patches", str(patches), "--output", str(output)])
+    assert result.exit_code == 0, result.output
+    written = result.output.split()
+    assert len(written) == 2
+    first = json.loads(Path(written[0]).read_text(encoding="utf-8"))
+    assert [p["value"] for p in first["normalize"]["fields"]["net_pay"]] == [0, 2, 4]
+
+    patches.write_text(json.dumps({"artifact": "missing.json", "patch": {}}) + "\n", encoding="utf-8")
+    assert runner.invoke(app, ["patch-batch", "--patches", str(patches), "--output", str(output)]).exit_code == 2
+    patches.write_text('{"patch": {}}\n', encoding="utf-8")
+    bad = runner.invoke(app, ["patch-batch", "--patches", str(patches), "--output", str(output)])
+    assert bad.exit_code == 2 and "patches.jsonl:1" in bad.output
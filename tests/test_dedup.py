@@ -0,0 +1,167 @@
+from pathlib import Path
+import io
+
+import pytest
+
+from docreview.core.enums import HandoffReason
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.dedup import DedupStore, dhash, hamming, simhash
+from docreview.utils.openai_stub import StubOpenAIServer
+
+PAYSTUB = Path(__file__).parent / "fixtures" / "paystub_sample.txt"
+
+
+def _scan(path: Path, fmt: str, shade: int) -> Path:
+    image_module = pytest.importorskip("PIL.Image")
+    draw_module = pytest.importorskip("PIL.ImageDraw")
+    image = image_module.new("L", (400, 520), color=shade)
+    draw = draw_module.Draw(image)
+    for row in range(12):
+        draw.rectangle((40, 40 + row * 38, 40 + (row * 53) % 300 + 40, 60 + row * 38), fill=30)
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    path.write_bytes(buffer.getvalue())
+    return path
+
+
+def test_fingerprints_separate_near_duplicates_from_other_documents() -> None:
+    text = PAYSTUB.read_text(encoding="utf-8") + "deductions and earnings for the period\n" * 20
+    resaved = text.replace("\n", "\r\n").upper()
+    other = "Bank Statement\naccount_holder_name: Mei Chen\naccount_number: 12345\n" * 5
+    assert hamming(simhash(text), simhash(resaved)) == 0
+    assert hamming(simhash(text), simhash(text + "page 2 of 2\n")) <= 3
+    assert hamming(simhash(text), simhash(other)) > 7
+
+
+def _paystub_text(name: str, net_pay: str) -> str:
+    lines = ["Paystub", f"employee_name: {name}", "employer_name: ACME Corp", f"net_pay: {net_pay}"]
+    lines += [f"earnings line {row}: regular hours 8.00 rate 25.00" for row in range(30)]
+    return "\n".join(lines) + "\n"
+
+
+def _text_pdf(text: str) -> bytes:
+    shown = " ".join(f"({line}) Tj T*" for line in text.splitlines())
+    stream = f"BT /F1 9 Tf 11 TL 36 760 Td {shown} ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def test_identical_text_reuses_llm_outputs(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    original = tmp_path / "paystub.pdf"
+    original.write_bytes(_text_pdf(_paystub_text("Jane Doe", "2450.25")))
+    # A viewer re-save: different bytes, identical text layer.
+    resaved = tmp_path / "paystub_resaved.pdf"
+    resaved.write_bytes(original.read_bytes() + b"% saved again\n")
+    with StubOpenAIServer() as stub, DedupStore(tmp_path / "dedup.sqlite") as store:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        first = run_pipeline(original, template_dir, created_at, fill_mode="llm", dedup=store)
+        if not first.extract.text.strip():
+            pytest.skip("no PDF text layer backend available")
+        calls = len(stub.requests)
+        second = run_pipeline(resaved, template_dir, created_at, fill_mode="llm", dedup=store)
+        assert len(stub.requests) == calls
+        regex = run_pipeline(resaved, template_dir, created_at, fill_mode="regex", dedup=store)
+
+    assert not any(h.reason == HandoffReason.NEAR_DUPLICATE for h in first.handoffs)
+    reuse = [h for h in second.handoffs if h.reason == HandoffReason.NEAR_DUPLICATE]
+    assert len(reuse) == 1 and reuse[0].blocking
+    assert first.metadata.file_hash[:12] in reuse[0].message
+    assert second.normalize == first.normalize
+    assert second.metadata.file_hash != first.metadata.file_hash
+    assert "dedup_hit" in [a.event for a in second.audit]
+    # Different settings never share results.
+    assert not any(h.reason == HandoffReason.NEAR_DUPLICATE for h in regex.handoffs)
+
+
+def test_same_template_for_another_person_is_not_reused(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    jane, mei = _paystub_text("Jane Sharma", "3221.96"), _paystub_text("Mei Chen", "1875.40")
+    assert hamming(simhash(jane), simhash(mei)) <= 3
+    (tmp_path / "jane.txt").write_text(jane, encoding="utf-8")
+    (tmp_path / "mei.txt").write_text(mei, encoding="utf-8")
+    with StubOpenAIServer() as stub, DedupStore(tmp_path / "dedup.sqlite") as store:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        run_pipeline(tmp_path / "jane.txt", template_dir, created_at, fill_mode="llm", dedup=store)
+        calls = len(stub.requests)
+        second = run_pipeline(tmp_path / "mei.txt", template_dir, created_at, fill_mode="llm", dedup=store)
+        assert len(stub.requests) > calls
+
+    assert second.normalize.fields["employee_name"][-1].value == "Mei Chen"
+    assert second.normalize.fields["net_pay"][-1].value == "1875.40"
+    assert not any(h.reason == HandoffReason.NEAR_DUPLICATE for h in second.handoffs)
+
+
+def test_rescanned_image_is_reported_but_not_reused(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    original = _scan(tmp_path / "scan.png", "PNG", 250)
+    rescan = _scan(tmp_path / "rescan.jpg", "JPEG", 244)
+    assert hamming(dhash(original.read_bytes()), dhash(rescan.read_bytes())) <= 6
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(original.read_bytes())
+
+    with StubOpenAIServer() as stub, DedupStore(tmp_path / "dedup.sqlite") as store:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        first = run_pipeline(original, template_dir, created_at, fill_mode="regex", dedup=store)
+        calls = len(stub.requests)
+        second = run_pipeline(rescan, template_dir, created_at, fill_mode="regex", dedup=store)
+        assert len(stub.requests) == calls + 1
+        calls = len(stub.requests)
+        third = run_pipeline(copy, template_dir, created_at, fill_mode="regex", dedup=store)
+        assert len(stub.requests) == calls
+
+    assert first.extract.method == "openai_vision"
+    # A similar layout may be another person's form: report it, but OCR this scan.
+    assert "dedup_hit" not in [a.event for a in second.audit]
+    similar = [h for h in second.handoffs if h.reason == HandoffReason.NEAR_DUPLICATE]
+    assert len(similar) == 1 and not similar[0].blocking
+    # An identical file may reuse the OCR text.
+    assert third.extract == first.extract
+    reuse = [h for h in third.handoffs if h.reason == HandoffReason.NEAR_DUPLICATE]
+    assert len(reuse) == 1 and reuse[0].blocking
+    assert [a.event for a in third.audit if a.stage.value == "classify"] == ["completed"]
+
+
+def test_scanned_pdf_pages_are_rendered_once(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    import docreview.stages.extract as extract_module
+    import docreview.utils.dedup as dedup_module
+
+    page = _scan(tmp_path / "page.png", "PNG", 250).read_bytes()
+    renders: list[int] = []
+
+    def render(data):
+        renders.append(len(data))
+        return [page, page]
+
+    scan = tmp_path / "scan.pdf"
+    scan.write_bytes(b"%PDF-1.4 scanned")
+    for module in (extract_module, dedup_module):
+        monkeypatch.setattr(module, "extract_text_layer", lambda data: None)
+        monkeypatch.setattr(module, "pdf_to_images", render)
+    with StubOpenAIServer() as stub, DedupStore(tmp_path / "dedup.sqlite") as store:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        package = run_pipeline(scan, template_dir, created_at, fill_mode="regex", dedup=store)
+
+    assert package.extract.page_count == 2
+    assert len(renders) == 1
@@ -1,9 +1,11 @@
+import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 
 from docreview.core.template_loader import DocumentTemplate, TemplateField
 from docreview.stages.normalize import normalize_llm
-from docreview.utils.openai_field_fill import openai_field_fill
+from docreview.utils.openai_field_fill import FieldFillBatcher, openai_field_fill, openai_field_fill_packed
 
 
 def _template() -> DocumentTemplate:
@@ -35,7 +37,7 @@ def test_openai_field_fill_parses_json_and_filters_unknown_fields(monkeypatch) -
             )
 
     class FakeClient:
-        def __init__(self, api_key: str):
+        def __init__(self, api_key: str, **kwargs):
             _ = api_key
             self.responses = FakeResponses()
 
@@ -69,7 +71,7 @@ def test_normalize_llm_ignores_null_values(monkeypatch) -> None:
             )
 
     class FakeClient:
-        def __init__(self, api_key: str):
+        def __init__(self, api_key: str, **kwargs):
             _ = api_key
             self.responses = FakeResponses()
 
@@ -84,3 +86,82 @@ def test_normalize_llm_ignores_null_values(monkeypatch) -> None:
     )
     assert "employee_name" in section.fields
     assert "net_pay" not in section.fields
+
+
+def test_packed_field_fill_demultiplexes_and_retries_missing_documents(monkeypatch) -> None:
+    requests: list[list[str]] = []
+
+    class FakeResponses:
+        @staticmethod
+        def create(**kwargs):
+            texts = [part["text"] for part in kwargs["input"][0]["content"]]
+            requests.append(texts)
+            if any(text.startswith("DOCUMENT_TEXT:") for text in texts):
+                values = [{"field_name": "employee_name", "value": "Retried", "confidence": 0.5}]
+                return SimpleNamespace(output_text=json.dumps({"field_values": values}))
+            documents = [
+                {"document": 2, "field_values": [{"field_name": "employee_name", "value": "Two", "confidence": 0.9}]},
+                {"document": "1", "field_values": [{"field_name": "net_pay", "value": 1, "confidence": 0.9}]},
+                {"document": "3", "field_values": [{"field_name": "employee_name", "value": "Bad", "confidence": 7}]},
+            ]
+            return SimpleNamespace(output_text=json.dumps({"documents": documents}))
+
+    class FakeClient:
+        def __init__(self, api_key: str, **kwargs):
+            self.responses = FakeResponses()
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeClient))
+
+    results = openai_field_fill_packed(
+        texts=["net_pay: 1", "employee_name: Two", "employee_name: Three"],
+        template=_template(),
+        api_key="test-key",
+        model="gpt-4.1-mini",
+    )
+    assert [[item.value for item in items] for items in results] == [[1], ["Two"], ["Retried"]]
+    assert len(requests) == 2
+    assert requests[0][1].startswith("TEMPLATE_FIELDS:")
+    assert [text.split("\n", 1)[0] for text in requests[0][2:5]] == ["DOCUMENT 1:", "DOCUMENT 2:", "DOCUMENT 3:"]
+
+
+def test_field_fill_batcher_packs_by_size(monkeypatch) -> None:
+    sizes: list[int] = []
+
+    def fake_packed(*, texts, template, api_key, model):
+        sizes.append(len(texts))
+        return [[] for _ in texts]
+
+    monkeypatch.setattr("docreview.utils.openai_field_fill.openai_field_fill_packed", fake_packed)
+    batcher = FieldFillBatcher(max_documents=3, max_chars=100, linger=0.2)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda text: batcher.fill(text=text, template=_template(), api_key="k", model="m"), ["x" * 40] * 4))
+
+    # 100 characters fit two 40-character documents, so four documents need two packs.
+    assert sorted(sizes) == [2, 2]
+    assert batcher.requests == 2
+
+
+def test_field_fill_batcher_falls_back_to_single_documents(monkeypatch) -> None:
+    def failing_packed(*, texts, template, api_key, model):
+        raise RuntimeError("pack rejected")
+
+    def fake_single(*, text, template, api_key, model):
+        if text == "bad":
+            raise ValueError("unparseable response")
+        return [text]
+
+    monkeypatch.setattr("docreview.utils.openai_field_fill.openai_field_fill_packed", failing_packed)
+    monkeypatch.setattr("docreview.utils.openai_field_fill.openai_field_fill", fake_single)
+    batcher = FieldFillBatcher(max_documents=3, max_chars=100, linger=5.0)
+
+    def fill(text: str):
+        try:
+            return batcher.fill(text=text, template=_template(), api_key="k", model="m")
+        except ValueError as exc:
+            return str(exc)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(fill, ["one", "bad", "two"]))
+
+    assert results == [["one"], "unparseable response", ["two"]]
+    assert batcher.requests == 4
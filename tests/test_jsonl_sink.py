@@ -0,0 +1,54 @@
+from pathlib import Path
+import hashlib
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from docreview.cli import app
+from docreview.utils.jsonl_sink import JsonlSink, iter_records, read_index, read_record
+
+runner = CliRunner()
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_sink_rotates_and_indexes_records(tmp_path: Path, compression: str) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    records = [json.dumps({"n": i, "pad": hashlib.sha256(str(i).encode()).hexdigest() * 4}, separators=(",", ":")) for i in range(20)]
+    with JsonlSink(tmp_path, compression=compression, max_bytes=1024) as sink:
+        for i, record in enumerate(records):
+            sink.write(record, document_id=f"doc{i}")
+
+    shards = sorted(p.name for p in tmp_path.glob("artifacts-*"))
+    assert len(shards) > 1
+    assert list(iter_records(tmp_path)) == records
+    entries = list(read_index(tmp_path))
+    assert [e.document_id for e in entries] == [f"doc{i}" for i in range(20)]
+    assert read_record(tmp_path, entries[13]) == records[13]
+
+    with JsonlSink(tmp_path, compression=compression, max_bytes=1024) as sink:
+        sink.write(records[0])
+    assert len(list(tmp_path.glob("artifacts-*"))) == len(shards) + 1
+    assert read_record(tmp_path, entries[13]) == records[13]
+
+
+def test_run_batch_jsonl_sink(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("Paystub\nemployee_name: Jane Doe\nemployer_name: ACME\nnet_pay: 10", encoding="utf-8")
+    (docs / "b.txt").write_text("nothing to see", encoding="utf-8")
+    out = tmp_path / "out"
+    result = runner.invoke(
+        app,
+        [
+            "run-batch", "--input", str(docs), "--output", str(out), "--workers", "1",
+            "--fill-mode", "regex", "--sink", "jsonl", "--jsonl-compression", "gzip", "--no-cache",
+        ],
+    )
+    assert result.exit_code == 3
+    assert not list(out.glob("a_*.json"))
+    packages = [json.loads(line) for line in iter_records(out)]
+    assert [p["metadata"]["file_name"] for p in packages] == ["a.txt", "b.txt"]
+    summary = json.loads(next(out.glob("batch_summary_*.json")).read_text(encoding="utf-8"))
+    assert summary["items"][1]["output_offset"] == next(iter(read_index(out))).length
@@ -0,0 +1,76 @@
+from pathlib import Path
+import json
+import urllib.request
+
+import pytest
+from typer.testing import CliRunner
+
+from docreview.batch import BatchOptions
+from docreview.cli import app
+from docreview.core.enums import PipelineStage
+from docreview.server import ReviewServer
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.metrics import prometheus_text
+from docreview.utils.openai_stub import StubOpenAIServer
+from docreview.utils.serialization import dump_model_json
+
+PAYSTUB = Path(__file__).parent / "fixtures" / "paystub_sample.txt"
+
+
+def test_metrics_are_opt_in_and_leave_artifacts_unchanged(template_dir, created_at, monkeypatch) -> None:
+    monkeypatch.delenv("DOCREVIEW_METRICS", raising=False)
+    plain = run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex")
+    assert plain.metrics is None
+    assert "metrics" not in json.loads(dump_model_json(plain))
+
+    measured = run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex", metrics="memory")
+    assert measured.metrics is not None
+    assert [stage.stage for stage in measured.metrics.stages] == [
+        PipelineStage.INGEST,
+        PipelineStage.EXTRACT,
+        PipelineStage.CLASSIFY,
+        PipelineStage.NORMALIZE,
+        PipelineStage.VALIDATE,
+        PipelineStage.RENDER,
+    ]
+    assert all(stage.wall_seconds >= 0 and stage.peak_memory_bytes is not None for stage in measured.metrics.stages)
+    assert measured.model_copy(update={"metrics": None}) == plain
+
+    text = prometheus_text([measured.metrics])
+    assert "docreview_documents_total 1" in text
+    assert 'docreview_stage_wall_seconds_count{stage="normalize"} 1' in text
+
+
+def test_api_latency_and_tokens_are_attributed_to_normalize(template_dir, created_at, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    with StubOpenAIServer() as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        package = run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="llm", metrics="timing")
+    assert package.metrics is not None
+    normalize = next(stage for stage in package.metrics.stages if stage.stage == PipelineStage.NORMALIZE)
+    assert normalize.api_calls == 1
+    assert normalize.api_seconds > 0
+    assert normalize.api_input_tokens > 0 and normalize.api_output_tokens > 0
+
+
+def test_metrics_command_and_server_endpoint(tmp_path: Path, template_dir, created_at, monkeypatch) -> None:
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    output = tmp_path / "out"
+    result = CliRunner().invoke(
+        app,
+        ["run", "--input", str(PAYSTUB), "--output", str(output), "--templates", str(template_dir),
+         "--fill-mode", "regex", "--no-cache", "--metrics", "timing"],
+    )
+    assert result.exit_code in (0, 3), result.output
+    result = CliRunner().invoke(app, ["metrics", "--input", str(output)])
+    assert result.exit_code == 0
+    assert 'docreview_stage_cpu_seconds_total{stage="extract"}' in result.output
+
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="regex", metrics="timing")
+    with ReviewServer(options, port=0) as server:
+        server.review(PAYSTUB)
+        with urllib.request.urlopen(f"{server.url}/metrics", timeout=10) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            body = response.read().decode("utf-8")
+    assert "docreview_documents_total 1" in body
@@ -0,0 +1,131 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from docreview.core.template_loader import DocumentTemplate, TemplateField
+from docreview.utils.openai_client import RetryPolicy, create_response, create_responses
+from docreview.utils.openai_field_fill import openai_field_fill
+from docreview.utils.openai_stub import StubOpenAIServer
+
+FAST_RETRY = RetryPolicy(max_attempts=4, base_delay=0.0, max_delay=0.0, timeout=5.0)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={"retry-after": "0"})
+
+
+def _fake_openai(monkeypatch, failures: list[int]) -> dict[str, int]:
+    calls = {"create": 0, "clients": 0}
+
+    class FakeResponses:
+        @staticmethod
+        def create(**kwargs):
+            calls["create"] += 1
+            if failures:
+                raise _StatusError(failures.pop(0))
+            return SimpleNamespace(output_text="ok")
+
+    class FakeClient:
+        def __init__(self, api_key: str, **kwargs):
+            calls["clients"] += 1
+            self.responses = FakeResponses()
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeClient))
+    return calls
+
+
+def test_create_response_retries_rate_limits_and_reuses_client(monkeypatch) -> None:
+    calls = _fake_openai(monkeypatch, [429, 503])
+    first = create_response("test-key", policy=FAST_RETRY, model="m", input=[])
+    second = create_response("test-key", policy=FAST_RETRY, model="m", input=[])
+    assert first.output_text == second.output_text == "ok"
+    assert calls["create"] == 4
+    assert calls["clients"] == 1
+
+
+def test_create_response_does_not_retry_client_errors(monkeypatch) -> None:
+    calls = _fake_openai(monkeypatch, [400])
+    with pytest.raises(_StatusError):
+        create_response("test-key", policy=FAST_RETRY, model="m", input=[])
+    assert calls["create"] == 1
+
+
+def test_stub_server_retry_and_concurrent_throughput(monkeypatch) -> None:
+    pytest.importorskip("openai")
+    with StubOpenAIServer(latency=0.2, fail_first=1) as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        response = create_response("test-key", policy=FAST_RETRY, model="m", input=[])
+        assert "employee_name" in response.output_text
+        assert len(stub.requests) == 2
+
+        requests = [{"model": "m", "input": []} for _ in range(8)]
+        results = create_responses("test-key", requests, policy=FAST_RETRY, concurrency=8)
+    assert all(outcome.error is None for outcome in results)
+    assert stub.max_in_flight > 1
+
+
+def test_async_client_is_reused_across_calls(monkeypatch) -> None:
+    openai = pytest.importorskip("openai")
+    created: list[object] = []
+
+    class CountingAsyncOpenAI(openai.AsyncOpenAI):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(openai, "AsyncOpenAI", CountingAsyncOpenAI)
+    with StubOpenAIServer(latency=0.05) as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        for _ in range(2):
+            results = create_responses("test-key", [{"model": "m", "input": []}] * 4, policy=FAST_RETRY, concurrency=4)
+            assert all(outcome.error is None for outcome in results)
+    assert len(created) == 1
+    assert len(stub.requests) == 8 and stub.max_in_flight > 1
+
+
+def test_field_fill_against_stub_server(monkeypatch) -> None:
+    pytest.importorskip("openai")
+    template = DocumentTemplate(
+        doc_type="paystub",
+        display_name="Paystub",
+        version="1.0",
+        fields=[TemplateField(name="net_pay", type="number", required=True)],
+    )
+    with StubOpenAIServer() as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        items = openai_field_fill(text="net_pay: 12.50", template=template, api_key="test-key", model="m")
+    assert [(item.field_name, item.value) for item in items] == [("net_pay", "12.50")]
+
+
+def test_page_ocr_latency_tracks_slowest_page(monkeypatch) -> None:
+    pytest.importorskip("openai")
+    from docreview.utils.openai_extract import openai_vision_extract_pages
+
+    with StubOpenAIServer(latency=0.2) as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        results = openai_vision_extract_pages([b"p1", b"p2", b"p3", b"p4"], api_key="test-key", model="m")
+    assert [page.page_number for page, _ in results] == [1, 2, 3, 4]
+    assert all(page.ok and page.elapsed_ms >= 200 for page, _ in results)
+    assert stub.max_in_flight > 1
+
+
+def test_fork_reset_drops_clients_and_semaphore(monkeypatch) -> None:
+    import threading
+
+    import docreview.utils.openai_client as client_module
+
+    monkeypatch.setattr(client_module, "_CLIENTS", {("parent", "key", None): object()})
+    monkeypatch.setattr(client_module, "_SYNC_SEMAPHORE", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(client_module, "_CLIENTS_LOCK", threading.Lock())
+    monkeypatch.setattr(client_module, "_LOOP", None)
+    client_module._SYNC_SEMAPHORE.acquire()
+
+    client_module._reset_after_fork()
+
+    assert client_module._CLIENTS == {}
+    assert client_module._SYNC_SEMAPHORE is None
+    assert client_module._sync_semaphore().acquire(blocking=False)
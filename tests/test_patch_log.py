@@ -0,0 +1,100 @@
+from pathlib import Path
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from docreview.cli import app
+from docreview.core.patch import FieldUpdate, HandoffResolution, PatchPayload, apply_patches
+from docreview.core.schemas import DocumentReviewPackage
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.artifact_reader import ArtifactError
+from docreview.utils.patch_log import PatchLog
+from docreview.utils.serialization import dump_model_json
+
+runner = CliRunner()
+
+
+def _artifact(tmp_path: Path, template_dir: Path, created_at: str) -> Path:
+    source = tmp_path / "paystub.txt"
+    source.write_text("Paystub\nemployee_name: Jane Doe\nemployer_name: ACME\n", encoding="utf-8")
+    artifact = tmp_path / "paystub.json"
+    artifact.write_text(dump_model_json(run_pipeline(source, template_dir, created_at, fill_mode="regex")))
+    return artifact
+
+
+def test_log_replays_from_latest_snapshot(tmp_path: Path, template_dir: Path, created_at: str) -> None:
+    artifact = _artifact(tmp_path, template_dir, created_at)
+    base = artifact.read_bytes()
+    patches = [
+        PatchPayload(field_updates=[FieldUpdate(field_name="net_pay", value=index, confidence=0.9)])
+        for index in range(7)
+    ]
+    log = PatchLog(artifact, snapshot_every=3)
+    assert [log.append(patch, created_at) for patch in patches] == list(range(1, 8))
+
+    expected = apply_patches(DocumentReviewPackage.model_validate_json(base), patches, created_at)
+    assert artifact.read_bytes() == base
+    assert json.loads(log.snapshot_path.read_bytes().splitlines()[0])["entries"] == 6
+    assert log.materialize() == expected
+
+    with log.path.open("ab") as handle:
+        handle.write(b'{"created_at": "1970')
+    assert log.materialize() == expected
+    log.snapshot_path.unlink()
+    assert log.materialize() == expected
+
+    extra = PatchPayload(field_updates=[FieldUpdate(field_name="net_pay", value=7, confidence=0.9)])
+    assert PatchLog(artifact, snapshot_every=3).append(extra, created_at) == 8
+    assert log.path.read_bytes().count(b"\n") == 8
+    expected = apply_patches(expected, [extra], created_at)
+    assert log.materialize() == expected
+
+    log.path.write_bytes(log.path.read_bytes().replace(b'"net_pay"', b"null", 1))
+    with pytest.raises(ArtifactError, match="entry 1"):
+        log.materialize()
+
+
+def test_cli_patch_log_is_read_by_summarize_and_validate(tmp_path: Path, template_dir: Path, created_at: str) -> None:
+    artifact = _artifact(tmp_path, template_dir, created_at)
+    patch = tmp_path / "resolve.json"
+    patch.write_text(
+        PatchPayload(handoff_resolutions=[HandoffResolution(index=0, resolution="checked")]).model_dump_json(),
+        encoding="utf-8",
+    )
+    for _ in range(2):
+        result = runner.invoke(app, ["patch", "--input", str(artifact), "--patch", str(patch), "--log"])
+        assert result.exit_code == 0, result.output
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["paystub.json", "resolve.json"]
+
+    summary = runner.invoke(app, ["summarize", "--input", str(artifact), "--format", "json"])
+    payload = json.loads(summary.output)
+    assert payload["handoffs"][0]["resolution"] == "checked"
+    assert payload["open_handoffs"] == payload["total_handoffs"] - 1
+    assert runner.invoke(app, ["validate-json", "--input", str(artifact)]).output.strip() == "VALID"
+
+    log = PatchLog(artifact)
+    log.path.write_text(log.path.read_text(encoding="utf-8") + '{"patch": {}}\n', encoding="utf-8")
+    result = runner.invoke(app, ["validate-json", "--input", str(artifact)])
+    assert result.exit_code == 1 and "entry 3" in result.output
+
+
+def test_index_and_rerun_read_through_patch_log(tmp_path: Path, template_dir: Path, created_at: str) -> None:
+    artifact = _artifact(tmp_path, template_dir, created_at)
+    package = DocumentReviewPackage.model_validate_json(artifact.read_bytes())
+    resolutions = [HandoffResolution(index=index, resolution="checked") for index in range(len(package.handoffs))]
+    assert resolutions
+    PatchLog(artifact).append(PatchPayload(handoff_resolutions=resolutions), created_at)
+    db = tmp_path / "index.sqlite"
+
+    result = runner.invoke(app, ["index", "--input", str(tmp_path), "--db", str(db)])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(app, ["query", "--db", str(db), "--format", "json"])
+    assert json.loads(result.output)["open_handoffs"] == 0
+
+    result = runner.invoke(
+        app, ["run", "--from-artifact", str(artifact), "--from-stage", "validate", "--output", str(tmp_path / "rerun")]
+    )
+    assert result.exit_code in (0, 3), result.output
+    rerun = DocumentReviewPackage.model_validate_json(Path(result.stdout.strip().splitlines()[-1]).read_bytes())
+    assert [h.resolution for h in rerun.handoffs[: len(resolutions)]] == ["checked"] * len(resolutions)
@@ -0,0 +1,51 @@
+import subprocess
+from types import SimpleNamespace
+
+from docreview.utils import pdf_extract
+from docreview.utils.pdf_extract import PopplerBackend, get_pdf_backend
+
+
+def test_poppler_text_layer_pipes_bytes_through_stdin(monkeypatch) -> None:
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append((args, kwargs))
+        return SimpleNamespace(returncode=0, stdout=b"  Paystub\nnet_pay: 1  \n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    text = PopplerBackend().extract_text(b"%PDF-1.4 data")
+    assert text == "Paystub\nnet_pay: 1"
+    args, kwargs = calls[0]
+    assert args == ["pdftotext", "-layout", "-", "-"]
+    assert kwargs["input"] == b"%PDF-1.4 data"
+
+
+def test_poppler_text_layer_handles_failures(monkeypatch) -> None:
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: SimpleNamespace(returncode=1, stdout=b""))
+    assert PopplerBackend().extract_text(b"%PDF") is None
+
+    def missing(args, **kwargs):
+        raise FileNotFoundError(args[0])
+
+    monkeypatch.setattr(subprocess, "run", missing)
+    assert PopplerBackend().extract_text(b"%PDF") is None
+    assert PopplerBackend().render_pages(b"%PDF") == []
+
+
+def test_backend_selection_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv("DOCREVIEW_PDF_BACKEND", "poppler")
+    assert get_pdf_backend().name == "poppler"
+    monkeypatch.setenv("DOCREVIEW_PDF_BACKEND", "none")
+    assert pdf_extract.extract_text_layer(b"%PDF") is None
+    assert pdf_extract.pdf_to_images(b"%PDF") == []
+
+
+def test_poppler_needs_pdftoppm_for_auto_selection(monkeypatch) -> None:
+    monkeypatch.setattr(pdf_extract.shutil, "which", lambda tool: "/usr/bin/pdftotext" if tool == "pdftotext" else None)
+    monkeypatch.setattr(pdf_extract.PdfiumBackend, "available", staticmethod(lambda: False))
+    pdf_extract.select_pdf_backend.cache_clear()
+    try:
+        assert not PopplerBackend.available()
+        assert pdf_extract.select_pdf_backend("auto").name == "none"
+    finally:
+        pdf_extract.select_pdf_backend.cache_clear()
@@ -0,0 +1,115 @@
+from pathlib import Path
+import zlib
+
+from docreview.utils.pdf_structure import estimate_page_count, pdf_page_count, pdf_page_count_path
+
+
+def _classic_pdf(page_count: int) -> bytes:
+    kids = " ".join(f"{3 + i} 0 R" for i in range(page_count))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode(),
+    ] + [b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"] * page_count
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def _append_update(base: bytes, page_count: int) -> bytes:
+    """Incremental update that rewrites the page tree root with a new /Count."""
+    prev = int(base.rsplit(b"startxref", 1)[1].split()[0])
+    out = bytearray(base)
+    offset = len(out)
+    out += f"2 0 obj\n<< /Type /Pages /Kids [] /Count {page_count} >>\nendobj\n".encode()
+    xref_at = len(out)
+    out += f"xref\n2 1\n{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size 3 /Root 1 0 R /Prev {prev} >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def _png_up_rows(rows: list[bytes]) -> bytes:
+    previous = bytes(len(rows[0]))
+    encoded = bytearray()
+    for row in rows:
+        encoded += b"\x02" + bytes((a - b) & 0xFF for a, b in zip(row, previous))
+        previous = row
+    return bytes(encoded)
+
+
+def _xref_stream_pdf(page_count: int) -> bytes:
+    """Catalog and page tree live in a compressed object stream."""
+    kids = " ".join(f"{5 + i} 0 R" for i in range(page_count))
+    packed = [
+        (1, b"<< /Type /Catalog /Pages 2 0 R >>"),
+        (2, f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode()),
+    ]
+    body = b""
+    header_parts = []
+    for number, obj in packed:
+        header_parts.append(f"{number} {len(body)}")
+        body += obj + b" "
+    header = (" ".join(header_parts) + " ").encode()
+    objstm = zlib.compress(header + body)
+
+    out = bytearray(b"%PDF-1.5\n")
+    offsets: dict[int, int] = {}
+    offsets[3] = len(out)
+    out += (
+        f"3 0 obj\n<< /Type /ObjStm /N {len(packed)} /First {len(header)} "
+        f"/Filter /FlateDecode /Length {len(objstm)} >>\nstream\n"
+    ).encode() + objstm + b"\nendstream\nendobj\n"
+    for i in range(page_count):
+        offsets[5 + i] = len(out)
+        out += f"{5 + i} 0 obj\n<< /Type /Page /Parent 2 0 R >>\nendobj\n".encode()
+
+    size = 5 + page_count
+    offsets[4] = len(out)
+    rows = []
+    for number in range(size):
+        if number in (1, 2):
+            rows.append(bytes([2]) + (3).to_bytes(2, "big") + bytes([number - 1]))
+        elif number in offsets:
+            rows.append(bytes([1]) + offsets[number].to_bytes(2, "big") + b"\x00")
+        else:
+            rows.append(b"\x00\x00\x00\x00")
+    xref_data = zlib.compress(_png_up_rows(rows))
+    out += (
+        f"4 0 obj\n<< /Type /XRef /Size {size} /W [1 2 1] /Root 1 0 R "
+        f"/Filter /FlateDecode /DecodeParms << /Predictor 12 /Columns 4 >> /Length {len(xref_data)} >>\nstream\n"
+    ).encode() + xref_data + b"\nendstream\nendobj\n"
+    out += f"startxref\n{offsets[4]}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def test_classic_xref_page_count_ignores_pages_node() -> None:
+    assert pdf_page_count(_classic_pdf(3)) == 3
+
+
+def test_incremental_update_uses_newest_page_tree() -> None:
+    assert pdf_page_count(_append_update(_classic_pdf(3), 40)) == 40
+
+
+def test_xref_stream_with_object_stream() -> None:
+    assert pdf_page_count(_xref_stream_pdf(4)) == 4
+
+
+def test_page_count_from_mapped_file(tmp_path: Path) -> None:
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(_classic_pdf(2))
+    assert pdf_page_count_path(path) == 2
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    assert pdf_page_count_path(empty) is None
+
+
+def test_unstructured_bytes_fall_back_to_page_markers() -> None:
+    assert pdf_page_count(b"%PDF-1.4 /Type /Page /Type /Pages") is None
+    assert estimate_page_count(b"%PDF-1.4 /Type /Page /Type /Pages /Type/Page") == 2
+    assert estimate_page_count(b"%PDF-1.4 fake") is None
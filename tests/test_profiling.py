@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pstats
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from docreview.cli import app
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.serialization import dump_model_json
+
+PAYSTUB = Path(__file__).parent / "fixtures" / "paystub_sample.txt"
+STAGES = ("ingest", "extract", "classify", "normalize", "validate", "render", "pipeline")
+
+runner = CliRunner()
+
+
+def test_profile_command_runs_offline_with_stub(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("openai")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    args = ["profile", "--input", str(PAYSTUB), "--output", str(tmp_path), "--fill-mode", "llm", "--top", "5"]
+    result = runner.invoke(app, [*args, "--stub-openai"])
+    assert result.exit_code == 0, result.output
+    assert "Top 5 functions by cumulative time" in result.output
+    assert "allocation sites per stage" in result.output
+    normalize_row = next(line.split() for line in result.output.splitlines() if line.strip().startswith("normalize "))
+    assert float(normalize_row[4]) > 0  # api seconds: the stubbed field fill call
+
+    stats = pstats.Stats(str(tmp_path / "paystub_sample.pstats"))
+    assert any(name == "_run_document" for _, _, name in stats.stats)
+    for line in (tmp_path / "paystub_sample.collapsed").read_text(encoding="utf-8").splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.split(";")[0] in STAGES and int(count) > 0
+
+
+def test_profile_env_hook_leaves_artifact_unchanged(
+    tmp_path: Path, template_dir: Path, created_at: str, monkeypatch
+) -> None:
+    plain = run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex")
+    monkeypatch.setenv("DOCREVIEW_PROFILE", str(tmp_path / "profile"))
+    profiled = run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex")
+    assert dump_model_json(profiled) == dump_model_json(plain)
+    names = sorted(path.name for path in (tmp_path / "profile").iterdir())
+    run_id = names[0].split(".")[1]
+    assert names == [
+        f"paystub_sample.{run_id}.collapsed",
+        f"paystub_sample.{run_id}.profile.txt",
+        f"paystub_sample.{run_id}.pstats",
+    ]
+
+
+def test_profile_env_hook_tolerates_concurrent_runs(
+    tmp_path: Path, template_dir: Path, created_at: str, monkeypatch
+) -> None:
+    switchinterval = sys.getswitchinterval()
+    monkeypatch.setenv("DOCREVIEW_PROFILE", str(tmp_path / "profile"))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        packages = list(
+            pool.map(lambda _: run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex"), range(8))
+        )
+    assert len({dump_model_json(package) for package in packages}) == 1
+    reports = list((tmp_path / "profile").glob("*.profile.txt"))
+    assert 1 <= len(reports) <= 8
+    assert switchinterval == sys.getswitchinterval()
@@ -121,3 +121,13 @@ def test_append_only_field_history() -> None:
     assert len(initial["employee_name"]) == 1
     assert len(updated["employee_name"]) == 2
     assert updated["employee_name"][0].value == "Jane Doe"
+
+
+def test_unset_optional_fields_are_omitted_but_stay_in_schema() -> None:
+    section = ExtractSection(ok=True, text="preview", used_ocr_stub=False)
+    assert {"pages", "text_ref", "text_bytes", "image_refs"}.isdisjoint(section.model_dump())
+    ref = "sha256:" + "0" * 64
+    blob = section.model_copy(update={"text_ref": ref, "text_bytes": 7, "image_refs": [ref]})
+    assert blob.model_dump()["image_refs"] == [ref]
+    assert {"pages", "text_ref", "text_bytes", "image_refs"} <= set(ExtractSection.model_json_schema()["properties"])
+    assert "metrics" in DocumentReviewPackage.model_json_schema()["properties"]
@@ -0,0 +1,37 @@
+from pathlib import Path
+import json
+
+import pytest
+
+import docreview.utils.serialization as serialization
+from docreview.core.schemas import DocumentReviewPackage
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.serialization import dump_model_json, dump_model_json_line, encode_model_json
+
+
+@pytest.fixture()
+def package(tmp_path: Path, template_dir, created_at) -> DocumentReviewPackage:
+    source = tmp_path / "paystub.txt"
+    source.write_text("Paystub\nemployee_name: Zoë Ångström\nnet_pay: 10\n" + "texte long é\n" * 50, encoding="utf-8")
+    return run_pipeline(source, template_dir, created_at, fill_mode="regex")
+
+
+def test_canonical_output_is_unchanged(package: DocumentReviewPackage) -> None:
+    expected = json.dumps(package.model_dump(mode="json", by_alias=True), sort_keys=True, indent=2, ensure_ascii=True)
+    assert dump_model_json(package) == expected
+    assert encode_model_json(package) == expected.encode("ascii")
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_fast_styles_round_trip_in_schema_order(package: DocumentReviewPackage, monkeypatch, native: bool) -> None:
+    if not native:
+        monkeypatch.setattr(serialization, "orjson", None)
+    data = package.model_dump(mode="json", by_alias=True)
+    pretty = encode_model_json(package, "pretty")
+    compact = dump_model_json_line(package)
+    assert json.loads(pretty) == data == json.loads(compact)
+    assert "\n" not in compact
+    assert "Zoë" in compact
+    properties = DocumentReviewPackage.model_json_schema(by_alias=True)["properties"]
+    assert list(json.loads(compact)) == [name for name in properties if name != "metrics"]
+    assert DocumentReviewPackage.model_validate_json(pretty) == package
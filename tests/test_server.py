@@ -0,0 +1,106 @@
+from pathlib import Path
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import docreview.server as server_module
+from docreview.batch import BatchOptions
+from docreview.server import ReviewServer
+from docreview.stages.pipeline import run_pipeline
+from docreview.utils.serialization import dump_model_json
+
+PAYSTUB = Path(__file__).parent / "fixtures" / "paystub_sample.txt"
+
+
+def _post(url: str, body: bytes, content_type: str) -> tuple[int, bytes, dict[str, str]]:
+    request = urllib.request.Request(url, data=body, method="POST", headers={"Content-Type": content_type})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.read(), dict(response.headers)
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read(), dict(exc.headers)
+
+
+def test_serve_path_and_upload_match_cli_artifact(template_dir, created_at, monkeypatch) -> None:
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="regex")
+    expected = dump_model_json(
+        run_pipeline(PAYSTUB, template_dir, created_at, fill_mode="regex")
+    ).encode("utf-8")
+
+    with ReviewServer(options, port=0, allow_paths=True) as server:
+        server.warm()
+        status, body, headers = _post(
+            f"{server.url}/v1/review", json.dumps({"path": str(PAYSTUB)}).encode(), "application/json"
+        )
+        assert status == 200
+        assert body == expected
+        assert "X-Docreview-Blocking-Handoffs" in headers
+
+        status, body, _ = _post(
+            f"{server.url}/v1/review?filename=paystub.txt", PAYSTUB.read_bytes(), "application/octet-stream"
+        )
+        assert status == 200
+        package = json.loads(body)
+        assert package["metadata"]["file_name"] == "paystub.txt"
+        assert package["metadata"]["source_path"] == "paystub.txt"
+        assert package["classify"]["document_type"] == "paystub"
+
+        status, body, _ = _post(f"{server.url}/v1/review", b'{"path": "/missing.txt"}', "application/json")
+        assert status == 404
+
+        with urllib.request.urlopen(f"{server.url}/healthz", timeout=10) as response:
+            health = json.loads(response.read())
+        assert health["status"] == "ok"
+        assert health["completed"] == 2
+
+
+def test_serve_rejects_when_queue_is_full(template_dir, created_at, monkeypatch) -> None:
+    release = threading.Event()
+    entered = threading.Event()
+
+    def slow_pipeline(**kwargs):
+        entered.set()
+        release.wait(10)
+        return run_pipeline(**kwargs)
+
+    monkeypatch.setattr(server_module, "run_pipeline", slow_pipeline)
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="regex")
+    body = json.dumps({"path": str(PAYSTUB)}).encode()
+
+    spooled: list[str] = []
+    temporary_directory = server_module.tempfile.TemporaryDirectory
+
+    def recording_temporary_directory(*args, **kwargs):
+        spooled.append(kwargs.get("prefix", ""))
+        return temporary_directory(*args, **kwargs)
+
+    monkeypatch.setattr(server_module.tempfile, "TemporaryDirectory", recording_temporary_directory)
+
+    with ReviewServer(options, port=0, concurrency=1, queue_size=0, allow_paths=True) as server:
+        results: list[int] = []
+        first = threading.Thread(
+            target=lambda: results.append(_post(f"{server.url}/v1/review", body, "application/json")[0])
+        )
+        first.start()
+        assert entered.wait(10)
+        status, _, headers = _post(f"{server.url}/v1/review", body, "application/json")
+        assert status == 503
+        assert headers["Retry-After"] == "1"
+        status, _, _ = _post(
+            f"{server.url}/v1/review?filename=paystub.txt", PAYSTUB.read_bytes(), "application/octet-stream"
+        )
+        assert status == 503
+        assert spooled == []
+        release.set()
+        first.join(10)
+        assert results == [200]
+        assert server.health()["rejected"] == 2
+
+
+def test_serve_refuses_path_requests_by_default(template_dir, created_at) -> None:
+    options = BatchOptions(template_dir=str(template_dir), created_at=created_at, fill_mode="regex")
+    with ReviewServer(options, port=0) as server:
+        status, _, _ = _post(f"{server.url}/v1/review", json.dumps({"path": str(PAYSTUB)}).encode(), "application/json")
+    assert status == 403
@@ -3,7 +3,7 @@ from pathlib import Path
 from docreview.core.template_loader import get_template, load_templates
 from docreview.stages.classify import classify
 from docreview.stages.extract import extract
-from docreview.stages.ingest import ingest
+from docreview.stages.ingest import ingest, ingest_document
 from docreview.stages.normalize import normalize
 from docreview.stages.pipeline import run_pipeline
 from docreview.stages.validate import validate
@@ -71,3 +71,197 @@ def test_extract_pdf_page_limit_handoff(created_at) -> None:
     assert handoffs
     assert handoffs[0].reason.value == "page_limit_exceeded"
     assert handoffs[0].blocking is True
+
+
+def test_extract_pdf_page_mode_stitches_pages_and_flags_failures(created_at, monkeypatch) -> None:
+    import docreview.stages.extract as extract_module
+    from docreview.core.schemas import PageExtract
+
+    def fake_pages(images, api_key, model):
+        return [
+            (PageExtract(page_number=i, ok=i != 2, model=model, elapsed_ms=1.0), f"text {i}" if i != 2 else "")
+            for i in range(1, len(images) + 1)
+        ]
+
+    monkeypatch.setattr(extract_module, "extract_text_layer", lambda data: None)
+    monkeypatch.setattr(extract_module, "pdf_to_images", lambda data: [b"p1", b"p2", b"p3"])
+    monkeypatch.setattr(extract_module, "openai_vision_extract_pages", fake_pages)
+
+    section, handoffs = extract(b"%PDF-1.4 scanned", ".pdf", created_at, api_key="test-key")
+    assert section.method == "openai_vision_pages"
+    assert section.text.index("--- page 1 ---") < section.text.index("--- page 3 ---")
+    assert "[OCR_FAILED: page 2]" in section.text
+    assert [page.ok for page in section.pages] == [True, False, True]
+    assert handoffs[0].reason.value == "ocr_required"
+    assert handoffs[0].blocking is False
+
+
+def test_ingest_document_streams_hash_and_accepts_text(tmp_path, created_at) -> None:
+    fixture = Path(__file__).parent / "fixtures" / "paystub_sample.txt"
+    section, handoffs, page_count = ingest_document(fixture, created_at)
+    assert section.ok
+    assert section.file_hash == ingest(fixture)[0].file_hash
+    assert handoffs == []
+    assert page_count is None
+
+
+def test_ingest_document_preflight_rejections(tmp_path, created_at) -> None:
+    fake_png = tmp_path / "scan.png"
+    fake_png.write_bytes(b"%PDF-1.4 not an image")
+    section, handoffs, _ = ingest_document(fake_png, created_at)
+    assert section.ok is False
+    assert handoffs[0].reason.value == "unreadable_input"
+
+    large = tmp_path / "large.txt"
+    large.write_bytes(b"x" * 2048)
+    _, handoffs, _ = ingest_document(large, created_at, max_bytes=1024)
+    assert handoffs[0].reason.value == "unreadable_input"
+    assert handoffs[0].blocking is True
+
+    pdf = tmp_path / "long.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " + (b"/Type /Page " * 30))
+    section, handoffs, page_count = ingest_document(pdf, created_at)
+    assert page_count == 30
+    assert handoffs[0].reason.value == "page_limit_exceeded"
+    assert handoffs[0].stage.value == "ingest"
+
+
+def test_pipeline_skips_extract_for_rejected_input(tmp_path, template_dir, created_at, monkeypatch) -> None:
+    import docreview.stages.pipeline as pipeline_module
+
+    def fail_extract(**kwargs):
+        raise AssertionError("extract should not run for rejected input")
+
+    monkeypatch.setattr(pipeline_module, "extract", fail_extract)
+    pdf = tmp_path / "long.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " + (b"/Type /Page " * 30))
+    package = run_pipeline(pdf, template_dir=template_dir, created_at=created_at)
+    assert package.ingest.ok is False
+    assert package.extract.ok is False
+    assert package.extract.page_count == 30
+    assert any(h.reason.value == "page_limit_exceeded" and h.blocking for h in package.handoffs)
+
+
+def test_keyword_matcher_matches_naive_scores(template_dir) -> None:
+    from docreview.stages.classify import _build_keyword_map, keyword_matcher
+
+    templates = load_templates(template_dir)
+    keyword_map = _build_keyword_map(templates)
+    matcher = keyword_matcher(templates)
+    assert keyword_matcher(templates) is matcher
+    for text in [
+        Path(__file__).parent.joinpath("fixtures", "paystub_sample.txt").read_text(encoding="utf-8"),
+        "BANK STATEMENT\nAccount Number: 12\nOpening Balance: 3\nGross Pay net",
+        "employee name and net pay but not the rest",
+        "",
+    ]:
+        lower = text.lower()
+        naive = {
+            doc_type: sum(1 for keyword in keywords if keyword in lower) / max(len(keywords), 1)
+            for doc_type, keywords in keyword_map.items()
+        }
+        assert matcher.scores(text) == naive
+
+
+def test_normalize_regex_first_match_and_synonym_confidence(template_dir, created_at) -> None:
+    from docreview.stages.normalize import field_extractor
+
+    template = get_template(load_templates(template_dir), "paystub")
+    text = "\r\n".join(
+        [
+            "Pay summary",
+            "EMPLOYEE: Jane Doe",
+            "Company_Name = ACME Corp",
+            "employee_name: John Roe",
+            "Net - 100.00",
+            "net_pay: 2450.25",
+        ]
+    )
+    section = normalize(text, template, created_at)
+    values = {name: (items[0].value, items[0].confidence) for name, items in section.fields.items()}
+    assert values == {
+        "employee_name": ("Jane Doe", 0.75),
+        "employer_name": ("ACME Corp", 0.75),
+        "net_pay": ("100.00", 0.75),
+    }
+    assert list(section.fields) == [field.name for field in template.fields]
+    assert field_extractor(template) is field_extractor(template)
+    assert normalize("no labelled fields here", template, created_at).fields == {}
+
+
+def test_rerun_from_normalize_reuses_extract_and_keeps_review_state(
+    tmp_path, template_dir, created_at, monkeypatch
+) -> None:
+    import docreview.stages.pipeline as pipeline_module
+    from docreview.core.patch import FieldUpdate, HandoffResolution, PatchPayload, apply_patch
+
+    source = tmp_path / "paystub.txt"
+    source.write_text("Paystub\nGross Pay 10\nemployee_name: Jane Doe\nemployer_name: ACME", encoding="utf-8")
+    package = run_pipeline(source, template_dir, created_at, fill_mode="regex")
+    missing_index = next(i for i, h in enumerate(package.handoffs) if h.field_name == "net_pay")
+    patched = apply_patch(
+        package,
+        PatchPayload(
+            field_updates=[FieldUpdate(field_name="employee_name", value="Jane Q. Doe", confidence=1.0)],
+            handoff_resolutions=[HandoffResolution(index=missing_index, resolution="confirmed by phone")],
+        ),
+        created_at,
+    )
+
+    def no_extract(**kwargs):
+        raise AssertionError("extract must not run on rerun")
+
+    monkeypatch.setattr(pipeline_module, "extract", no_extract)
+    templates = load_templates(template_dir)
+    rerun = run_pipeline(
+        source, template_dir, created_at, fill_mode="regex", templates=templates, artifact=patched, from_stage="normalize"
+    )
+
+    assert rerun.extract == patched.extract
+    assert rerun.classify == patched.classify
+    assert [p.source for p in rerun.normalize.fields["employee_name"]] == ["extract_text", "agent_review"]
+    net_pay = next(h for h in rerun.handoffs if h.field_name == "net_pay")
+    assert net_pay.resolved and net_pay.resolution == "confirmed by phone"
+    assert rerun.audit[: len(patched.audit)] == patched.audit
+    assert [a.event for a in rerun.audit[len(patched.audit) :]][0] == "rerun"
+
+    relaxed = {key: template.model_copy(deep=True) for key, template in templates.items()}
+    for field in relaxed["paystub"].fields:
+        field.required = False
+    revalidated = pipeline_module.rerun_pipeline(package, "validate", template_dir, created_at, templates=relaxed)
+    assert revalidated.normalize == package.normalize
+    assert revalidated.validate_section.ok
+    assert not [h for h in revalidated.handoffs if h.stage.value == "validate"]
+
+
+def test_apply_patches_shares_untouched_sections(tmp_path, template_dir, created_at) -> None:
+    from docreview.core.patch import FieldUpdate, HandoffResolution, PatchPayload, apply_patch, apply_patches
+
+    source = tmp_path / "paystub.txt"
+    source.write_text("Paystub\nGross Pay 10\nemployee_name: Jane Doe\nemployer_name: ACME", encoding="utf-8")
+    package = run_pipeline(source, template_dir, created_at, fill_mode="regex")
+    before = package.model_copy(deep=True)
+    patches = [
+        PatchPayload(
+            field_updates=[
+                FieldUpdate(field_name="employee_name", value=f"Jane {index}", confidence=0.9),
+                FieldUpdate(field_name="net_pay", value=index, confidence=0.8),
+            ],
+            handoff_resolutions=[HandoffResolution(index=0, resolution=f"checked {index}")],
+        )
+        for index in range(3)
+    ]
+
+    patched = apply_patches(package, patches, created_at)
+    sequential = package
+    for patch in patches:
+        sequential = apply_patch(sequential, patch, created_at)
+
+    assert patched == sequential
+    assert package == before
+    assert patched.extract is package.extract
+    assert patched.normalize.fields["employer_name"] is package.normalize.fields["employer_name"]
+    assert [p.value for p in patched.normalize.fields["employee_name"]] == ["Jane Doe", "Jane 0", "Jane 1", "Jane 2"]
+    assert patched.handoffs[0].resolution == "checked 2"
+    assert patched.handoffs[1:] == package.handoffs[1:]
+    assert len(patched.audit) == len(package.audit) + 9
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from docreview.core.template_loader import get_registry, get_template
+from docreview.stages.normalize import normalize_regex_stream
+from docreview.stages.pipeline import rerun_pipeline, run_pipeline
+from docreview.utils.blob_store import BlobStore
+from docreview.utils.serialization import dump_model_json
+from docreview.utils.text_stream import PREVIEW_CHARS, iter_text_chunks
+
+
+def _statement(rows: int) -> str:
+    lines = ["Bank Statement", "Account Number: 000123", "Opening Balance: 1500.00"]
+    lines += [f"2024-01-{row % 28 + 1:02d},Coffee shop café,-{row % 97}.50\r" for row in range(rows)]
+    lines += ["account_holder_name: Mei Chen", "statement_period: 2024-01"]
+    return "\n".join(lines) + "\n"
+
+
+def test_text_chunks_end_on_line_breaks_and_rejoin_exactly() -> None:
+    data = ("café €\r\n" * 50).encode("utf-8") + b"bad \xff byte\r\nlast"
+    chunks = list(iter_text_chunks(data, chunk_bytes=7))
+    assert "".join(chunks) == str(data, "utf-8", errors="replace")
+    assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+
+
+def test_regex_stream_stops_once_all_fields_are_found(template_dir: Path, created_at: str) -> None:
+    template = get_template(get_registry(template_dir).templates(), "paystub")
+    pulled = []
+
+    def chunks():
+        yield "Paystub\n" + "".join(f"{field.name}: value\n" for field in template.fields)
+        for index in range(100):
+            pulled.append(index)
+            yield "filler line\n"
+
+    section = normalize_regex_stream(chunks(), template=template, created_at=created_at)
+    assert set(section.fields) == {field.name for field in template.fields}
+    assert pulled == []
+
+
+def test_large_text_is_streamed_with_blob_reference(tmp_path: Path, template_dir: Path, created_at: str, monkeypatch) -> None:
+    text = _statement(4000)
+    source = tmp_path / "statement.csv"
+    source.write_text(text, encoding="utf-8", newline="")
+    inline = run_pipeline(source, template_dir, created_at, fill_mode="regex")
+
+    monkeypatch.setenv("DOCREVIEW_STREAM_THRESHOLD_BYTES", "4096")
+    blobs = BlobStore(tmp_path / "blobs")
+    streamed = run_pipeline(source, template_dir, created_at, fill_mode="llm", blobs=blobs)
+
+    assert streamed.classify == inline.classify
+    assert streamed.normalize == inline.normalize
+    assert streamed.extract.method == "text_stream"
+    assert streamed.extract.text == inline.extract.text[:PREVIEW_CHARS]
+    assert blobs.read_bytes(streamed.extract.text_ref).decode("utf-8") == inline.extract.text
+    assert streamed.extract.text_bytes == len(text.encode("utf-8"))
+    assert any(a.event == "streamed" for a in streamed.audit)
+    assert any("not applied to streamed text" in a.detail for a in streamed.audit)
+    assert '"text_ref"' not in dump_model_json(inline)
+
+    rerun = rerun_pipeline(streamed, "classify", template_dir, created_at, blobs=blobs)
+    assert rerun.normalize == streamed.normalize
+    with pytest.raises(ValueError, match="blob store"):
+        rerun_pipeline(streamed, "normalize", template_dir, created_at)
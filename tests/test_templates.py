@@ -1,4 +1,7 @@
-from docreview.core.template_loader import get_template, load_templates
+import os
+import shutil
+
+from docreview.core.template_loader import TemplateRegistry, get_registry, get_template, load_templates
 from docreview.utils.md_generator import template_to_markdown
 
 
@@ -32,3 +35,28 @@ def test_markdown_generation(template_dir) -> None:
     md = template_to_markdown(templates["paystub"])
     assert "# Paystub" in md
     assert "employee_name" in md
+
+
+def test_registry_matches_loader_and_reloads_changed_files(template_dir, tmp_path) -> None:
+    for path in template_dir.glob("*.json"):
+        shutil.copy(path, tmp_path / path.name)
+    registry = TemplateRegistry(tmp_path)
+    first = registry.templates()
+    assert list(first) == list(load_templates(tmp_path))
+    assert registry.templates() is first
+    loads = registry.loads
+
+    paystub = tmp_path / "paystub.json"
+    os.utime(paystub, ns=(1, 1))
+    assert registry.templates() is first
+    assert registry.loads == loads
+
+    paystub.write_text(paystub.read_text(encoding="utf-8").replace('"Paystub"', '"Pay Stub"'), encoding="utf-8")
+    second = registry.templates()
+    assert registry.loads == loads + 1
+    assert second["paystub"].display_name == "Pay Stub"
+    assert second["t4"] is first["t4"]
+
+    (tmp_path / "t4.json").unlink()
+    assert "t4" not in registry.templates()
+    assert get_registry(template_dir) is get_registry(template_dir / ".." / template_dir.name)